@@ -3,6 +3,7 @@
 from pathlib import Path
 
 from physicslab.data_utils import load_csv
+from physicslab.logs import configure_logging
 from physicslab.plot_utils import setup_plot_style
 from physicslab.e_beam_deflection_analysis.processing import (
     plot_D_Y_vs_V_d,
@@ -27,6 +28,7 @@ OUTPUT_DIR = PROJECT_ROOT / "output/e_beam_deflection_analysis/"
 def main() -> None:
     print("Starting the E-Beam Deflection Analysis data processing workflow...")
 
+    configure_logging()
     setup_plot_style()
 
     print(
@@ -49,8 +51,9 @@ def main() -> None:
     print(
         f"\n--> Step 3: Calculating e/m ratios from '{EM_RATIO_MAG_FOCUS_CSV.name}'..."
     )
-    ratio_dict = count_mass_to_charge_ratio(em_ratio_raw_df)
-    print("Calculated e/m ratios:", ratio_dict)
+    ratio_df = count_mass_to_charge_ratio(em_ratio_raw_df)
+    print("Calculated e/m ratios:")
+    print(ratio_df.to_string(index=False))
 
     print(
         "\nE-Beam Deflection Analysis data processing workflow completed successfully!"
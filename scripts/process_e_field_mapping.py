@@ -2,6 +2,7 @@
 
 from pathlib import Path
 from physicslab.data_utils import load_csv
+from physicslab.logs import configure_logging
 from physicslab.plot_utils import setup_plot_style
 from physicslab.e_field_mapping.processing import (
     analyze_e_field_data,
@@ -21,6 +22,7 @@ OUTPUT_DIR = PROJECT_ROOT / "output/e_field_mapping/"
 def main() -> None:
     print("Starting the E-Field Mapping data processing workflow...")
 
+    configure_logging()
     setup_plot_style()
 
     print(
@@ -2,6 +2,7 @@
 
 from pathlib import Path
 from physicslab.data_utils import load_csv
+from physicslab.logs import configure_logging
 from physicslab.plot_utils import setup_plot_style
 from physicslab.sucrose_polarimetry.processing import (
     analyze_average_angle_deg,
@@ -20,6 +21,7 @@ OUTPUT_DIR = PROJECT_ROOT / "output/sucrose_polarimetry/"
 def main() -> None:
     print("Starting the Sucrose Polarimetry data processing workflow...")
 
+    configure_logging()
     setup_plot_style()
 
     print(
@@ -7,6 +7,7 @@ from physicslab.data_utils import (
     check_missing_data,
     save_processed_data,
 )
+from physicslab.logs import configure_logging
 from physicslab.plot_utils import setup_plot_style
 from physicslab.thermal_resistor.processing import (
     analyze_thermal_data,
@@ -24,6 +25,7 @@ OUTPUT_DIR = PROJECT_ROOT / "output/thermal_resistor/"
 def main() -> None:
     print("Starting the Thermal Resistor data processing workflow...")
 
+    configure_logging()
     setup_plot_style()
 
     print(f"\n--> Step 1: Loading and validating raw data from '{INPUT_CSV.name}'...")
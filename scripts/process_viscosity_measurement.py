@@ -0,0 +1,66 @@
+# scripts/process_viscosity_measurement.py
+
+from pathlib import Path
+from physicslab.data_utils import load_csv, save_processed_data
+from physicslab.logs import configure_logging
+from physicslab.plot_utils import setup_plot_style
+from physicslab.viscosity_measurement.processing import (
+    analyze_viscosity_data,
+    fill_measurement_table,
+    plot_t_vs_inv_D,
+    solve_viscosity,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+RAW_DIR = PROJECT_ROOT / "data/raw/viscosity_measurement"
+PROCESSED_DIR = PROJECT_ROOT / "data/processed/viscosity_measurement"
+OUTPUT_DIR = PROJECT_ROOT / "output/viscosity_measurement/"
+
+SHEETS = {
+    "tube": "test_tube_diameters.csv",
+    "ball": "steel_ball_diameters.csv",
+    "fall_time": "steel_ball_fall_time.csv",
+    "distance": "timer_distance.csv",
+}
+
+
+def main() -> None:
+    print("Starting the Viscosity Measurement data processing workflow...")
+
+    configure_logging()
+    setup_plot_style()
+
+    print(f"\n--> Step 1: Loading raw data from '{RAW_DIR}'...")
+    sheets = {name: load_csv(RAW_DIR / filename) for name, filename in SHEETS.items()}
+    for name, df in sheets.items():
+        if df.empty:
+            print(f"Error: No valid data found in '{SHEETS[name]}'.")
+            return
+
+    print("\n--> Step 2: Filling in the means and deviations of every sheet...")
+    PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
+    for name, df in sheets.items():
+        table = fill_measurement_table(df)
+        table.to_csv(PROCESSED_DIR / SHEETS[name], index=False, encoding="utf-8-sig")
+    print(f"Measurement tables saved to '{PROCESSED_DIR}'.")
+
+    print("\n--> Step 3: Computing the viscosity...")
+    processed_df = analyze_viscosity_data(
+        **{f"{name}_df": df for name, df in sheets.items()}
+    )
+    print(processed_df.to_string(index=False))
+    save_processed_data(processed_df, PROCESSED_DIR / "processed_data.csv")
+
+    print("\n--> Step 4: Extrapolating the fall time to an infinitely wide tube...")
+    viscosity_df = solve_viscosity(processed_df)
+    print(viscosity_df.to_string(index=False))
+    save_processed_data(viscosity_df, PROCESSED_DIR / "viscosity.csv")
+
+    print("\n--> Step 5: Plotting and saving figures...")
+    plot_t_vs_inv_D(processed_df, OUTPUT_DIR)
+
+    print("\nViscosity Measurement data processing workflow completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
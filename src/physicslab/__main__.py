@@ -0,0 +1,5 @@
+# src/physicslab/__main__.py
+
+from physicslab.cli import main
+
+raise SystemExit(main())
@@ -0,0 +1,419 @@
+# src/physicslab/benchmark.py
+
+# Benchmarks of the loaders, analysis steps, fits and plots of every
+# registered experiment on synthetic data of increasing size.
+#
+# For every size the datasets are generated with physicslab.synthetic into a
+# scratch root and each stage of the experiment's declared workflow is timed
+# on them. Fits are timed through the plot's series builder (e.g.
+# ln_R_T_vs_1_T_series for plot_ln_R_T_vs_1_T), which is where the fits of
+# a plot are computed; the fitting primitives are also timed on their own.
+# Plots are rendered into memory, so disk speed does not enter the figures.
+#
+# Run `python -m physicslab.benchmark --help`. Results are written as JSON
+# together with the library versions and machine they were measured on;
+# `--baseline` compares against an earlier result file and exits non-zero
+# on regressions.
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from physicslab.registry import EXPERIMENTS, get_experiment, load_input
+from physicslab.synthetic import GENERATORS, write_dataset, write_submissions
+
+DEFAULT_SIZES = (100, 1_000, 10_000, 100_000)
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Timing of one case at one size.
+
+    Attributes:
+    - experiment (str): The experiment, or "fitting" for the primitives.
+    - case (str): What was timed, e.g. "load raw" or "plot_N_vs_T".
+    - kind (str): "load", "analyze", "fit" or "plot".
+    - rows (int): Dataset size passed to the generator.
+    - submissions (int): Number of submissions processed per call.
+    - repeats (int): Number of timed calls.
+    - best_s (float): Fastest call in seconds.
+    - median_s (float): Median call in seconds.
+    - data_rows (Optional[int]): Rows of the data the case worked on.
+    """
+
+    experiment: str
+    case: str
+    kind: str
+    rows: int
+    submissions: int
+    repeats: int
+    best_s: float
+    median_s: float
+    data_rows: Optional[int] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.experiment}|{self.case}|{self.rows}|{self.submissions}"
+
+
+def _time(call: Callable[[], Any], repeats: int) -> List[float]:
+    samples = []
+    # Keep the per-call progress messages of loaders and plots out of the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeats):
+            start = time.perf_counter()
+            call()
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _result(
+    experiment: str,
+    case: str,
+    kind: str,
+    rows: int,
+    submissions: int,
+    samples: List[float],
+    data: Any = None,
+) -> BenchmarkResult:
+    shape = getattr(data, "shape", None)
+    result = BenchmarkResult(
+        experiment,
+        case,
+        kind,
+        rows,
+        submissions,
+        len(samples),
+        min(samples),
+        statistics.median(samples),
+        int(shape[0]) if shape else None,
+    )
+    print(
+        f"⏱️ {experiment:<28} {case:<48} {rows:>9} x{submissions:<5} "
+        f"{result.median_s * 1000:10.2f} ms"
+    )
+    return result
+
+
+def benchmark_experiment(
+    name: str, root: Path, rows: int, repeats: int
+) -> List[BenchmarkResult]:
+    """
+    Time every stage of one experiment on the data in root.
+
+    Parameters:
+    - name (str): Registered experiment name.
+    - root (str | Path): Project root holding the generated raw data.
+    - rows (int): Size the data was generated with, for the report.
+    - repeats (int): Timed calls per case.
+
+    Returns:
+    - List[BenchmarkResult]: One result per input, step, fit and plot.
+    """
+    experiment = get_experiment(name)
+    module = experiment.load_module()
+    data: Dict[str, Any] = {}
+    results = []
+
+    for input_name, source in experiment.inputs.items():
+        samples = _time(
+            lambda: data.__setitem__(input_name, load_input(source, root)), repeats
+        )
+        results.append(
+            _result(
+                name, f"load {input_name}", "load", rows, 1, samples, data[input_name]
+            )
+        )
+
+    for step in experiment.steps:
+        function = getattr(module, step.function)
+        inputs = [data[input_name] for input_name in step.inputs]
+        samples = _time(
+            lambda: data.__setitem__(step.output, function(*inputs)), repeats
+        )
+        results.append(
+            _result(name, step.function, "analyze", rows, 1, samples, data[step.output])
+        )
+
+    for plot in experiment.plots:
+        frame = data[plot.data]
+        series = getattr(module, plot.function.removeprefix("plot_") + "_series", None)
+        if series is not None:
+            samples = _time(lambda: series(frame), repeats)
+            results.append(
+                _result(name, series.__name__, "fit", rows, 1, samples, frame)
+            )
+        function = getattr(module, plot.function)
+        samples = _time(lambda: function(frame, None), repeats)
+        results.append(_result(name, plot.function, "plot", rows, 1, samples, frame))
+    return results
+
+
+def benchmark_batch(
+    name: str, roots: Sequence[Path], rows: int, repeats: int
+) -> List[BenchmarkResult]:
+    """
+    Time loading and analysing one experiment across many submissions.
+
+    Parameters:
+    - name (str): Registered experiment name.
+    - roots (Sequence[Path]): The submission roots.
+    - rows (int): Size the data was generated with.
+    - repeats (int): Timed calls per case.
+
+    Returns:
+    - List[BenchmarkResult]: One result per input and step.
+    """
+    from physicslab import data_utils
+
+    experiment = get_experiment(name)
+    module = experiment.load_module()
+    # Input and step outputs by name, each keyed by submission root
+    frames: Dict[str, Dict[str, Any]] = {}
+    results = []
+    for input_name, source in experiment.inputs.items():
+        loader = getattr(data_utils, source.loader)
+        submissions = {root / source.path: str(root) for root in roots}
+
+        def load() -> None:
+            loaded, _ = data_utils.load_many(
+                list(submissions),
+                loader=loader,
+                source_id=lambda path: submissions[path],
+                concat=False,
+            )
+            frames[input_name] = loaded
+
+        samples = _time(load, repeats)
+        results.append(
+            _result(name, f"load_many {input_name}", "load", rows, len(roots), samples)
+        )
+
+    for step in experiment.steps:
+        if any(input_name not in frames for input_name in step.inputs):
+            continue
+        function = getattr(module, step.function)
+        # Only submissions that have every input of the step
+        groups = {
+            root: [frames[input_name][root] for input_name in step.inputs]
+            for root in map(str, roots)
+            if all(root in frames[input_name] for input_name in step.inputs)
+        }
+
+        def analyze() -> None:
+            frames[step.output] = {
+                root: function(*inputs) for root, inputs in groups.items()
+            }
+
+        samples = _time(analyze, repeats)
+        results.append(
+            _result(name, step.function, "analyze", rows, len(groups), samples)
+        )
+    return results
+
+
+def benchmark_fitting(rows: int, repeats: int) -> List[BenchmarkResult]:
+    """
+    Time the fitting primitives on ``rows`` points.
+
+    Parameters:
+    - rows (int): Number of points.
+    - repeats (int): Timed calls per case.
+
+    Returns:
+    - List[BenchmarkResult]: linear_fit on one dataset, on a batch of 100
+      datasets of ``rows // 100`` points, and grouped_linear_fit.
+    """
+    import numpy as np
+    import pandas as pd
+
+    from physicslab.fitting import grouped_linear_fit, linear_fit
+
+    rng = np.random.default_rng(0)
+    x = rng.uniform(0.0, 10.0, rows)
+    y = 2.0 * x + 1.0 + rng.normal(0.0, 0.1, rows)
+    batch = max(rows // 100, 2)
+    xb = x[: 100 * batch].reshape(-1, batch) if rows >= 200 else x[np.newaxis]
+    yb = y[: xb.size].reshape(xb.shape)
+    df = pd.DataFrame({"group": rng.integers(0, 100, rows), "x": x, "y": y})
+    cases = [
+        ("linear_fit", lambda: linear_fit(x, y)),
+        ("linear_fit batched", lambda: linear_fit(xb, yb)),
+        ("grouped_linear_fit", lambda: grouped_linear_fit(df, "x", "y", by="group")),
+    ]
+    return [
+        _result("fitting", case, "fit", rows, 1, _time(call, repeats))
+        for case, call in cases
+    ]
+
+
+def run_benchmarks(
+    experiments: Optional[Iterable[str]] = None,
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    submissions: Sequence[int] = (),
+    repeats: int = 3,
+    workdir: Optional[Path] = None,
+) -> List[BenchmarkResult]:
+    """
+    Generate synthetic data at every size and time every experiment on it.
+
+    Parameters:
+    - experiments (Optional[Iterable[str]]): Registered experiments with a
+      synthetic generator; defaults to all of them.
+    - sizes (Sequence[int]): Dataset sizes, e.g. 10**2 to 10**7.
+    - submissions (Sequence[int]): Cohort sizes for the batch cases, which
+      use the smallest dataset size; none by default.
+    - repeats (int): Timed calls per case.
+    - workdir (Optional[Path]): Where to generate data; a temporary
+      directory by default.
+
+    Returns:
+    - List[BenchmarkResult]: All results.
+    """
+    names = list(experiments or [name for name in EXPERIMENTS if name in GENERATORS])
+    results: List[BenchmarkResult] = []
+    with tempfile.TemporaryDirectory(dir=workdir) as scratch:
+        for rows in sizes:
+            results.extend(benchmark_fitting(rows, repeats))
+            for name in names:
+                root = Path(scratch) / f"{name}_{rows}"
+                write_dataset(name, root, rows)
+                results.extend(benchmark_experiment(name, root, rows, repeats))
+        for count in submissions:
+            for name in names:
+                cohort = Path(scratch) / f"{name}_cohort_{count}"
+                roots = write_submissions([name], cohort, min(sizes), count)
+                results.extend(benchmark_batch(name, roots, min(sizes), repeats))
+    return results
+
+
+def environment() -> Dict[str, Any]:
+    """Describe the machine and library versions results were measured with."""
+    import importlib.metadata
+
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "libraries": {
+            library: importlib.metadata.version(library)
+            for library in ("numpy", "pandas", "matplotlib")
+        },
+    }
+
+
+def write_results(results: List[BenchmarkResult], filepath: Path) -> None:
+    """
+    Write results and the environment as JSON.
+
+    Parameters:
+    - results (List[BenchmarkResult]): The results.
+    - filepath (Path): The JSON file.
+    """
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "environment": environment(),
+        "results": [asdict(result) for result in results],
+    }
+    filepath.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+    print(f"✅ Results written to {filepath}")
+
+
+def compare(
+    results: List[BenchmarkResult], baseline: Path, tolerance: float = 1.25
+) -> List[str]:
+    """
+    Compare median times against an earlier result file.
+
+    Parameters:
+    - results (List[BenchmarkResult]): The new results.
+    - baseline (Path): JSON written by write_results.
+    - tolerance (float): Largest acceptable ratio of new to baseline median.
+
+    Returns:
+    - List[str]: One line per regressed case.
+    """
+    previous = {
+        BenchmarkResult(**entry).key: BenchmarkResult(**entry)
+        for entry in json.loads(baseline.read_text(encoding="utf-8"))["results"]
+    }
+    regressions = []
+    for result in results:
+        before = previous.get(result.key)
+        if before is None or before.median_s <= 0:
+            continue
+        ratio = result.median_s / before.median_s
+        if ratio > tolerance:
+            regressions.append(
+                f"❌ {result.experiment} / {result.case} at {result.rows} rows "
+                f"x{result.submissions}: {before.median_s * 1000:.2f} ms -> "
+                f"{result.median_s * 1000:.2f} ms ({ratio:.2f}x)"
+            )
+    for line in regressions:
+        print(line)
+    if not regressions:
+        print(f"✅ No case slower than {tolerance:.2f}x the baseline")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark physicslab on synthetic data of growing size."
+    )
+    parser.add_argument(
+        "-e",
+        "--experiment",
+        action="append",
+        help="experiment to benchmark; repeatable (default: all with a generator)",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="dataset sizes in rows",
+    )
+    parser.add_argument(
+        "--submissions",
+        type=int,
+        nargs="*",
+        default=[],
+        help="cohort sizes for the batch loading and analysis cases",
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--profile", default="draft", help="render profile")
+    parser.add_argument(
+        "-o", "--output", type=Path, default=Path("benchmark_results.json")
+    )
+    parser.add_argument("--workdir", type=Path, help="where to generate the data")
+    parser.add_argument("--baseline", type=Path, help="earlier results to compare to")
+    parser.add_argument("--tolerance", type=float, default=1.25)
+    args = parser.parse_args()
+
+    from physicslab.plot_utils import setup_plot_style
+
+    setup_plot_style(args.profile)
+    results = run_benchmarks(
+        args.experiment, args.sizes, args.submissions, args.repeats, args.workdir
+    )
+    write_results(results, args.output)
+    if args.baseline is not None:
+        return 1 if compare(results, args.baseline, args.tolerance) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,440 @@
+# src/physicslab/build.py
+
+import json
+import logging
+import os
+import sys
+import time
+import traceback
+import types
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from physicslab.cache import combine_digest, file_digest
+from physicslab.logs import file_event
+from physicslab.registry import (
+    EXPERIMENTS,
+    Experiment,
+    get_experiment,
+    load_input,
+    run_plot,
+    run_step,
+)
+
+logger = logging.getLogger(__name__)
+
+# Build state is kept per project root, next to data/ and output/
+STATE_DIR = ".physicslab"
+
+# Bump whenever the fingerprint recipe changes, so every node is rebuilt once
+_BUILD_VERSION = "1"
+
+_LIBRARIES = ("numpy", "pandas", "matplotlib")
+
+_code_digests: Dict[str, str] = {}
+
+
+@dataclass
+class Node:
+    """
+    One node of an experiment's build graph.
+
+    Attributes:
+    - experiment (str): The experiment name.
+    - name (str): The data name for inputs and steps, the function for plots.
+    - kind (str): "input", "step" or "plot".
+    - needs (Tuple[str, ...]): Data names the node is computed from.
+    - fingerprint (str): Digest of everything the node's result depends on:
+      the raw file content for inputs, otherwise the fingerprints of the
+      needed nodes plus the source of the code that computes the node.
+    """
+
+    experiment: str
+    name: str
+    kind: str
+    needs: Tuple[str, ...]
+    fingerprint: str
+
+    @property
+    def id(self) -> str:
+        return f"{self.experiment}/{self.kind}/{self.name}"
+
+
+@dataclass
+class NodeResult:
+    """
+    Outcome of one node of a build.
+
+    Attributes:
+    - root (str): The project root.
+    - node (Node): The node.
+    - status (str): "built", "fresh" when it was up to date, "failed", or
+      "skipped" when a node it needs failed.
+    - seconds (float): Wall time spent building the node.
+    - error (Optional[str]): The formatted traceback if the node failed.
+    """
+
+    root: str
+    node: Node
+    status: str
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+def _physicslab_modules(module: types.ModuleType) -> List[types.ModuleType]:
+    # The module plus every physicslab module it reaches through its globals,
+    # e.g. a processing module, fitting, plot_utils, cache and decimation
+    seen = {module.__name__: module}
+    stack = [module]
+    while stack:
+        for value in vars(stack.pop()).values():
+            if isinstance(value, types.ModuleType):
+                other = value
+            else:
+                other = sys.modules.get(getattr(value, "__module__", None) or "")
+            if (
+                other is not None
+                and other.__name__.split(".")[0] == "physicslab"
+                and other.__name__ not in seen
+            ):
+                seen[other.__name__] = other
+                stack.append(other)
+    return [seen[name] for name in sorted(seen)]
+
+
+def code_digest(function: Callable[..., Any]) -> str:
+    """
+    Fingerprint the code behind a processing, loading or plot function.
+
+    The whole source of the function's module is hashed, together with every
+    physicslab module it uses, rather than just the function body: plot
+    functions delegate to series builders and shared helpers, and an edit to
+    any of them changes the output. Installed library versions are included
+    as well.
+
+    Parameters:
+    - function (Callable): The function.
+
+    Returns:
+    - str: The hex digest.
+    """
+    import importlib.metadata
+
+    module_name = function.__module__
+    if module_name not in _code_digests:
+        parts = [_BUILD_VERSION]
+        for library in _LIBRARIES:
+            parts += [library, importlib.metadata.version(library)]
+        for module in _physicslab_modules(sys.modules[module_name]):
+            parts += [module.__name__, Path(module.__file__).read_bytes()]
+        _code_digests[module_name] = combine_digest(parts)
+    return _code_digests[module_name]
+
+
+class BuildState:
+    """
+    The fingerprints and outputs recorded by the last build of a root.
+
+    Stored as JSON in ``<root>/.physicslab/build.json``. Raw file digests are
+    remembered together with the file's size and modification time, so an
+    unchanged submission is not even re-read.
+    """
+
+    def __init__(self, root: Union[str, Path]) -> None:
+        self.root = Path(root)
+        self.path = self.root / STATE_DIR / "build.json"
+        try:
+            state = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            state = {}
+        self.nodes: Dict[str, Dict[str, Any]] = state.get("nodes", {})
+        self.files: Dict[str, Dict[str, Any]] = state.get("files", {})
+
+    def file_digest(self, path: Path) -> str:
+        """Returns the content digest of a file, re-hashing it only if it changed."""
+        stat = path.stat()
+        key = os.path.relpath(path, self.root)
+        known = self.files.get(key)
+        if (
+            known
+            and known["size"] == stat.st_size
+            and known["mtime"] == stat.st_mtime_ns
+        ):
+            return known["digest"]
+        digest = file_digest(path)
+        self.files[key] = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "digest": digest,
+        }
+        return digest
+
+    def is_fresh(self, node: Node) -> bool:
+        """Whether the node was built with the same fingerprint and its outputs exist."""
+        record = self.nodes.get(node.id)
+        return (
+            record is not None
+            and record["fingerprint"] == node.fingerprint
+            and all((self.root / output).exists() for output in record["outputs"])
+        )
+
+    def record(self, node: Node, outputs: Iterable[Union[str, Path]]) -> None:
+        """Remembers a built node and the files it wrote."""
+        self.nodes[node.id] = {
+            "fingerprint": node.fingerprint,
+            "outputs": [os.path.relpath(output, self.root) for output in outputs],
+        }
+
+    def save(self) -> None:
+        """Writes the state atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f".build.{os.getpid()}.json")
+        temp_path.write_text(
+            json.dumps({"nodes": self.nodes, "files": self.files}, indent=1),
+            encoding="utf-8",
+        )
+        os.replace(temp_path, self.path)
+
+
+def plan(experiment: Experiment, state: BuildState, profile: Any = None) -> List[Node]:
+    """
+    Build the dependency graph of an experiment and fingerprint every node.
+
+    Parameters:
+    - experiment (Experiment): The experiment.
+    - state (BuildState): State of the root, used to look up raw file digests.
+    - profile (Any): The render profile; part of every plot's fingerprint.
+
+    Returns:
+    - List[Node]: The nodes in dependency order: inputs, steps, then plots.
+
+    Raises:
+    - FileNotFoundError: If a raw input file is missing.
+    """
+    from physicslab import data_utils
+
+    module = experiment.load_module()
+    nodes: List[Node] = []
+    fingerprints: Dict[str, str] = {}
+    for name, source in experiment.inputs.items():
+        fingerprints[name] = combine_digest(
+            [
+                "input",
+                repr(source),
+                state.file_digest(state.root / source.path),
+                code_digest(getattr(data_utils, source.loader)),
+            ]
+        )
+        nodes.append(Node(experiment.name, name, "input", (), fingerprints[name]))
+    for step in experiment.steps:
+        fingerprints[step.output] = combine_digest(
+            ["step", repr(step), code_digest(getattr(module, step.function))]
+            + [fingerprints[name] for name in step.inputs]
+        )
+        nodes.append(
+            Node(
+                experiment.name,
+                step.output,
+                "step",
+                step.inputs,
+                fingerprints[step.output],
+            )
+        )
+    for plot in experiment.plots:
+        fingerprint = combine_digest(
+            [
+                "plot",
+                repr(plot),
+                experiment.output_dir,
+                repr(profile),
+                code_digest(getattr(module, plot.function)),
+                fingerprints[plot.data],
+            ]
+        )
+        nodes.append(
+            Node(experiment.name, plot.function, "plot", (plot.data,), fingerprint)
+        )
+    return nodes
+
+
+def _log_failure(result: NodeResult) -> None:
+    file_event(
+        logger,
+        "build",
+        f"{result.root}: {result.node.id}",
+        "❌ ERROR: %s: %s failed:\n%s",
+        result.root,
+        result.node.id,
+        result.error,
+        seconds=result.seconds,
+        level=logging.ERROR,
+    )
+
+
+def _build_experiment(
+    experiment: Experiment, state: BuildState, force: bool, profile: Any
+) -> List[NodeResult]:
+    import pandas as pd
+
+    from physicslab.data_utils import ParseCache
+
+    root = state.root
+    # Parsed raw files and step results, keyed by fingerprint, so that a
+    # stale plot does not re-run the fresh steps it depends on
+    store = ParseCache(root / STATE_DIR / "cache")
+    module = experiment.load_module()
+    steps = {step.output: step for step in experiment.steps}
+    plots = {plot.function: plot for plot in experiment.plots}
+
+    try:
+        nodes = plan(experiment, state, profile)
+    except Exception:
+        node = Node(experiment.name, "plan", "experiment", (), "")
+        result = NodeResult(str(root), node, "failed", error=traceback.format_exc())
+        _log_failure(result)
+        return [result]
+    by_name = {node.name: node for node in nodes if node.kind != "plot"}
+
+    data: Dict[str, Any] = {}
+
+    def value(name: str) -> Any:
+        # The data of a node, computed only if it is not stored yet
+        if name not in data:
+            node = by_name[name]
+            if node.kind == "input":
+                data[name] = load_input(experiment.inputs[name], root, cache=store)
+            else:
+                stored = store.get(node.fingerprint)
+                data[name] = stored if stored is not None else compute(node)
+        return data[name]
+
+    def compute(node: Node) -> Any:
+        step = steps[node.name]
+        result = run_step(module, step, {n: value(n) for n in node.needs}, root)
+        if isinstance(result, pd.DataFrame):
+            store.put(node.fingerprint, result)
+        state.record(node, [root / step.save] if step.save else [])
+        return result
+
+    results: List[NodeResult] = []
+    failed = set()
+    for node in nodes:
+        if any(name in failed for name in node.needs):
+            failed.add(node.name)
+            results.append(NodeResult(str(root), node, "skipped"))
+            continue
+        if node.kind == "input" or (not force and state.is_fresh(node)):
+            # Inputs are only loaded when a stale node needs them
+            results.append(NodeResult(str(root), node, "fresh"))
+            continue
+
+        start = time.perf_counter()
+        try:
+            if node.kind == "step":
+                data[node.name] = compute(node)
+            else:
+                plot = plots[node.name]
+                output = run_plot(
+                    module,
+                    plot,
+                    {plot.data: value(plot.data)},
+                    root / experiment.output_dir,
+                )
+                state.record(node, [output] if isinstance(output, Path) else [])
+        except Exception:
+            failed.add(node.name)
+            result = NodeResult(
+                str(root),
+                node,
+                "failed",
+                time.perf_counter() - start,
+                traceback.format_exc(),
+            )
+            _log_failure(result)
+        else:
+            result = NodeResult(str(root), node, "built", time.perf_counter() - start)
+            file_event(
+                logger,
+                "build",
+                f"{root}: {node.id}",
+                "🔨 Built %s in %.3f s",
+                node.id,
+                result.seconds,
+                seconds=result.seconds,
+            )
+        results.append(result)
+    return results
+
+
+def build(
+    names: Optional[Iterable[str]] = None,
+    roots: Union[str, Path, Iterable[Union[str, Path]]] = ".",
+    force: bool = False,
+    profile: Any = None,
+) -> List[NodeResult]:
+    """
+    Bring the processed data and figures of experiments up to date, make-style.
+
+    Every raw input, analysis step and plot is a node of a dependency graph,
+    fingerprinted by the content of the raw files it depends on and the
+    source of the code producing it (see code_digest). A node runs only when
+    its fingerprint differs from the one recorded at its last build, or when
+    one of its output files is missing; everything else is skipped. Step
+    results are stored by fingerprint, so a stale figure does not recompute
+    the analysis it plots. With many submissions, each in its own root,
+    only the ones whose data changed are processed again.
+
+    Parameters:
+    - names (Optional[Iterable[str]]): Registered experiment names; defaults
+      to all of them.
+    - roots (str | Path | Iterable): One or more project roots, e.g. one per
+      submission, each with its own data/ and output/.
+    - force (bool): Rebuild every node regardless of its fingerprint.
+    - profile (str | RenderProfile | None): Render profile; defaults to the
+      active one. Switching profiles makes every figure stale.
+
+    Returns:
+    - List[NodeResult]: One result per node and root.
+    """
+    from physicslab.plot_utils import get_render_profile
+
+    experiments = [get_experiment(name) for name in (names or EXPERIMENTS)]
+    if isinstance(roots, (str, Path)):
+        roots = [roots]
+    render_profile = get_render_profile(profile)
+
+    results: List[NodeResult] = []
+    for root in roots:
+        state = BuildState(root)
+        for experiment in experiments:
+            results.extend(_build_experiment(experiment, state, force, render_profile))
+            state.save()
+
+    print_build_summary(results)
+    return results
+
+
+def print_build_summary(results: List[NodeResult]) -> None:
+    """
+    Print how many nodes a build built, skipped or found up to date.
+
+    The nodes themselves are logged as they are built, failures included.
+    Raw input files are never built, so they are counted apart from the
+    outputs found up to date.
+
+    Parameters:
+    - results (List[NodeResult]): The node results.
+    """
+    counts = {status: 0 for status in ("built", "fresh", "failed", "skipped")}
+    inputs = 0
+    for result in results:
+        if result.node.kind == "input" and result.status == "fresh":
+            inputs += 1
+        else:
+            counts[result.status] += 1
+    print(
+        f"✅ {counts['built']} built, {counts['fresh']} up to date, "
+        f"{counts['failed']} failed, {counts['skipped']} skipped "
+        f"({inputs} inputs)"
+    )
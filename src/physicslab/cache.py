@@ -0,0 +1,129 @@
+# src/physicslab/cache.py
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable, Union
+
+
+PathLike = Union[str, Path]
+
+_CHUNK_SIZE = 1 << 20
+
+
+def file_digest(filepath: PathLike) -> str:
+    """
+    Returns the SHA-256 hex digest of a file's content.
+
+    Args:
+        filepath (PathLike): The file to hash.
+
+    Returns:
+        str: The hex digest.
+    """
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def combine_digest(parts: Iterable[Union[str, bytes]]) -> str:
+    """
+    Returns one SHA-256 hex digest over an ordered sequence of key parts.
+
+    Args:
+        parts (Iterable[str | bytes]): The parts making up a cache key.
+
+    Returns:
+        str: The hex digest.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode("utf-8")
+        # Length-prefix each part so ("ab", "c") and ("a", "bc") differ
+        digest.update(len(part).to_bytes(8, "little"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+class LRUDirectory:
+    """
+    A directory of cache entries kept under a size budget.
+
+    Entries are plain files named by their key. The modification time of an
+    entry doubles as its last-use time, so it is refreshed on every hit and
+    the least recently used entries are deleted first when the directory
+    grows past ``max_bytes``. Writes go through a temporary file and an
+    atomic rename, so several processes can share one directory.
+    """
+
+    def __init__(self, directory: PathLike, max_bytes: int, suffix: str) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+
+    def path_for(self, key: str) -> Path:
+        """Returns the entry path for ``key``, whether or not it exists."""
+        return self.directory / f"{key}{self.suffix}"
+
+    def lookup(self, key: str) -> Union[Path, None]:
+        """Returns the entry path for ``key`` and marks it used, or None."""
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def temp_path_for(self, key: str) -> Path:
+        """
+        Returns a new, empty temporary file to write the entry for ``key`` to.
+
+        The file is created with a unique name on every call, so concurrent
+        writers of the same key, in one process or several, never share it.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(
+            suffix=f".tmp{self.suffix}", prefix=f".{key}.", dir=self.directory
+        )
+        os.close(fd)
+        return Path(name)
+
+    def commit(self, key: str, temp_path: Path) -> Path:
+        """Atomically publishes a written temporary file as the entry for ``key``."""
+        path = self.path_for(key)
+        os.replace(temp_path, path)
+        self.evict()
+        return path
+
+    def discard(self, key: str) -> None:
+        """Deletes the entry for ``key``, if there is one."""
+        try:
+            self.path_for(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def evict(self) -> None:
+        """Deletes least recently used entries until the budget is respected."""
+        entries = []
+        for path in self.directory.glob(f"*{self.suffix}"):
+            if path.name.startswith("."):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
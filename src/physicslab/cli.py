@@ -0,0 +1,130 @@
+# src/physicslab/cli.py
+
+import argparse
+from pathlib import Path
+from typing import List, Optional
+
+from physicslab.logs import batch_mode, configure_logging
+from physicslab.registry import EXPERIMENTS, get_experiment, run_experiments
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="physicslab", description="Run PhysicsLab experiment workflows."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="list the registered experiments")
+
+    run = commands.add_parser("run", help="run one or more experiments")
+    run.add_argument(
+        "experiments", nargs="+", metavar="experiment", help="experiment names"
+    )
+    run.add_argument(
+        "--root",
+        type=Path,
+        default=Path.cwd(),
+        help="project root holding data/ and output/ (default: current directory)",
+    )
+    run.add_argument("--profile", help="render profile, e.g. draft or publication")
+    run.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="run experiments in this many worker processes and print stage timings",
+    )
+
+    build = commands.add_parser(
+        "build", help="rebuild only the processed data and figures that are stale"
+    )
+    build.add_argument(
+        "experiments",
+        nargs="*",
+        metavar="experiment",
+        help="experiment names (default: all)",
+    )
+    build.add_argument(
+        "--root",
+        dest="roots",
+        type=Path,
+        action="append",
+        help="project root, e.g. one submission; repeatable (default: current directory)",
+    )
+    build.add_argument("--profile", help="render profile, e.g. draft or publication")
+    build.add_argument(
+        "--force", action="store_true", help="rebuild everything, even if up to date"
+    )
+
+    for command in (run, build):
+        command.add_argument(
+            "--trace",
+            type=Path,
+            metavar="FILE",
+            help="record load/analyze/fit/plot/save timings as Chrome trace JSON "
+            "in FILE, with a CSV summary next to it",
+        )
+        command.add_argument(
+            "--trace-memory",
+            action="store_true",
+            help="also trace Python allocations (slower)",
+        )
+        command.add_argument(
+            "--batch",
+            action="store_true",
+            help="do not report every file; print one summary with counts, "
+            "failures and the slowest files at the end",
+        )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for name, experiment in EXPERIMENTS.items():
+            print(f"{name:<30} {experiment.title}")
+        return 0
+
+    try:
+        for name in args.experiments:
+            get_experiment(name)
+    except ValueError as e:
+        parser.error(str(e))
+
+    from physicslab.plot_utils import setup_plot_style
+
+    configure_logging()
+    setup_plot_style(args.profile)
+    if args.trace is None:
+        return _execute(args)
+
+    from physicslab.tracing import tracing
+
+    with tracing(args.trace, memory=args.trace_memory):
+        return _execute(args)
+
+
+def _execute(args: argparse.Namespace) -> int:
+    if not args.batch:
+        return _dispatch(args)
+    with batch_mode():
+        return _dispatch(args)
+
+
+def _dispatch(args: argparse.Namespace) -> int:
+    if args.command == "build":
+        from physicslab.build import build as build_experiments
+
+        nodes = build_experiments(
+            args.experiments or None, args.roots or [Path.cwd()], args.force
+        )
+        return 0 if all(node.status != "failed" for node in nodes) else 1
+    if args.jobs > 1:
+        from physicslab.runner import run_concurrently
+
+        stages = run_concurrently(args.experiments, args.root, args.jobs)
+        return 0 if all(stage.status == "ok" for stage in stages) else 1
+    results = run_experiments(args.experiments, args.root)
+    return 0 if all(result is not None for result in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
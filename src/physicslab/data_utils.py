@@ -1,48 +1,327 @@
 # src/physicslab/data_utils.py
 
+import csv
+import functools
+import glob
+import json
+import logging
+import numpy as np
 import pandas as pd
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
+from physicslab.cache import LRUDirectory, combine_digest, file_digest
+from physicslab.logs import file_event
+from physicslab.tracing import instrument
+
+
+logger = logging.getLogger(__name__)
 
 PathLike = Union[str, Path]
+Loader = Callable[[PathLike], pd.DataFrame]
+
+# Bump whenever a parser's output changes, so stale cache entries are ignored
+_PARSE_CACHE_VERSION = "1"
+
+
+def _encode_values(prefix: str, values: pd.Index | pd.Series) -> Dict[str, np.ndarray]:
+    """
+    Encodes a column, index or set of labels as plain arrays, without pickling.
+
+    Numeric and datetime data is stored as is. Anything else is split into a
+    per-element kind code (0 missing, 1 float, 2 int, 3 text) plus a float and
+    a string array, so mixed object columns survive the round trip.
+    """
+    if values.dtype.kind in "biufcmM":
+        return {f"{prefix}_values": values.to_numpy()}
+    objects = values.to_numpy(dtype=object)
+    kinds = np.full(len(objects), 3, dtype=np.int8)
+    numbers = np.full(len(objects), np.nan)
+    for i, value in enumerate(objects):
+        if isinstance(value, (bool, np.bool_)):
+            continue
+        if isinstance(value, (int, np.integer)):
+            kinds[i], numbers[i] = 2, value
+        elif isinstance(value, (float, np.floating)):
+            kinds[i], numbers[i] = (0, np.nan) if np.isnan(value) else (1, value)
+        elif value is None or value is pd.NA:
+            kinds[i] = 0
+    strings = np.array(["" if k != 3 else str(v) for k, v in zip(kinds, objects)])
+    return {
+        f"{prefix}_kinds": kinds,
+        f"{prefix}_numbers": numbers,
+        f"{prefix}_strings": strings.astype(str),
+    }
+
+
+def _decode_values(prefix: str, data: Any, dtype: str) -> pd.Series:
+    if f"{prefix}_values" in data:
+        return pd.Series(data[f"{prefix}_values"], dtype=dtype)
+    kinds = data[f"{prefix}_kinds"]
+    numbers = data[f"{prefix}_numbers"]
+    strings = data[f"{prefix}_strings"]
+    objects = np.empty(len(kinds), dtype=object)
+    objects[:] = np.nan
+    objects[kinds == 1] = numbers[kinds == 1]
+    objects[kinds == 2] = [int(v) for v in numbers[kinds == 2]]
+    objects[kinds == 3] = strings[kinds == 3]
+    return pd.Series(objects, dtype=dtype)
+
+
+class ParseCache:
+    """
+    Opt-in on-disk cache of parsed CSV files.
+
+    Each entry is an uncompressed ``.npz`` file holding one array per column,
+    keyed by the SHA-256 of the raw file content, the parser used and the
+    cache format version. Editing a file, switching parsers or changing a
+    parser's output therefore never returns a stale frame, while re-running a
+    script over unchanged raw data skips text parsing entirely. The directory
+    is kept below ``max_bytes`` by least-recently-used eviction.
+    """
+
+    def __init__(self, directory: PathLike, max_bytes: int = 512 * 1024**2) -> None:
+        self.store = LRUDirectory(directory, max_bytes, suffix=".npz")
+
+    def key(self, filepath: PathLike, parse: Loader) -> Optional[str]:
+        """
+        Returns the cache key of ``filepath`` as parsed by ``parse``.
+
+        The parser is identified by its importable name plus, for a
+        ``functools.partial``, its bound arguments. Parsers without a stable
+        identity, such as lambdas and nested functions, get None: their
+        results are not cached.
+        """
+        parser = _parser_identity(parse)
+        if parser is None:
+            return None
+        return combine_digest([file_digest(filepath), parser, _PARSE_CACHE_VERSION])
+
+    def load(self, filepath: PathLike, parse: Loader) -> pd.DataFrame:
+        """
+        Returns ``parse(filepath)``, from the cache when the content is unchanged.
+
+        Args:
+            filepath (PathLike): The raw file.
+            parse (Loader): A parser that raises on failure, e.g. ``pd.read_csv``.
+
+        Returns:
+            pd.DataFrame: The parsed DataFrame.
+        """
+        key = self.key(filepath, parse)
+        if key is None:
+            return parse(filepath)
+        df = self.get(key)
+        if df is None:
+            df = parse(filepath)
+            self.put(key, df)
+        return df
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Returns the DataFrame stored under ``key``, or None if there is none.
+
+        An entry that cannot be read, e.g. a truncated file, is deleted and
+        reported as missing, so the caller parses the file again.
+
+        Args:
+            key (str): The entry key, e.g. from ``key`` or ``combine_digest``.
+
+        Returns:
+            Optional[pd.DataFrame]: The stored DataFrame.
+        """
+        entry = self.store.lookup(key)
+        if entry is None:
+            return None
+        try:
+            return self._read(entry)
+        except Exception as e:
+            # Unreadable entry (e.g. truncated or corrupt); drop it and re-parse
+            logger.warning("Discarding unreadable parse cache entry %s: %s", entry, e)
+            self.store.discard(key)
+            return None
+
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        """
+        Stores a DataFrame under ``key``, replacing any previous entry.
+
+        Args:
+            key (str): The entry key.
+            df (pd.DataFrame): The DataFrame to store.
+        """
+        self._write(key, df)
+
+    def _write(self, key: str, df: pd.DataFrame) -> None:
+        arrays: Dict[str, np.ndarray] = {}
+        meta: Dict[str, Any] = {
+            "dtypes": [str(dtype) for dtype in df.dtypes],
+            "columns_dtype": str(df.columns.dtype),
+            "columns_name": df.columns.name,
+            "index_dtype": str(df.index.dtype),
+            "index_name": df.index.name,
+        }
+        arrays.update(_encode_values("columns", df.columns))
+        arrays.update(_encode_values("index", df.index))
+        for i in range(df.shape[1]):
+            arrays.update(_encode_values(f"col{i}", df.iloc[:, i]))
+        arrays["meta"] = np.array(json.dumps(meta))
+
+        temp_path = self.store.temp_path_for(key)
+        with open(temp_path, "wb") as f:
+            np.savez(f, **arrays)
+        self.store.commit(key, temp_path)
+
+    def _read(self, path: Path) -> pd.DataFrame:
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            columns = [
+                _decode_values(f"col{i}", data, dtype)
+                for i, dtype in enumerate(meta["dtypes"])
+            ]
+            labels = _decode_values("columns", data, meta["columns_dtype"])
+            index = _decode_values("index", data, meta["index_dtype"])
+        df = pd.concat(columns, axis=1, ignore_index=True)
+        df.columns = pd.Index(labels, name=meta["columns_name"])
+        df.index = pd.Index(index, name=meta["index_name"])
+        return df
+
+
+@instrument("load")
+def _read_csv(filepath: PathLike) -> pd.DataFrame:
+    return pd.read_csv(filepath)
+
+
+@instrument("load")
+def parse_row_oriented_csv(filepath: PathLike) -> pd.DataFrame:
+    """
+    Parses a "parameter-per-row" CSV file straight into float64 columns.
+
+    Every line holds a parameter name followed by its values, e.g.
+    ``R_T/Ω,1831,1421,...`` in ``data/raw/thermal_resistor/source_data.csv``.
+    The first line is a parameter like any other, not a header. Rows may be
+    ragged: missing trailing values, empty cells and non-numeric cells all
+    become NaN. The values are parsed row by row into one 2-D float64 array
+    whose transposed view backs the DataFrame, so no transposed copy of the
+    data is made.
+
+    Args:
+        filepath (PathLike): The path to the input CSV file.
+
+    Returns:
+        pd.DataFrame: One float64 column per parameter, in file order.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(filepath, encoding="utf-8-sig", newline="") as f:
+        rows = [row for row in csv.reader(f) if any(cell.strip() for cell in row)]
+
+    labels = [row[0].strip() for row in rows]
+    width = max((len(row) - 1 for row in rows), default=0)
+    values = np.full((len(rows), width), np.nan)
+    for i, row in enumerate(rows):
+        values[i, : len(row) - 1] = pd.to_numeric(row[1:], errors="coerce")
+
+    return pd.DataFrame(values.T, columns=labels, copy=False)
+
+
+def _parser_identity(parse: Callable) -> Optional[str]:
+    # "module.qualname(args, keywords)" of a parser, or None if it has no
+    # name that means the same thing in another run (lambdas, closures, or
+    # bound arguments whose repr is an object address)
+    args: List[str] = []
+    while isinstance(parse, functools.partial):
+        bound = [repr(arg) for arg in parse.args]
+        bound += [f"{name}={value!r}" for name, value in sorted(parse.keywords.items())]
+        args = bound + args
+        parse = parse.func
+    module = getattr(parse, "__module__", None)
+    qualname = getattr(parse, "__qualname__", None)
+    if module is None or qualname is None or "<" in qualname:
+        return None
+    if any(" at 0x" in arg for arg in args):
+        return None
+    return f"{module}.{qualname}({', '.join(args)})"
+
+
+def _parse(
+    parse: Loader, filepath: PathLike, cache: Optional[ParseCache] = None
+) -> pd.DataFrame:
+    if cache is None:
+        return parse(filepath)
+    return cache.load(filepath, parse)
+
+
+def _log_load_error(filepath: Path, message: str, *args: object) -> None:
+    file_event(
+        logger, "load", filepath, "❌ ERROR: " + message, *args, level=logging.ERROR
+    )
 
 
-def load_csv(filepath: PathLike) -> pd.DataFrame:
+@instrument("load")
+def load_csv(filepath: PathLike, cache: Optional[ParseCache] = None) -> pd.DataFrame:
     """
     Loads a standard CSV file with columns as parameters (no transposing).
 
     Args:
         filepath (PathLike): The path to the input CSV file.
+        cache (ParseCache, optional): Parse cache to read from and populate.
 
     Returns:
         pd.DataFrame: A cleaned DataFrame ready for analysis.
                       Returns an empty DataFrame if the file is not found.
     """
     filepath = Path(filepath)
+    start = time.perf_counter()
     try:
-        df = pd.read_csv(filepath)
-        print(f"✅ Successfully loaded data from: {filepath.name}")
-        return df
+        df = _parse(_read_csv, filepath, cache)
     except FileNotFoundError:
-        print(f"❌ ERROR: Input file not found at {filepath}")
+        _log_load_error(filepath, "Input file not found at %s", filepath)
         return pd.DataFrame()
     except Exception as e:
-        print(f"❌ ERROR: An unexpected error occurred while loading {filepath}: {e}")
+        _log_load_error(
+            filepath, "An unexpected error occurred while loading %s: %s", filepath, e
+        )
         return pd.DataFrame()
+    seconds = time.perf_counter() - start
+    file_event(
+        logger,
+        "load",
+        filepath,
+        "✅ Successfully loaded data from: %s",
+        filepath.name,
+        seconds=seconds,
+    )
+    return df
 
 
-def load_transposed_csv(filepath: PathLike) -> pd.DataFrame:
+@instrument("load")
+def load_transposed_csv(
+    filepath: PathLike, cache: Optional[ParseCache] = None
+) -> pd.DataFrame:
     """
     Loads and processes a CSV file where parameters are stored in rows.
 
-    This function performs the following steps:
-    1. Reads the CSV using the first column as the index.
-    2. Transposes the DataFrame to have parameters as columns.
-    3. Converts all data to numeric types, coercing errors into NaN (Not a Number).
+    The file is parsed by ``parse_row_oriented_csv``: every row, including
+    the first, becomes a float64 column named after its first cell. Ragged
+    rows are padded and non-numeric values are coerced into NaN (Not a Number).
 
     Args:
         filepath (PathLike): The path to the input CSV file.
+        cache (ParseCache, optional): Parse cache to read from and populate.
 
     Returns:
         pd.DataFrame: A cleaned, transposed DataFrame ready for analysis.
@@ -50,47 +329,288 @@ def load_transposed_csv(filepath: PathLike) -> pd.DataFrame:
     """
     filepath = Path(filepath)
 
+    start = time.perf_counter()
     try:
-        df = pd.read_csv(filepath, index_col=0)
-        df_transposed = df.T
-        print(f"✅ Successfully loaded and transposed data from: {filepath.name}")
-        return df_transposed
+        df_transposed = _parse(parse_row_oriented_csv, filepath, cache)
     except FileNotFoundError:
-        print(f"❌ ERROR: Input file not found at {filepath}")
+        _log_load_error(filepath, "Input file not found at %s", filepath)
         return pd.DataFrame()
     except Exception as e:
-        print(f"❌ ERROR: An unexpected error occurred while loading {filepath}: {e}")
+        _log_load_error(
+            filepath, "An unexpected error occurred while loading %s: %s", filepath, e
+        )
         return pd.DataFrame()
+    seconds = time.perf_counter() - start
+    file_event(
+        logger,
+        "load",
+        filepath,
+        "✅ Successfully loaded and transposed data from: %s",
+        filepath.name,
+        seconds=seconds,
+    )
+    return df_transposed
+
+
+# The public loaders report errors and return an empty DataFrame; batch loading
+# needs the exception itself, so it swaps them for their raising counterparts.
+_RAISING_LOADERS: Dict[Callable, Loader] = {
+    load_csv: _read_csv,
+    load_transposed_csv: parse_row_oriented_csv,
+}
+
 
+def _expand_sources(sources: Union[PathLike, Iterable[PathLike]]) -> List[Path]:
+    if isinstance(sources, (str, Path)):
+        sources = [sources]
+    paths: List[Path] = []
+    for source in sources:
+        if glob.has_magic(str(source)):
+            matches = sorted(glob.glob(str(source), recursive=True))
+            paths.extend(Path(match) for match in matches)
+        else:
+            paths.append(Path(source))
+    return paths
 
-def check_missing_data(df: pd.DataFrame, df_name: str = "DataFrame") -> None:
+
+def load_many(
+    sources: Union[PathLike, Iterable[PathLike]],
+    loader: Loader = load_csv,
+    workers: Optional[int] = None,
+    use_processes: bool = False,
+    source_col: str = "source",
+    source_id: Optional[Callable[[Path], str]] = None,
+    concat: bool = True,
+    cache: Optional[ParseCache] = None,
+) -> Tuple[Union[pd.DataFrame, Dict[str, pd.DataFrame]], Dict[str, str]]:
     """
-    Checks for missing data in the DataFrame and prints a summary.
+    Loads many CSV files concurrently, e.g. a whole directory of submissions.
+
+    Files are parsed in a thread pool (or a process pool for loaders that
+    hold the GIL) and each frame is tagged with the id of its source file.
+    A file that fails to load is recorded in the returned failures instead of
+    becoming an empty DataFrame.
+
+    Args:
+        sources (PathLike | Iterable[PathLike]): A path, a glob pattern such as
+            "data/raw/thermal_resistor/*.csv", or an iterable of either.
+        loader (Loader): Function parsing one file, e.g. ``load_csv`` or
+            ``load_transposed_csv``. It must be picklable if ``use_processes``.
+        workers (int, optional): Pool size; defaults to the executor's default.
+        use_processes (bool): Use a process pool instead of a thread pool.
+        source_col (str): Name of the column holding the source id.
+        source_id (Callable[[Path], str], optional): Maps a path to its id,
+            e.g. ``lambda p: p.parent.name`` for one directory per submission.
+            Defaults to the path as given.
+        concat (bool): Return one concatenated DataFrame instead of a dict
+            of DataFrames keyed by source id.
+        cache (ParseCache, optional): Parse cache shared by all workers.
+
+    Returns:
+        Tuple: The loaded data (a DataFrame or a dict of DataFrames, in input
+               order) and a dict mapping each failed source id to its error.
+               A file that already has a ``source_col`` column is a failure.
+
+    Raises:
+        ValueError: If ``source_id`` maps two files to the same id.
+    """
+    paths = _expand_sources(sources)
+    loader = _RAISING_LOADERS.get(loader, loader)
+    if cache is not None:
+        loader = functools.partial(_parse, loader, cache=cache)
+    source_id = source_id or str
+
+    keys = [source_id(path) for path in paths]
+    seen: Dict[str, Path] = {}
+    for key, path in zip(keys, paths):
+        if key in seen:
+            raise ValueError(
+                f"Source id {key!r} is shared by {seen[key]} and {path}; "
+                "choose a source_id that tells them apart"
+            )
+        seen[key] = path
+
+    pool_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    frames: Dict[str, pd.DataFrame] = {}
+    failures: Dict[str, str] = {}
+    with pool_cls(max_workers=workers) as executor:
+        futures = [
+            (key, executor.submit(loader, path)) for key, path in zip(keys, paths)
+        ]
+        for key, future in futures:
+            try:
+                df = future.result()
+                df.insert(0, source_col, key)
+            except Exception as e:
+                failures[key] = f"{type(e).__name__}: {e}"
+                continue
+            frames[key] = df
+
+    logger.info(
+        "✅ Loaded %d of %d files (%d failed)", len(frames), len(paths), len(failures)
+    )
+    for key, error in failures.items():
+        _log_load_error(Path(key), "Could not load %s: %s", key, error)
+
+    if not concat:
+        return frames, failures
+    if not frames:
+        return pd.DataFrame(), failures
+    return pd.concat(frames.values(), ignore_index=True), failures
+
+
+def iter_csv_chunks(
+    filepath: PathLike, chunksize: int = 100_000, **read_kwargs: Any
+) -> Iterator[pd.DataFrame]:
+    """
+    Yields a standard CSV file as consecutive DataFrames of at most ``chunksize`` rows.
+
+    Args:
+        filepath (PathLike): The path to the input CSV file.
+        chunksize (int): Maximum number of rows per chunk.
+        **read_kwargs: Extra keyword arguments for ``pd.read_csv``.
+
+    Yields:
+        pd.DataFrame: The next chunk, indexed by its row numbers in the file.
+    """
+    with pd.read_csv(filepath, chunksize=chunksize, **read_kwargs) as reader:
+        yield from reader
+
+
+def process_csv_in_chunks(
+    input_path: PathLike,
+    analyze: Callable[[pd.DataFrame], pd.DataFrame],
+    output_path: PathLike,
+    chunksize: int = 100_000,
+    **read_kwargs: Any,
+) -> int:
+    """
+    Streams a CSV file through an analysis function into a processed CSV file.
+
+    Only one chunk is held in memory at a time, so peak memory depends on
+    ``chunksize`` and not on the length of the capture. This is exact for the
+    row-wise analyze functions (``analyze_thermal_data``, ``analyze_e_field_data``,
+    ``analyze_average_angle_deg``); as nothing else references a chunk, pass them
+    with ``copy=False`` via ``functools.partial`` to skip the per-chunk copy.
+
+    Args:
+        input_path (PathLike): The path to the raw, column-oriented CSV file.
+        analyze (Callable): Maps a raw chunk to its processed DataFrame.
+        output_path (PathLike): The path to the output CSV file. It is overwritten.
+        chunksize (int): Maximum number of rows per chunk.
+        **read_kwargs: Extra keyword arguments for ``pd.read_csv``.
+
+    Returns:
+        int: The number of processed rows written.
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    rows = 0
+    with open(output_path, "w", encoding="utf-8", newline="") as out:
+        chunks = iter_csv_chunks(input_path, chunksize, **read_kwargs)
+        for i, chunk in enumerate(chunks):
+            processed = analyze(chunk)
+            processed.to_csv(out, index=False, header=i == 0)
+            rows += len(processed)
+    file_event(
+        logger,
+        "process",
+        output_path,
+        "Processed %d rows from %s into: %s",
+        rows,
+        Path(input_path).name,
+        output_path,
+        seconds=time.perf_counter() - start,
+    )
+    return rows
+
+
+@dataclass
+class MissingDataReport:
+    """
+    Result of ``check_missing_data``.
+
+    Attributes:
+        name (str): The name of the checked DataFrame.
+        valid (bool): False if the object was not a non-empty DataFrame.
+        rows (int): Number of rows checked.
+        missing (Dict[str, int]): Number of missing values per column, for the
+            columns that have any, most missing first.
+    """
+
+    name: str
+    valid: bool = True
+    rows: int = 0
+    missing: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """True if the DataFrame is valid and has no missing values."""
+        return self.valid and not self.missing
+
+    def format(self) -> str:
+        """Formats the report as the multi-line data quality report."""
+        rule = "-" * (35 + len(self.name))
+        lines = [f"\n--- 🔬 Data Quality Report for: {self.name} ---"]
+        if not self.valid:
+            lines.append("Provided object is not a valid or non-empty DataFrame.")
+        elif not self.missing:
+            lines.append("✅ Excellent! No missing values found in any column.")
+        else:
+            lines.append(
+                "⚠️ Warning! Missing values detected in the following columns:"
+            )
+            width = max(len(str(column)) for column in self.missing)
+            lines += [
+                f"{str(column):<{width}}    {count}"
+                for column, count in self.missing.items()
+            ]
+        lines.append(rule)
+        return "\n".join(lines)
+
+
+def check_missing_data(
+    df: pd.DataFrame, df_name: str = "DataFrame"
+) -> MissingDataReport:
+    """
+    Checks for missing data in the DataFrame.
+
+    Missing values and invalid input are logged as a warning, a clean
+    DataFrame as info; ``MissingDataReport.format`` gives the full report.
 
     Args:
         df (pd.DataFrame): The DataFrame to check.
         df_name (str): The name of the DataFrame (for reporting purposes).
-    """
-    print(f"\n--- 🔬 Data Quality Report for: {df_name} ---")
 
+    Returns:
+        MissingDataReport: The columns with missing values and their counts.
+    """
     if not isinstance(df, pd.DataFrame) or df.empty:
-        print("Provided object is not a valid or non-empty DataFrame.")
-        print("-" * (35 + len(df_name)))
-        return
+        report = MissingDataReport(df_name, valid=False)
+        logger.warning("⚠️ %s is not a valid or non-empty DataFrame.", df_name)
+        return report
 
     missing_summary = df.isnull().sum()
-    reportable_missing = missing_summary[missing_summary > 0]
-
-    if reportable_missing.empty:
-        print("✅ Excellent! No missing values found in any column.")
+    # Sort to show columns with the most missing values first
+    reportable_missing = missing_summary[missing_summary > 0].sort_values(
+        ascending=False
+    )
+    report = MissingDataReport(
+        df_name,
+        rows=len(df),
+        missing={column: int(count) for column, count in reportable_missing.items()},
+    )
+    if report.missing:
+        columns = ", ".join(f"{c} ({n})" for c, n in report.missing.items())
+        logger.warning("⚠️ Missing values in %s: %s", df_name, columns)
     else:
-        print("⚠️ Warning! Missing values detected in the following columns:")
-        # Sort to show columns with the most missing values first
-        print(reportable_missing.sort_values(ascending=False))
-
-    print("-" * (35 + len(df_name)))
+        logger.info("✅ No missing values found in %s.", df_name)
+    return report
 
 
+@instrument("save")
 def save_processed_data(df: pd.DataFrame, filepath: PathLike) -> None:
     """
     Saves the processed DataFrame to a CSV file.
@@ -100,11 +620,28 @@ def save_processed_data(df: pd.DataFrame, filepath: PathLike) -> None:
         filepath (PathLike): The path to the output CSV file.
     """
     filepath = Path(filepath)
+    start = time.perf_counter()
     try:
         output_dir = filepath.parent
         output_dir.mkdir(parents=True, exist_ok=True)
 
         df.to_csv(filepath, index=True)
-        print(f"Processed data saved to: {filepath}")
     except Exception as e:
-        print(f"Error saving file {filepath}: {e}")
+        file_event(
+            logger,
+            "save",
+            filepath,
+            "Error saving file %s: %s",
+            filepath,
+            e,
+            level=logging.ERROR,
+        )
+        return
+    file_event(
+        logger,
+        "save",
+        filepath,
+        "Processed data saved to: %s",
+        filepath,
+        seconds=time.perf_counter() - start,
+    )
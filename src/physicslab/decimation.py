@@ -0,0 +1,153 @@
+# src/physicslab/decimation.py
+
+import numpy as np
+from numpy.typing import ArrayLike
+from typing import Tuple
+
+
+def _finite_sorted(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Indices of the finite points, ordered by x."""
+    idx = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+    if np.any(np.diff(x[idx]) < 0):
+        idx = idx[np.argsort(x[idx], kind="stable")]
+    return idx
+
+
+def lttb_indices(x: ArrayLike, y: ArrayLike, n_out: int) -> np.ndarray:
+    """
+    Selects points with the Largest-Triangle-Three-Buckets algorithm.
+
+    The points, ordered by x, are split into ``n_out - 2`` equal-count
+    buckets between the first and last point. From each bucket the point
+    forming the largest triangle with the previously selected point and the
+    mean of the next bucket is kept, which preserves the visual shape of the
+    curve, including its peaks, far better than striding.
+
+    Args:
+        x (ArrayLike): x values.
+        y (ArrayLike): y values.
+        n_out (int): Number of points to keep (at least 3).
+
+    Returns:
+        np.ndarray: Ascending indices of the selected points. Non-finite
+                    points are never selected.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    order = _finite_sorted(x, y)
+    n = len(order)
+    if n_out < 3:
+        raise ValueError(f"LTTB needs n_out >= 3, got {n_out}")
+    if n <= n_out:
+        return np.sort(order)
+
+    xs, ys = x[order], y[order]
+    # Bucket i spans edges[i]:edges[i + 1]; n > n_out keeps every bucket
+    # non-empty. The last point acts as the bucket after the last one.
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    next_start = edges[1:]
+    next_stop = np.append(edges[2:], n)
+
+    # Mean of every next bucket, from prefix sums
+    cx = np.concatenate([[0.0], np.cumsum(xs)])
+    cy = np.concatenate([[0.0], np.cumsum(ys)])
+    counts = next_stop - next_start
+    mean_x = (cx[next_stop] - cx[next_start]) / counts
+    mean_y = (cy[next_stop] - cy[next_start]) / counts
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        bx = xs[start:stop]
+        by = ys[start:stop]
+        # Twice the triangle area; the constant factor does not change argmax
+        area = np.abs(
+            (xs[a] - mean_x[i]) * (by - ys[a]) - (xs[a] - bx) * (mean_y[i] - ys[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return np.sort(order[selected])
+
+
+def minmax_indices(x: ArrayLike, y: ArrayLike, n_bins: int) -> np.ndarray:
+    """
+    Keeps the lowest and highest point of every equal-width x bin.
+
+    This is the envelope used by oscilloscope-style displays: every spike
+    survives, and the work is linear in the number of points.
+
+    Args:
+        x (ArrayLike): x values.
+        y (ArrayLike): y values.
+        n_bins (int): Number of x bins; at most ``2 * n_bins`` points are kept.
+
+    Returns:
+        np.ndarray: Ascending indices of the selected points. Non-finite
+                    points are never selected.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    idx = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+    if len(idx) <= 2 * n_bins:
+        return idx
+
+    xv, yv = x[idx], y[idx]
+    x_min, x_max = xv.min(), xv.max()
+    span = x_max - x_min
+    if span > 0:
+        bins = ((xv - x_min) * (n_bins / span)).astype(np.int64)
+        np.minimum(bins, n_bins - 1, out=bins)
+    else:
+        bins = np.zeros(len(xv), dtype=np.int64)
+    if n_bins <= np.iinfo(np.uint16).max:
+        # Small integer keys let the stable sort use a linear-time radix sort
+        bins = bins.astype(np.uint16)
+
+    order = np.argsort(bins, kind="stable")
+    sorted_bins = bins[order]
+    sorted_y = yv[order]
+    starts = np.flatnonzero(np.r_[True, sorted_bins[1:] != sorted_bins[:-1]])
+    sizes = np.diff(np.r_[starts, len(order)])
+
+    picks = []
+    for reduce in (np.minimum, np.maximum):
+        extreme = np.repeat(reduce.reduceat(sorted_y, starts), sizes)
+        hits = np.flatnonzero(sorted_y == extreme)
+        # First hit of every bin
+        first = np.r_[True, sorted_bins[hits[1:]] != sorted_bins[hits[:-1]]]
+        picks.append(order[hits[first]])
+    return idx[np.unique(np.concatenate(picks))]
+
+
+def decimate(
+    x: ArrayLike, y: ArrayLike, max_points: int, method: str = "lttb"
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduces a point cloud to at most ``max_points`` points for display.
+
+    Only use the result for drawing; fits and statistics should always be
+    computed from the full data.
+
+    Args:
+        x (ArrayLike): x values.
+        y (ArrayLike): y values.
+        max_points (int): Upper bound on the number of points returned.
+        method (str): "lttb" (shape-preserving) or "minmax" (envelope).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The x and y values of the kept points,
+                                       in their original order.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if method == "lttb":
+        idx = lttb_indices(x, y, max_points)
+    elif method == "minmax":
+        idx = minmax_indices(x, y, max_points // 2)
+    else:
+        raise ValueError(
+            f"Unknown decimation method {method!r}; choose 'lttb' or 'minmax'"
+        )
+    return x[idx], y[idx]
@@ -1,119 +1,199 @@
 # src/physicslab/e-beam_deflection_analysis/processing.py
 
-import os
-import pandas as pd
+from __future__ import annotations
+
 import numpy as np
-from scipy.optimize import curve_fit
 from pathlib import Path
-import matplotlib.pyplot as plt
-from physicslab.plot_utils import create_figure, save_figure
+from typing import TYPE_CHECKING, List, Mapping, Optional
+from physicslab.fitting import grouped_linear_fit
+from physicslab.plot_utils import (
+    FigureCache,
+    FigureTemplate,
+    OutputLike,
+    PlotSeries,
+    PlotSpec,
+    ProfileLike,
+    montage_from_frames,
+    render_plot,
+)
+from physicslab.tracing import instrument
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-def plot_D_Y_vs_V_d(processed_df: pd.DataFrame, output_dir: str | Path):
-    output_dir = Path(output_dir)
-    os.makedirs(output_dir, exist_ok=True)
-    df1 = processed_df.dropna(subset=["V2_V", "Vd_V", "Dy_mm"])
-    fig, ax1 = create_figure(
-        title="$D_Y$ - $V_d$ 直线图", xlabel="$V_d$ (mm)", ylabel="$D_Y$ (V)"
-    )
-    colors = plt.cm.tab10.colors
-    for idx, (v2_v, group) in enumerate(df1.groupby("V2_V")):
-        x = group["Vd_V"]
-        y = group["Dy_mm"]
-        ax1.scatter(x, y, color=colors[idx % len(colors)], label=rf"$V_2={{{v2_v}}}$")
-
-        def linear_func(x, k, b):
-            return k * x + b
-
-        try:
-            popt, _ = curve_fit(linear_func, x, y)
-            k, b = popt
-            x_fit = np.linspace(x.min(), x.max(), 100)
-            y_fit = linear_func(x_fit, k, b)
+
+D_Y_VS_V_D = PlotSpec(
+    title="$D_Y$ - $V_d$ 直线图",
+    xlabel="$V_d$ (mm)",
+    ylabel="$D_Y$ (V)",
+    filename="V_d_vs_D_Y.png",
+)
+
+D_B_VS_I = PlotSpec(
+    title="$D_B$ - $I$ 直线图",
+    xlabel="$I$ (mA)",
+    ylabel="$D_B$ (mm)",
+    filename="I_vs_D.png",
+)
+
+
+def _finite_rows(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    # Rows whose values in ``columns`` are all finite (neither NaN nor ±inf)
+    values = df[columns].to_numpy(dtype=float)
+    return df[np.isfinite(values).all(axis=1)]
+
+
+def _series_per_V2(
+    df: pd.DataFrame, x_col: str, y_col: str, equation: str
+) -> List[PlotSeries]:
+    """
+    Build one scatter series and fitted line per accelerating voltage V2.
+
+    ``equation`` is the legend template of the fitted line, with ``{k}`` and
+    ``{b}`` standing for the formatted slope and signed intercept.
+    """
+    from matplotlib import colormaps
+
+    colors = colormaps["tab10"].colors
+    fits = grouped_linear_fit(df, x=x_col, y=y_col, by="V2_V").set_index("V2_V")
+    series = []
+    for idx, (v2_v, group) in enumerate(df.groupby("V2_V")):
+        color = colors[idx % len(colors)]
+        item = PlotSeries(
+            group[x_col].to_numpy(),
+            group[y_col].to_numpy(),
+            color=color,
+            label=rf"$V_2={{{v2_v}}}$",
+            fit_color=color,
+        )
+
+        # Groups the fit could not use at all are missing from ``fits``
+        fit = fits.reindex([v2_v]).iloc[0]
+        if np.isfinite(fit["slope"]):
+            k, b = fit["slope"], fit["intercept"]
+            item.fit_x = np.linspace(fit["x_min"], fit["x_max"], 100)
+            item.fit_y = k * item.fit_x + b
             # Format legend with period as decimal separator and proper sign
             k_str = f"{k:.4f}".replace(",", ".")
             b_str = f"{b:+.4f}".replace(",", ".")
-            ax1.plot(
-                x_fit,
-                y_fit,
-                "-",
-                color=colors[idx % len(colors)],
-                label=rf"$V_d = {k_str} D_Y {b_str}$",
-            )
-        except Exception as e:
-            ax1.plot(
-                [],
-                [],
-                color=colors[idx % len(colors)],
-                label=rf"$V_2={{{v2_v}}}$ 拟合失败: {e}",
-            )
-    ax1.legend()
-    save_figure(fig, output_dir / "V_d_vs_D_Y.png")
-
-
-def plot_D_B_vs_I(processed_df: pd.DataFrame, output_dir: str | Path):
-    output_dir = Path(output_dir)
-    os.makedirs(output_dir, exist_ok=True)
-    df2 = processed_df.dropna(subset=["V2_V", "I_mA", "Db_mm"])
-    fig, ax2 = create_figure(
-        title="$D_B$ - $I$ 直线图", xlabel="$I$ (mA)", ylabel="$D_B$ (mm)"
+            item.fit_label = equation.format(k=k_str, b=b_str)
+        else:
+            item.fit_x, item.fit_y = np.array([]), np.array([])
+            item.fit_label = rf"$V_2={{{v2_v}}}$ 拟合失败: 有效数据点不足"
+        series.append(item)
+    return series
+
+
+def D_Y_vs_V_d_series(processed_df: pd.DataFrame) -> List[PlotSeries]:
+    """
+    Compute the data points and fitted lines of the D_Y vs V_d plot, one per V2.
+    """
+    df1 = _finite_rows(processed_df, ["V2_V", "Vd_V", "Dy_mm"])
+    return _series_per_V2(df1, "Vd_V", "Dy_mm", r"$V_d = {k} D_Y {b}$")
+
+
+def plot_D_Y_vs_V_d(
+    processed_df: pd.DataFrame,
+    output_dir: OutputLike,
+    profile: ProfileLike = None,
+    template: Optional[FigureTemplate] = None,
+    format: Optional[str] = None,
+    cache: Optional[FigureCache] = None,
+):
+    series = D_Y_vs_V_d_series(processed_df)
+    return render_plot(D_Y_VS_V_D, series, output_dir, profile, template, format, cache)
+
+
+def plot_D_Y_vs_V_d_montage(
+    processed_dfs: Mapping[str, pd.DataFrame],
+    output_dir: str | Path | None,
+    **montage_kwargs,
+) -> List[Path | bytes]:
+    """
+    Plot D_Y vs V_d for many submissions as paged montages.
+    """
+    return montage_from_frames(
+        D_Y_VS_V_D, D_Y_vs_V_d_series, processed_dfs, output_dir, **montage_kwargs
     )
-    colors = plt.cm.tab10.colors
-    for idx, (v2_v, group) in enumerate(df2.groupby("V2_V")):
-        x = group["I_mA"]
-        y = group["Db_mm"]
-        ax2.scatter(x, y, color=colors[idx % len(colors)], label=rf"$V_2={{{v2_v}}}$")
-
-        def linear_func(x, k, b):
-            return k * x + b
-
-        try:
-            popt, _ = curve_fit(linear_func, x, y)
-            k, b = popt
-            x_fit = np.linspace(x.min(), x.max(), 100)
-            y_fit = linear_func(x_fit, k, b)
-            # Format legend with period as decimal separator and proper sign
-            k_str = f"{k:.4f}".replace(",", ".")
-            b_str = f"{b:+.4f}".replace(",", ".")
-            ax2.plot(
-                x_fit,
-                y_fit,
-                "-",
-                color=colors[idx % len(colors)],
-                label=rf"$D = {k_str} I {b_str}$",
-            )
-        except Exception as e:
-            ax2.plot(
-                [],
-                [],
-                color=colors[idx % len(colors)],
-                label=rf"$V_2={{{v2_v}}}$ 拟合失败: {e}",
-            )
-    ax2.legend()
-    save_figure(fig, output_dir / "I_vs_D.png")
-
-
-def count_mass_to_charge_ratio(processed_df: pd.DataFrame) -> None:
+
+
+def D_B_vs_I_series(processed_df: pd.DataFrame) -> List[PlotSeries]:
+    """
+    Compute the data points and fitted lines of the D_B vs I plot, one per V2.
+    """
+    df2 = _finite_rows(processed_df, ["V2_V", "I_mA", "Db_mm"])
+    return _series_per_V2(df2, "I_mA", "Db_mm", r"$D = {k} I {b}$")
+
+
+def plot_D_B_vs_I(
+    processed_df: pd.DataFrame,
+    output_dir: OutputLike,
+    profile: ProfileLike = None,
+    template: Optional[FigureTemplate] = None,
+    format: Optional[str] = None,
+    cache: Optional[FigureCache] = None,
+):
+    series = D_B_vs_I_series(processed_df)
+    return render_plot(D_B_VS_I, series, output_dir, profile, template, format, cache)
+
+
+def plot_D_B_vs_I_montage(
+    processed_dfs: Mapping[str, pd.DataFrame],
+    output_dir: str | Path | None,
+    **montage_kwargs,
+) -> List[Path | bytes]:
+    """
+    Plot D_B vs I for many submissions as paged montages.
+    """
+    return montage_from_frames(
+        D_B_VS_I, D_B_vs_I_series, processed_dfs, output_dir, **montage_kwargs
+    )
+
+
+@instrument("analyze")
+def count_mass_to_charge_ratio(
+    processed_df: pd.DataFrame,
+    L_N: float = 0.234,
+    N: int = 1550,
+    D_N: float = 0.090,
+    h: float = 0.145,
+    session_col: str = "session",
+) -> pd.DataFrame:
     """
-    Calculate the mass-to-charge ratio of the electron for each $V_2$ value in the DataFrame.
+    Calculate the electron charge-to-mass ratio e/m for every row of magnetic focusing data.
+
+    The computation is column-wise, so several sessions can be stacked into one
+    DataFrame and evaluated together; rows are kept in input order.
 
     Args:
-        processed_df (pd.DataFrame): DataFrame containing columns 'V_V' and 'I_avg_A'.
+        processed_df (pd.DataFrame): DataFrame containing columns 'V_V' and 'I_avg_A',
+                                     and optionally a session id column.
+        L_N (float): Solenoid length in m.
+        N (int): Number of solenoid turns.
+        D_N (float): Solenoid diameter in m.
+        h (float): Distance from the focusing point to the screen in m
+                   (h_Y by default, adjust if needed).
+        session_col (str): Name of the session id column. It is carried over
+                           to the result when present in ``processed_df``.
 
     Returns:
-        list[dict]: List of dicts with keys 'V_2', 'I_avg', and 'em_ratio'.
+        pd.DataFrame: float64 columns 'V_2', 'I_avg' and 'em_ratio' (C/kg),
+                      preceded by ``session_col`` for multi-session input.
     """
+    import pandas as pd
+
     mu_0 = 4 * np.pi * 1e-7  # Vacuum permeability (H/m)
-    L_N = 0.234  # m
-    N = 1550
-    D_N = 0.090  # m
-    h = 0.145  # m (use h_Y as default, adjust if needed)
-    results = []
-    for _, row in processed_df.iterrows():
-        V_2 = float(row["V_V"])
-        I_avg = float(row["I_avg_A"])
-        numerator = 8 * np.pi**2 * V_2 * (L_N**2 + D_N**2)
-        denominator = mu_0**2 * N**2 * h**2 * I_avg**2
-        em_ratio = numerator / denominator
-        results.append({"V_2": V_2, "I_avg": I_avg, "em_ratio": em_ratio})
-    return results
+    V_2 = pd.to_numeric(processed_df["V_V"], errors="coerce").to_numpy(dtype=np.float64)
+    I_avg = pd.to_numeric(processed_df["I_avg_A"], errors="coerce").to_numpy(
+        dtype=np.float64
+    )
+
+    numerator = 8 * np.pi**2 * (L_N**2 + D_N**2) * V_2
+    denominator = mu_0**2 * N**2 * h**2 * I_avg**2
+    result = pd.DataFrame(
+        {"V_2": V_2, "I_avg": I_avg, "em_ratio": numerator / denominator},
+        index=processed_df.index,
+    )
+    if session_col in processed_df.columns:
+        result.insert(0, session_col, processed_df[session_col])
+    return result
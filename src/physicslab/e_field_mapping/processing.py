@@ -1,24 +1,42 @@
 # src/physicslab/e_field_mapping/processing.py
 
-import os
-import pandas as pd
+from __future__ import annotations
+
 import numpy as np
-from scipy.optimize import curve_fit
 from pathlib import Path
-from physicslab.plot_utils import create_figure, save_figure
+from typing import TYPE_CHECKING, List, Mapping, Optional
+from physicslab.fitting import linear_fit
+from physicslab.plot_utils import (
+    FigureCache,
+    FigureTemplate,
+    OutputLike,
+    PlotSeries,
+    PlotSpec,
+    ProfileLike,
+    fit_line,
+    montage_from_frames,
+    render_plot,
+)
+from physicslab.tracing import instrument
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
-def analyze_e_field_data(raw_df: pd.DataFrame) -> pd.DataFrame:
+@instrument("analyze")
+def analyze_e_field_data(raw_df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
     """
     Analyze electric field mapping data to compute necessary parameters.
 
     Parameters:
     raw_df (pd.DataFrame): DataFrame containing raw data with columns 'X', 'Y', 'V'.
+    copy (bool): Work on a copy of raw_df. Pass False to add the columns in place,
+                 e.g. for chunks that nothing else holds on to.
 
     Returns:
     pd.DataFrame: DataFrame with computed electric field parameters.
     """
-    df = raw_df.copy()
+    df = raw_df.copy() if copy else raw_df
 
     # For equipotential mapping data
     d_cols = [f"d{i}_cm" for i in range(1, 6)]
@@ -41,33 +59,27 @@ def analyze_e_field_data(raw_df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def plot_V_r_over_V_B_vs_ln_r_over_ln_7(
-    processed_df: pd.DataFrame, output_dir: str | Path
-):
+V_R_OVER_V_B_VS_LN_R_OVER_LN_7 = PlotSpec(
+    title="$V_r/V_B$ - $log(\\bar{r})/log(7)$ 直线图",
+    xlabel=r"$log(\bar{r})/log(7)$",
+    ylabel=r"$V_r/V_B$",
+    filename="V_R_over_V_B_vs_ln_r_over_ln_7.png",
+)
+
+
+def V_r_over_V_B_vs_ln_r_over_ln_7_series(
+    processed_df: pd.DataFrame,
+) -> List[PlotSeries]:
     """
-    Plot V_R/V_B vs ln(r)/ln(7) and save the figure.
+    Compute the data points and fitted line of the V_R/V_B vs ln(r)/ln(7) plot.
     """
-    output_dir = Path(output_dir)
-    os.makedirs(output_dir, exist_ok=True)
-
     df1 = processed_df.dropna(subset=["V_R_over_V_B", "ln_r_over_ln_7"])
-    x1 = df1["ln_r_over_ln_7"]
-    y1 = df1["V_R_over_V_B"]
-
-    fig, ax1 = create_figure(
-        title="$V_r/V_B$ - $log(\\bar{r})/log(7)$ 直线图",
-        xlabel=r"$log(\bar{r})/log(7)$",
-        ylabel=r"$V_r/V_B$",
-    )
-    ax1.scatter(x1, y1, color="b", label="实验数据")
-
-    def linear_func(x, k, b):
-        return k * x + b
+    x1 = df1["ln_r_over_ln_7"].to_numpy()
+    y1 = df1["V_R_over_V_B"].to_numpy()
 
-    popt, pcov = curve_fit(linear_func, x1, y1)
-    k, b = popt
-    x_fit = np.linspace(x1.min(), x1.max(), 100)
-    y_fit = linear_func(x_fit, k, b)
+    fit = linear_fit(x1, y1)
+    k, b = fit.slope, fit.intercept
+    x_fit, y_fit = fit_line(x1, fit)
 
     def format_float(val):
         s = f"{val:+.2f}"
@@ -77,11 +89,54 @@ def plot_V_r_over_V_B_vs_ln_r_over_ln_7(
 
     k_str = f"{k:.4f}".replace(",", ".")
     b_str = format_float(b)
-    ax1.plot(
-        x_fit,
-        y_fit,
-        "r-",
-        label=rf"拟合: $V_R/V_B = {k_str} \cdot \log({{r}})/\log(7) {b_str}$",
+    return [
+        PlotSeries(
+            x1,
+            y1,
+            color="b",
+            label="实验数据",
+            fit_x=x_fit,
+            fit_y=y_fit,
+            fit_label=rf"拟合: $V_R/V_B = {k_str} \cdot \log({{r}})/\log(7) {b_str}$",
+        )
+    ]
+
+
+def plot_V_r_over_V_B_vs_ln_r_over_ln_7(
+    processed_df: pd.DataFrame,
+    output_dir: OutputLike,
+    profile: ProfileLike = None,
+    template: Optional[FigureTemplate] = None,
+    format: Optional[str] = None,
+    cache: Optional[FigureCache] = None,
+):
+    """
+    Plot V_R/V_B vs ln(r)/ln(7) and save the figure.
+    """
+    series = V_r_over_V_B_vs_ln_r_over_ln_7_series(processed_df)
+    return render_plot(
+        V_R_OVER_V_B_VS_LN_R_OVER_LN_7,
+        series,
+        output_dir,
+        profile,
+        template,
+        format,
+        cache,
+    )
+
+
+def plot_V_r_over_V_B_vs_ln_r_over_ln_7_montage(
+    processed_dfs: Mapping[str, pd.DataFrame],
+    output_dir: str | Path | None,
+    **montage_kwargs,
+) -> List[Path | bytes]:
+    """
+    Plot V_R/V_B vs ln(r)/ln(7) for many submissions as paged montages.
+    """
+    return montage_from_frames(
+        V_R_OVER_V_B_VS_LN_R_OVER_LN_7,
+        V_r_over_V_B_vs_ln_r_over_ln_7_series,
+        processed_dfs,
+        output_dir,
+        **montage_kwargs,
     )
-    ax1.legend()
-    save_figure(fig, output_dir / "V_R_over_V_B_vs_ln_r_over_ln_7.png")
@@ -0,0 +1,326 @@
+# src/physicslab/fitting.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Sequence, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from physicslab.tracing import instrument
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@dataclass(frozen=True)
+class LinearFitResult:
+    """
+    Result of a straight-line fit ``y = slope * x + intercept``.
+
+    Every attribute has the batch shape of the input (a scalar for a single
+    dataset); ``cov`` carries two extra trailing axes ordered
+    ``(slope, intercept)``, matching ``popt``/``pcov`` from ``curve_fit``.
+    """
+
+    slope: np.ndarray
+    intercept: np.ndarray
+    slope_err: np.ndarray
+    intercept_err: np.ndarray
+    cov: np.ndarray
+    r_squared: np.ndarray
+    n: np.ndarray
+
+    def __call__(self, x: ArrayLike) -> np.ndarray:
+        """Evaluate the fitted line(s) at ``x``."""
+        x = np.asarray(x, dtype=float)
+        if np.ndim(self.slope) == 0:
+            return self.slope * x + self.intercept
+        return self.slope[..., np.newaxis] * x + self.intercept[..., np.newaxis]
+
+
+def _solve_moments(
+    n: np.ndarray,
+    sum_w: np.ndarray,
+    x_mean: np.ndarray,
+    y_mean: np.ndarray,
+    sxx: np.ndarray,
+    sxy: np.ndarray,
+    syy: np.ndarray,
+    absolute_sigma: bool,
+) -> LinearFitResult:
+    """
+    Closed-form least-squares solution from (weighted) centred moments.
+
+    ``sxx``, ``sxy`` and ``syy`` are the weighted sums of centred products,
+    e.g. ``sxx = sum(w * (x - x_mean) ** 2)``. Groups with fewer than two
+    points or no spread in x yield NaN rather than raising.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = sxy / sxx
+        intercept = y_mean - slope * x_mean
+        chi2 = np.clip(syy - slope * sxy, 0.0, None)
+
+        var_slope = 1.0 / sxx
+        var_intercept = 1.0 / sum_w + x_mean**2 / sxx
+        covariance = -x_mean / sxx
+        if not absolute_sigma:
+            # Same scaling as curve_fit: residual variance per degree of freedom
+            scale = np.where(n > 2, chi2 / (n - 2), np.inf)
+            var_slope = var_slope * scale
+            var_intercept = var_intercept * scale
+            covariance = covariance * scale
+
+        r_squared = np.where(syy > 0, 1.0 - chi2 / syy, np.nan)
+
+    degenerate = (n < 2) | ~(sxx > 0)
+    slope = np.where(degenerate, np.nan, slope)
+    intercept = np.where(degenerate, np.nan, intercept)
+    var_slope = np.where(degenerate, np.nan, var_slope)
+    var_intercept = np.where(degenerate, np.nan, var_intercept)
+    covariance = np.where(degenerate, np.nan, covariance)
+    r_squared = np.where(degenerate, np.nan, r_squared)
+
+    cov = np.stack(
+        [
+            np.stack([var_slope, covariance], axis=-1),
+            np.stack([covariance, var_intercept], axis=-1),
+        ],
+        axis=-2,
+    )
+    return LinearFitResult(
+        slope=slope,
+        intercept=intercept,
+        slope_err=np.sqrt(var_slope),
+        intercept_err=np.sqrt(var_intercept),
+        cov=cov,
+        r_squared=r_squared,
+        n=n,
+    )
+
+
+@instrument("fit")
+def linear_fit(
+    x: ArrayLike,
+    y: ArrayLike,
+    sigma: Optional[ArrayLike] = None,
+    absolute_sigma: bool = False,
+) -> LinearFitResult:
+    """
+    Fit ``y = slope * x + intercept`` by closed-form least squares.
+
+    The last axis holds the samples of one dataset; any leading axes are
+    treated as a batch, so a ``(n_datasets, n_points)`` array is fitted in a
+    single vectorised pass. Datasets of unequal length can be stacked by
+    padding with NaN: non-finite samples are excluded from their own fit.
+
+    Args:
+        x (ArrayLike): Independent variable, broadcastable against ``y``.
+        y (ArrayLike): Dependent variable.
+        sigma (ArrayLike, optional): Standard deviation of each ``y`` sample.
+            The fit is weighted by ``1 / sigma**2``, as in ``curve_fit``.
+        absolute_sigma (bool): If True, ``sigma`` is taken as absolute and the
+            covariance is not rescaled by the reduced chi-square.
+
+    Returns:
+        LinearFitResult: Slope, intercept, standard errors, covariance and R²
+                         for every dataset in the batch.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    x, y = np.broadcast_arrays(x, y)
+
+    if sigma is None:
+        w = np.ones_like(y)
+    else:
+        w = np.broadcast_to(1.0 / np.asarray(sigma, dtype=float) ** 2, y.shape)
+
+    valid = np.isfinite(x) & np.isfinite(y) & np.isfinite(w)
+    w = np.where(valid, w, 0.0)
+    x = np.where(valid, x, 0.0)
+    y = np.where(valid, y, 0.0)
+
+    n = valid.sum(axis=-1)
+    sum_w = w.sum(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_mean = (w * x).sum(axis=-1) / sum_w
+        y_mean = (w * y).sum(axis=-1) / sum_w
+
+    # Centre before forming the products to avoid cancellation in sum(x**2)
+    dx = np.where(valid, x - x_mean[..., np.newaxis], 0.0)
+    dy = np.where(valid, y - y_mean[..., np.newaxis], 0.0)
+    sxx = (w * dx * dx).sum(axis=-1)
+    sxy = (w * dx * dy).sum(axis=-1)
+    syy = (w * dy * dy).sum(axis=-1)
+
+    return _solve_moments(n, sum_w, x_mean, y_mean, sxx, sxy, syy, absolute_sigma)
+
+
+@instrument("fit")
+def grouped_linear_fit(
+    df: pd.DataFrame,
+    x: str,
+    y: str,
+    by: Union[str, Sequence[str]],
+    sigma: Optional[str] = None,
+    absolute_sigma: bool = False,
+) -> pd.DataFrame:
+    """
+    Fit a straight line to every group of a long-format DataFrame at once.
+
+    Instead of looping over ``df.groupby(by)``, the per-group sufficient
+    statistics (n, sums of weights, x, y and the centred products) are built
+    with segmented reductions over integer group codes, and all groups are
+    solved together by the same closed form as ``linear_fit``.
+
+    Args:
+        df (pd.DataFrame): Long-format data, e.g. several students' deflection
+            tables stacked with a session column.
+        x (str): Column holding the independent variable.
+        y (str): Column holding the dependent variable.
+        by (str | Sequence[str]): Column(s) identifying a group.
+        sigma (str, optional): Column holding the standard deviation of ``y``.
+        absolute_sigma (bool): See ``linear_fit``.
+
+    Returns:
+        pd.DataFrame: One row per group, sorted by the group keys, with the
+                      key column(s) followed by 'n', 'slope', 'slope_err',
+                      'intercept', 'intercept_err', 'r_squared', 'x_min' and
+                      'x_max'. Groups that cannot be fitted get NaN.
+    """
+    keys = [by] if isinstance(by, str) else list(by)
+    columns = [x, y] if sigma is None else [x, y, sigma]
+    data = df[keys + columns]
+    finite = np.isfinite(data[columns].to_numpy(dtype=float)).all(axis=1)
+    data = data[finite & data[keys].notna().all(axis=1).to_numpy()]
+
+    grouper = data.groupby(keys, sort=True)
+    codes = grouper.ngroup().to_numpy()
+    counts = grouper.size()
+    n_groups = len(counts)
+
+    xv = data[x].to_numpy(dtype=float)
+    yv = data[y].to_numpy(dtype=float)
+    if sigma is None:
+        w = np.ones_like(xv)
+    else:
+        w = 1.0 / data[sigma].to_numpy(dtype=float) ** 2
+
+    def segment_sum(values: np.ndarray) -> np.ndarray:
+        return np.bincount(codes, weights=values, minlength=n_groups)
+
+    n = np.bincount(codes, minlength=n_groups)
+    sum_w = segment_sum(w)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_mean = segment_sum(w * xv) / sum_w
+        y_mean = segment_sum(w * yv) / sum_w
+
+    # Second pass on centred values keeps sum(x**2) free of cancellation
+    dx = xv - x_mean[codes]
+    dy = yv - y_mean[codes]
+    fit = _solve_moments(
+        n,
+        sum_w,
+        x_mean,
+        y_mean,
+        segment_sum(w * dx * dx),
+        segment_sum(w * dx * dy),
+        segment_sum(w * dy * dy),
+        absolute_sigma,
+    )
+
+    result = counts.index.to_frame(index=False)
+    result["n"] = n
+    result["slope"] = fit.slope
+    result["slope_err"] = fit.slope_err
+    result["intercept"] = fit.intercept
+    result["intercept_err"] = fit.intercept_err
+    result["r_squared"] = fit.r_squared
+    result["x_min"] = grouper[x].min().to_numpy()
+    result["x_max"] = grouper[x].max().to_numpy()
+    return result
+
+
+class OnlineLinearFit:
+    """
+    Incremental straight-line fit for live acquisition.
+
+    Keeps Welford-style running means and centred co-moments, so each new
+    sample costs O(1) and the fit, with the same standard errors as
+    ``linear_fit``, can be read at any moment without revisiting the history.
+    Non-finite samples are ignored.
+    """
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.sxx = 0.0
+        self.sxy = 0.0
+        self.syy = 0.0
+
+    def update(self, x: float, y: float) -> None:
+        """Adds one sample."""
+        if not (np.isfinite(x) and np.isfinite(y)):
+            return
+        self.n += 1
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x += dx / self.n
+        self.mean_y += dy / self.n
+        self.sxx += dx * (x - self.mean_x)
+        self.sxy += dx * (y - self.mean_y)
+        self.syy += dy * (y - self.mean_y)
+
+    def update_many(self, x: ArrayLike, y: ArrayLike) -> None:
+        """Adds a block of samples, merging its moments in one vectorised step."""
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        valid = np.isfinite(x) & np.isfinite(y)
+        x, y = x[valid], y[valid]
+        n_b = len(x)
+        if n_b == 0:
+            return
+
+        mean_xb, mean_yb = x.mean(), y.mean()
+        dxb, dyb = x - mean_xb, y - mean_yb
+        n = self.n + n_b
+        dx = mean_xb - self.mean_x
+        dy = mean_yb - self.mean_y
+        factor = self.n * n_b / n
+        self.sxx += dxb @ dxb + dx * dx * factor
+        self.sxy += dxb @ dyb + dx * dy * factor
+        self.syy += dyb @ dyb + dy * dy * factor
+        self.mean_x += dx * n_b / n
+        self.mean_y += dy * n_b / n
+        self.n = n
+
+    def result(self) -> LinearFitResult:
+        """Returns the fit over all samples seen so far."""
+        return _solve_moments(
+            np.asarray(self.n),
+            np.asarray(float(self.n)),
+            np.asarray(self.mean_x),
+            np.asarray(self.mean_y),
+            np.asarray(self.sxx),
+            np.asarray(self.sxy),
+            np.asarray(self.syy),
+            absolute_sigma=False,
+        )
+
+    @property
+    def slope(self) -> float:
+        return float(self.result().slope)
+
+    @property
+    def intercept(self) -> float:
+        return float(self.result().intercept)
+
+    @property
+    def slope_err(self) -> float:
+        return float(self.result().slope_err)
+
+    @property
+    def intercept_err(self) -> float:
+        return float(self.result().intercept_err)
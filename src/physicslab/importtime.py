@@ -0,0 +1,187 @@
+# src/physicslab/importtime.py
+
+# Cold-start import budgets for the physicslab modules.
+#
+# Each module is imported in a fresh interpreter with `python -X importtime`
+# and the cumulative import time reported for it is compared against its
+# budget. A budget also lists heavy packages the module must not pull in at
+# import time; they are loaded by the functions that need them.
+#
+# Run `python -m physicslab.importtime` to print the report; the exit status
+# is non-zero when a budget is exceeded.
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+HEAVY = ("pandas", "matplotlib", "scipy")
+
+
+@dataclass(frozen=True)
+class ImportBudget:
+    """
+    Import-time budget of one module.
+
+    Attributes:
+    - ms (float): Largest acceptable cumulative import time, in milliseconds,
+      measured as the median of several cold imports.
+    - forbid (Tuple[str, ...]): Top-level packages the module must not import.
+    """
+
+    ms: float
+    forbid: Tuple[str, ...] = HEAVY
+
+
+# Budgets hold on a laptop-class machine with roughly 2x headroom. Modules
+# that only compute stay at the cost of NumPy (~80 ms); only the data I/O
+# layer may load pandas up front.
+IMPORT_BUDGETS: Dict[str, ImportBudget] = {
+    "physicslab.cache": ImportBudget(40),
+    "physicslab.logs": ImportBudget(60),
+    "physicslab.tracing": ImportBudget(60),
+    "physicslab.registry": ImportBudget(60),
+    "physicslab.cli": ImportBudget(60),
+    "physicslab.build": ImportBudget(80),
+    "physicslab.decimation": ImportBudget(200),
+    "physicslab.synthetic": ImportBudget(200),
+    "physicslab.benchmark": ImportBudget(200),
+    "physicslab.fitting": ImportBudget(200),
+    "physicslab.plot_utils": ImportBudget(200),
+    "physicslab.render_pool": ImportBudget(250),
+    "physicslab.thermal_resistor.live": ImportBudget(200),
+    "physicslab.thermal_resistor.processing": ImportBudget(200),
+    "physicslab.e_beam_deflection_analysis.processing": ImportBudget(200),
+    "physicslab.e_field_mapping.processing": ImportBudget(200),
+    "physicslab.sucrose_polarimetry.processing": ImportBudget(200),
+    "physicslab.viscosity_measurement.processing": ImportBudget(200),
+    "physicslab.data_utils": ImportBudget(700, forbid=("matplotlib", "scipy")),
+}
+
+# "import time: self [us] | cumulative | imported package"
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass
+class ImportTiming:
+    """
+    Measured import of one module.
+
+    Attributes:
+    - module (str): The module.
+    - ms (float): Median cumulative import time in milliseconds.
+    - imported (Dict[str, float]): Cumulative time in milliseconds of every
+      top-level package imported along the way, from the last run.
+    """
+
+    module: str
+    ms: float
+    imported: Dict[str, float]
+
+
+def parse_importtime(stderr: str) -> Dict[str, float]:
+    """
+    Parse the ``-X importtime`` report into cumulative times per module.
+
+    Parameters:
+    - stderr (str): The interpreter's standard error.
+
+    Returns:
+    - Dict[str, float]: Cumulative import time in milliseconds by module name.
+    """
+    times: Dict[str, float] = {}
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            times[match.group(4)] = int(match.group(2)) / 1000
+    return times
+
+
+def measure_import(module: str, runs: int = 5) -> ImportTiming:
+    """
+    Import a module in fresh interpreters and time it.
+
+    Parameters:
+    - module (str): Dotted module name.
+    - runs (int): Number of cold imports; the median is reported.
+
+    Returns:
+    - ImportTiming: The timing.
+    """
+    env = dict(os.environ)
+    src = str(Path(__file__).resolve().parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+
+    samples: List[float] = []
+    times: Dict[str, float] = {}
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            raise ImportError(f"Cannot import {module}:\n{proc.stderr[-2000:]}")
+        times = parse_importtime(proc.stderr)
+        samples.append(times.get(module, 0.0))
+
+    imported = {name: ms for name, ms in times.items() if "." not in name}
+    return ImportTiming(module, statistics.median(samples), imported)
+
+
+def check_budgets(
+    budgets: Optional[Dict[str, ImportBudget]] = None,
+    modules: Optional[Sequence[str]] = None,
+    runs: int = 5,
+) -> List[Tuple[ImportTiming, ImportBudget, List[str]]]:
+    """
+    Measure modules against their import budgets and print a report.
+
+    Parameters:
+    - budgets (Optional[Dict[str, ImportBudget]]): Defaults to IMPORT_BUDGETS.
+    - modules (Optional[Sequence[str]]): Subset of the budgeted modules.
+    - runs (int): Cold imports per module.
+
+    Returns:
+    - List[Tuple[ImportTiming, ImportBudget, List[str]]]: Per module, the
+      timing, the budget and the problems found (empty when within budget).
+    """
+    budgets = budgets or IMPORT_BUDGETS
+    results = []
+    for module in modules or list(budgets):
+        budget = budgets[module]
+        timing = measure_import(module, runs)
+        problems = [
+            f"imports {name}" for name in budget.forbid if name in timing.imported
+        ]
+        if timing.ms > budget.ms:
+            problems.append(f"{timing.ms:.0f} ms > {budget.ms:.0f} ms budget")
+        results.append((timing, budget, problems))
+
+        status = "✅" if not problems else "❌"
+        print(
+            f"{status} {module:<50} {timing.ms:7.1f} ms / {budget.ms:5.0f} ms"
+            + (f"  ({'; '.join(problems)})" if problems else "")
+        )
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Check physicslab cold-start import times against budgets."
+    )
+    parser.add_argument("modules", nargs="*", help="modules to check (default: all)")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    results = check_budgets(modules=args.modules or None, runs=args.runs)
+    return 1 if any(problems for _, _, problems in results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,179 @@
+# src/physicslab/logs.py
+
+import heapq
+import logging
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Dict, Iterator, List, Optional, Tuple, Union
+
+LOGGER_NAME = "physicslab"
+
+
+def configure_logging(
+    level: Union[int, str] = logging.INFO, stream: Optional[IO[str]] = None
+) -> logging.Handler:
+    """
+    Show the library's messages on the console, as plain lines.
+
+    The library only logs; scripts and the command line call this once at
+    start-up. Calling it again replaces the handler it installed before.
+
+    Parameters:
+    - level (int | str): Lowest level shown, e.g. logging.INFO or "WARNING".
+    - stream (Optional[IO[str]]): Where to write; standard output by default.
+
+    Returns:
+    - logging.Handler: The installed handler.
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in list(logger.handlers):
+        if getattr(handler, "_physicslab_console", False):
+            logger.removeHandler(handler)
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    handler._physicslab_console = True  # type: ignore[attr-defined]
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    return handler
+
+
+def file_event(
+    logger: logging.Logger,
+    event: str,
+    filepath: Union[str, Path, None],
+    message: str,
+    *args: object,
+    seconds: Optional[float] = None,
+    level: int = logging.INFO,
+) -> None:
+    """
+    Log something that happened to one file, e.g. a load, save or figure.
+
+    Parameters:
+    - logger (logging.Logger): The module's logger.
+    - event (str): Kind of event, e.g. "load", "save" or "figure".
+    - filepath (str | Path | None): The file; None for in-memory targets.
+    - message (str): The message, with %-style placeholders for args.
+    - args (object): Values for the placeholders.
+    - seconds (Optional[float]): How long the operation took.
+    - level (int): Log level; ERROR and above count as failures in batch mode.
+    """
+    if logger.isEnabledFor(level):
+        path = "<memory>" if filepath is None else str(filepath)
+        extra = {"event": event, "path": path, "seconds": seconds}
+        logger.log(level, message, *args, extra=extra)
+
+
+@dataclass
+class BatchReport:
+    """
+    Aggregate of the events buffered in batch mode.
+
+    Attributes:
+    - counts (Dict[str, int]): Number of events by kind, e.g. {"load": 120}.
+    - failures (List[Tuple[str, str]]): (path, message) of every error.
+    - warnings (List[Tuple[str, str]]): (path, message) of every warning.
+    - slowest (List[Tuple[float, str, str]]): (seconds, event, path) of the
+      slowest timed events, slowest first.
+    """
+
+    counts: Dict[str, int] = field(default_factory=dict)
+    failures: List[Tuple[str, str]] = field(default_factory=list)
+    warnings: List[Tuple[str, str]] = field(default_factory=list)
+    slowest: List[Tuple[float, str, str]] = field(default_factory=list)
+
+    def format(self) -> str:
+        """The report as text, as printed at the end of batch mode."""
+        total = sum(self.counts.values())
+        counts = ", ".join(f"{count} {event}" for event, count in self.counts.items())
+        lines = [
+            "\n--- 📋 Batch summary ---",
+            f"{total} events ({counts or 'none'}): "
+            f"{len(self.failures)} failed, {len(self.warnings)} warnings",
+        ]
+        if self.slowest:
+            lines.append("Slowest:")
+            lines += [
+                f"  {seconds:8.3f} s  {event:<8} {path}"
+                for seconds, event, path in self.slowest
+            ]
+        # Messages name their file; tracebacks are cut to the exception line
+        for _, message in self.warnings + self.failures:
+            message_lines = message.strip().splitlines()
+            if len(message_lines) > 1:
+                message_lines = [message_lines[0], message_lines[-1].strip()]
+            lines.append(" ".join(message_lines))
+        return "\n".join(lines)
+
+
+class BatchCollector(logging.Handler):
+    """
+    Logging handler that aggregates events instead of writing them.
+
+    Only counts, warnings, failures and the ``slowest`` timed events are
+    kept, so memory does not grow with the number of files.
+    """
+
+    def __init__(self, slowest: int = 10) -> None:
+        super().__init__(logging.DEBUG)
+        self.report = BatchReport()
+        self._slowest = slowest
+        self._heap: List[Tuple[float, int, str, str]] = []
+        self._seen = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        event = getattr(record, "event", "message")
+        path = getattr(record, "path", record.name)
+        seconds = getattr(record, "seconds", None)
+        self.report.counts[event] = self.report.counts.get(event, 0) + 1
+        if record.levelno >= logging.ERROR:
+            self.report.failures.append((path, record.getMessage()))
+        elif record.levelno >= logging.WARNING:
+            self.report.warnings.append((path, record.getMessage()))
+        if seconds is not None and self._slowest > 0:
+            self._seen += 1
+            item = (seconds, self._seen, event, path)
+            if len(self._heap) < self._slowest:
+                heapq.heappush(self._heap, item)
+            else:
+                heapq.heappushpop(self._heap, item)
+
+    def summary(self) -> BatchReport:
+        """The aggregate of the events so far."""
+        self.report.slowest = [
+            (seconds, event, path)
+            for seconds, _, event, path in sorted(self._heap, reverse=True)
+        ]
+        return self.report
+
+
+@contextmanager
+def batch_mode(slowest: int = 10) -> Iterator[BatchCollector]:
+    """
+    Buffer the library's per-file messages and print one summary at the end.
+
+    Inside the block nothing is written per file; afterwards the counts per
+    kind of event, every warning and failure, and the slowest files are
+    printed. Events logged by worker processes are not collected.
+
+    Parameters:
+    - slowest (int): Number of slowest files to list.
+
+    Returns:
+    - Iterator[BatchCollector]: Yields the collector; its summary() can be
+      inspected after the block.
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    collector = BatchCollector(slowest)
+    saved = (logger.handlers[:], logger.propagate, logger.level)
+    logger.handlers = [collector]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    try:
+        yield collector
+    finally:
+        logger.handlers, logger.propagate, level = saved
+        logger.setLevel(level)
+        print(collector.summary().format())
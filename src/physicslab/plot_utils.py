@@ -1,24 +1,204 @@
 # src/physicslab/plot_utils.py
 
-import matplotlib.pyplot as plt
-from typing import Tuple
-import matplotlib.font_manager as fm
+# Matplotlib is imported inside the functions that draw, so that importing
+# this module (and every experiment module, for its plot specs) stays cheap
+# for callers that only compute.
+from __future__ import annotations
 
+import io
+import logging
+import os
+import shutil
+import time
+import numpy as np
+from dataclasses import dataclass
+from numpy.typing import ArrayLike
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from physicslab.cache import LRUDirectory, combine_digest
+from physicslab.decimation import decimate
+from physicslab.logs import file_event
+from physicslab.tracing import instrument
 
-def setup_plot_style() -> None:
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LargeDataPolicy:
+    """
+    How scatter series with many points are drawn.
+
+    Series with at most `threshold` points are drawn point by point. Larger
+    ones are either decimated to `max_points` points or drawn as a hexbin
+    density map, so the time to draw a figure and the size of the file stay
+    roughly constant however long the acquisition ran. Only the drawing is
+    affected: fits are always computed from the full data.
+
+    Attributes:
+    - threshold (int): Largest series that is drawn in full.
+    - mode (str): "decimate", "hexbin" or "off" (always draw every point).
+    - method (str): Decimation method, "lttb" or "minmax".
+    - max_points (int): Points kept per series when decimating.
+    - gridsize (int): Number of hexagons across the x range in hexbin mode.
+    """
+
+    threshold: int = 20_000
+    mode: str = "decimate"
+    method: str = "lttb"
+    max_points: int = 4_000
+    gridsize: int = 100
+
+    def __post_init__(self) -> None:
+        if self.mode not in ("decimate", "hexbin", "off"):
+            raise ValueError(
+                f"Unknown large-data mode {self.mode!r}; "
+                "choose one of decimate, hexbin, off"
+            )
+
+
+@dataclass(frozen=True)
+class RenderProfile:
+    """
+    A named set of output settings used when saving figures.
+
+    Attributes:
+    - name (str): The profile name.
+    - dpi (int): Resolution of raster output.
+    - bbox_inches (Optional[str]): "tight" to crop to the artists (costs an
+      extra layout pass) or None to keep the figure canvas as is.
+    - backend (Optional[str]): Backend to switch to in setup_plot_style, e.g.
+      "agg" for headless batch rendering; None keeps the current one.
+    - large_data (LargeDataPolicy): How series with many points are drawn.
+    """
+
+    name: str
+    dpi: int
+    bbox_inches: Optional[str]
+    backend: Optional[str] = None
+    large_data: LargeDataPolicy = LargeDataPolicy()
+
+
+@dataclass(frozen=True)
+class PlotStyle:
+    """
+    Per-figure style settings applied by create_figure.
+
+    They are set on the figure and its artists directly rather than through
+    the global rcParams, so figures built concurrently in several threads
+    cannot pick up each other's settings.
+
+    Attributes:
+    - font_family (Tuple[str, ...]): Font families for the title, axis
+      labels and tick labels, in order of preference.
+    - figsize (Tuple[float, float]): Figure size in inches.
+    - title_size (float): Font size of the title.
+    - label_size (float): Font size of the axis labels.
+    - use_latex (bool): Whether to render the title and labels with LaTeX.
+    """
+
+    # Font supporting Chinese characters, falling back to the default sans-serif
+    font_family: Tuple[str, ...] = ("WenQuanYi Micro Hei", "sans-serif")
+    figsize: Tuple[float, float] = (8, 6)
+    title_size: float = 14
+    label_size: float = 12
+    use_latex: bool = False
+
+
+DEFAULT_STYLE = PlotStyle()
+
+
+RENDER_PROFILES: Dict[str, RenderProfile] = {
+    # On-screen previews: headless, low resolution, no tight-bbox layout pass
+    "draft": RenderProfile("draft", dpi=100, bbox_inches=None, backend="agg"),
+    # Report-ready output: high resolution, cropped
+    "publication": RenderProfile("publication", dpi=300, bbox_inches="tight"),
+}
+
+ProfileLike = Union[str, RenderProfile, None]
+
+# Where a plot goes: a directory or file path, a writable binary buffer, or
+# None to get the encoded figure back as bytes
+OutputLike = Union[str, Path, BinaryIO, None]
+
+# Profile used when a call does not name one; set by setup_plot_style
+_active_profile: RenderProfile = RENDER_PROFILES["publication"]
+
+
+def get_render_profile(profile: ProfileLike = None) -> RenderProfile:
+    """
+    Resolve a render profile.
+
+    Parameters:
+    - profile (str | RenderProfile | None): A profile, the name of one in
+      RENDER_PROFILES, or None for the profile chosen in setup_plot_style.
+
+    Returns:
+    - RenderProfile: The resolved profile.
+    """
+    if profile is None:
+        return _active_profile
+    if isinstance(profile, RenderProfile):
+        return profile
+    try:
+        return RENDER_PROFILES[profile]
+    except KeyError:
+        raise ValueError(
+            f"Unknown render profile {profile!r}; "
+            f"choose one of {', '.join(RENDER_PROFILES)}"
+        ) from None
+
+
+def setup_plot_style(profile: ProfileLike = None) -> None:
     """
     Set up the plot style for Matplotlib.
+
+    This sets process-wide rcParams (fonts for legends and tick formatting,
+    the default figure size and DPI) and the backend, so call it once at
+    start-up, before figures are built in other threads.
+
+    Parameters:
+    - profile (str | RenderProfile | None): Render profile for this run. If
+      None, the PHYSICSLAB_RENDER_PROFILE environment variable is used, and
+      "publication" when that is unset.
     """
+    import matplotlib.pyplot as plt
+
+    global _active_profile
+    if profile is None:
+        profile = os.environ.get("PHYSICSLAB_RENDER_PROFILE", "publication")
+    _active_profile = get_render_profile(profile)
+    if _active_profile.backend is not None:
+        plt.switch_backend(_active_profile.backend)
+
     # Set font to support Chinese characters (Source Han Sans SC)
     plt.rcParams["font.family"] = "sans-serif"
     plt.rcParams["font.sans-serif"] = ["WenQuanYi Micro Hei"]
     # Ensure the minus sign displays correctly
     plt.rcParams["axes.unicode_minus"] = False
     # Set a default figure size
-    plt.rcParams["figure.figsize"] = (8, 6)
+    plt.rcParams["figure.figsize"] = DEFAULT_STYLE.figsize
     # Set a default DPI for saved figures
-    plt.rcParams["savefig.dpi"] = 300
-    print("🎨 Plot style configured for professional output.")
+    plt.rcParams["savefig.dpi"] = _active_profile.dpi
+    # Keep text as real fonts in PDF/PS/SVG so it stays selectable and editable
+    plt.rcParams["pdf.fonttype"] = 42
+    plt.rcParams["ps.fonttype"] = 42
+    plt.rcParams["svg.fonttype"] = "none"
+    logger.info("🎨 Plot style configured for %s output.", _active_profile.name)
 
 
 def create_figure(
@@ -26,43 +206,703 @@ def create_figure(
     xlabel: str,
     ylabel: str,
     use_latex: bool = False,
+    style: Optional[PlotStyle] = None,
 ) -> Tuple[plt.Figure, plt.Axes]:
     """
     Create a Matplotlib figure with a title and axis labels.
 
+    The figure is not registered with pyplot and no rcParams are modified,
+    so this is safe to call from several threads at once.
+
     Parameters:
     - title (str): The title of the plot.
     - xlabel (str): The label for the x-axis.
     - ylabel (str): The label for the y-axis.
     - use_latex (bool): Whether to render text using LaTeX.
+    - style (Optional[PlotStyle]): Per-figure style; defaults to DEFAULT_STYLE.
 
     Returns:
     - Tuple[plt.Figure, plt.Axes]: The created figure and axes.
     """
-    fig, ax = plt.subplots()
-    if use_latex:
-        plt.rcParams["text.usetex"] = True
-        ax.set_title(title, fontsize=14)
-        ax.set_xlabel(xlabel, fontsize=12)
-        ax.set_ylabel(ylabel, fontsize=12)
-    else:
-        plt.rcParams["text.usetex"] = False
-        ax.set_title(title, fontsize=14)
-        ax.set_xlabel(xlabel, fontsize=12)
-        ax.set_ylabel(ylabel, fontsize=12)
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    style = style or DEFAULT_STYLE
+    usetex = use_latex or style.use_latex
+    family = list(style.font_family)
+
+    fig = Figure(figsize=style.figsize)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.set_title(title, fontsize=style.title_size, fontfamily=family, usetex=usetex)
+    ax.set_xlabel(xlabel, fontsize=style.label_size, fontfamily=family, usetex=usetex)
+    ax.set_ylabel(ylabel, fontsize=style.label_size, fontfamily=family, usetex=usetex)
+    ax.tick_params(labelfontfamily=family)
     # Add a soft grid for better readability
     ax.grid(True, which="both", linestyle="--", linewidth=0.5, alpha=0.5)
     return fig, ax
 
 
-def save_figure(fig: plt.Figure, filepath: str) -> None:
+@instrument("save", name="savefig")
+def _write_figure(
+    fig: plt.Figure,
+    target: Union[str, Path, BinaryIO],
+    profile: ProfileLike = None,
+    format: Optional[str] = None,
+) -> None:
+    render_profile = get_render_profile(profile)
+    fig.savefig(
+        target,
+        format=format,
+        dpi=render_profile.dpi,
+        bbox_inches=render_profile.bbox_inches,
+    )
+
+
+def _report_written(
+    target: Union[str, Path, BinaryIO],
+    format: Optional[str],
+    cached: bool = False,
+    seconds: Optional[float] = None,
+) -> None:
+    origin = " (from cache)" if cached else ""
+    if isinstance(target, (str, os.PathLike)):
+        file_event(
+            logger,
+            "figure",
+            target,
+            "📈 Figure saved to %s%s",
+            target,
+            origin,
+            seconds=seconds,
+        )
+    else:
+        file_event(
+            logger,
+            "figure",
+            None,
+            "📈 Figure rendered as %s into a buffer%s",
+            (format or "png").upper(),
+            origin,
+            seconds=seconds,
+        )
+
+
+def save_figure(
+    fig: plt.Figure,
+    filepath: Union[str, Path, BinaryIO],
+    profile: ProfileLike = None,
+    format: Optional[str] = None,
+) -> None:
     """
-    Save a Matplotlib figure to a file.
+    Save a Matplotlib figure to a file or a binary buffer.
 
     Parameters:
     - fig (plt.Figure): The figure to save.
-    - filename (str): The filename (including path) to save the figure to.
+    - filepath (str | Path | BinaryIO): The filename (including path) to
+      save the figure to, or a writable binary file object such as an open
+      archive member, an HTTP response stream or an io.BytesIO.
+    - profile (str | RenderProfile | None): Render profile; defaults to the
+      one chosen in setup_plot_style.
+    - format (Optional[str]): "png", "svg", "pdf", ...; by default taken from
+      the file extension, and PNG for buffers.
+    """
+    start = time.perf_counter()
+    try:
+        _write_figure(fig, filepath, profile, format)
+    finally:
+        # Only figures created through pyplot are tracked by it and need closing
+        if fig.canvas.manager is not None:
+            import matplotlib.pyplot as plt
+
+            plt.close(fig)  # Close the figure to free up memory
+    _report_written(filepath, format, seconds=time.perf_counter() - start)
+
+
+def figure_to_bytes(
+    fig: plt.Figure, format: str = "png", profile: ProfileLike = None
+) -> bytes:
+    """
+    Render a Matplotlib figure in memory and return the encoded file.
+
+    Parameters:
+    - fig (plt.Figure): The figure to render.
+    - format (str): "png", "svg", "pdf", ...
+    - profile (str | RenderProfile | None): Render profile.
+
+    Returns:
+    - bytes: The content of the figure file.
+    """
+    buffer = io.BytesIO()
+    save_figure(fig, buffer, profile, format)
+    return buffer.getvalue()
+
+
+@dataclass(frozen=True)
+class PlotSpec:
+    """
+    The fixed parts of a plot type: title, axis labels and output file name.
+
+    Attributes:
+    - title (str): The title of the plot.
+    - xlabel (str): The label for the x-axis.
+    - ylabel (str): The label for the y-axis.
+    - filename (str): File name of the saved figure.
+    """
+
+    title: str
+    xlabel: str
+    ylabel: str
+    filename: str
+
+
+@dataclass
+class PlotSeries:
+    """
+    One scatter series of a plot and, optionally, its fitted line.
+
+    Attributes:
+    - x, y (np.ndarray): The data points.
+    - color (Any): Color of the data points.
+    - label (str): Legend entry of the data points.
+    - fit_x, fit_y (Optional[np.ndarray]): The fitted line; empty arrays
+      keep a legend entry (e.g. for a failed fit) without drawing a line.
+    - fit_label (Optional[str]): Legend entry of the fitted line.
+    - fit_color (Any): Color of the fitted line.
+    """
+
+    x: np.ndarray
+    y: np.ndarray
+    color: Any
+    label: str
+    fit_x: Optional[np.ndarray] = None
+    fit_y: Optional[np.ndarray] = None
+    fit_label: Optional[str] = None
+    fit_color: Any = "r"
+
+    @property
+    def has_fit(self) -> bool:
+        return self.fit_x is not None
+
+
+def fit_line(x: ArrayLike, fit: Any, num: int = 100) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sample a fitted line over the range of the data.
+
+    Parameters:
+    - x (ArrayLike): The x data the line was fitted to.
+    - fit (LinearFitResult): The fit, callable on x values.
+    - num (int): Number of samples.
+
+    Returns:
+    - Tuple[np.ndarray, np.ndarray]: The x and y samples of the line.
+    """
+    x = np.asarray(x, dtype=float)
+    x_fit = np.linspace(np.min(x), np.max(x), num)
+    return x_fit, fit(x_fit)
+
+
+def _display_points(
+    item: PlotSeries, policy: LargeDataPolicy
+) -> Tuple[str, np.ndarray, np.ndarray]:
+    # Returns how to draw the series ("scatter" or "hexbin") and the points
+    x = np.asarray(item.x, dtype=float)
+    y = np.asarray(item.y, dtype=float)
+    if policy.mode == "off" or len(x) <= policy.threshold:
+        return "scatter", x, y
+    if policy.mode == "hexbin":
+        finite = np.isfinite(x) & np.isfinite(y)
+        return "hexbin", x[finite], y[finite]
+    return ("scatter", *decimate(x, y, policy.max_points, policy.method))
+
+
+def _draw_density(
+    ax: plt.Axes, item: PlotSeries, x: np.ndarray, y: np.ndarray, gridsize: int
+) -> Any:
+    from matplotlib.colors import LinearSegmentedColormap, to_rgba
+
+    # Shade from faint to full series color, so overlaid series stay apart
+    rgba = to_rgba(item.color)
+    cmap = LinearSegmentedColormap.from_list(
+        "density", [(*rgba[:3], 0.15), (*rgba[:3], 1.0)]
+    )
+    return ax.hexbin(
+        x,
+        y,
+        gridsize=gridsize,
+        mincnt=1,
+        bins="log",
+        cmap=cmap,
+        linewidths=0,
+    )
+
+
+def draw_series(
+    ax: plt.Axes,
+    series: Sequence[PlotSeries],
+    legend_fontsize: Any = None,
+    large_data: Optional[LargeDataPolicy] = None,
+) -> None:
+    """
+    Draw scatter series and their fitted lines onto an axes.
+
+    A legend is added when at least one series has a fitted line. Series
+    above the large-data threshold are decimated or drawn as a density map.
+
+    Parameters:
+    - ax (plt.Axes): The axes to draw on.
+    - series (Sequence[PlotSeries]): The series, drawn in order.
+    - legend_fontsize (Any): Font size of the legend; None for the default.
+    - large_data (Optional[LargeDataPolicy]): How to draw large series;
+      defaults to the policy of the active render profile.
+    """
+    policy = large_data or get_render_profile().large_data
+    for item in series:
+        kind, x, y = _display_points(item, policy)
+        if kind == "hexbin":
+            _draw_density(ax, item, x, y, policy.gridsize)
+            # An empty scatter keeps the legend entry in the series color
+            x = y = np.empty(0)
+        ax.scatter(x, y, color=item.color, label=item.label)
+        if item.has_fit:
+            ax.plot(
+                item.fit_x, item.fit_y, "-", color=item.fit_color, label=item.fit_label
+            )
+    if any(item.has_fit for item in series):
+        ax.legend(fontsize=legend_fontsize)
+
+
+class FigureTemplate:
+    """
+    A pre-styled figure reused for many datasets of the same plot type.
+
+    The figure, axes, labels and grid are built once. Rendering a dataset
+    only updates the scatter offsets, fitted-line data, colors and legend
+    before saving, which avoids creating and tearing down a figure per
+    dataset. A template is not thread-safe; give each thread its own.
+    """
+
+    def __init__(self, spec: PlotSpec, style: Optional[PlotStyle] = None) -> None:
+        self.spec = spec
+        self.style = style or DEFAULT_STYLE
+        self.fig, self.ax = create_figure(
+            spec.title, spec.xlabel, spec.ylabel, style=style
+        )
+        self._artists: List[Tuple[Any, Any]] = []
+        self._densities: List[Any] = []
+
+    def _ensure_artists(self, count: int) -> None:
+        # Scatter and line of each series are created in pairs, so the legend
+        # keeps the same order as draw_series produces
+        while len(self._artists) < count:
+            scatter = self.ax.scatter([], [])
+            (line,) = self.ax.plot([], [], "-")
+            self._artists.append((scatter, line))
+
+    def update(
+        self,
+        series: Sequence[PlotSeries],
+        large_data: Optional[LargeDataPolicy] = None,
+    ) -> None:
+        """
+        Show a new set of series on the template figure.
+
+        Parameters:
+        - series (Sequence[PlotSeries]): The series to show.
+        - large_data (Optional[LargeDataPolicy]): How to draw large series;
+          defaults to the policy of the active render profile.
+        """
+        policy = large_data or get_render_profile().large_data
+        self._ensure_artists(len(series))
+        # Density maps cannot be updated in place, so they are redrawn
+        for density in self._densities:
+            density.remove()
+        self._densities = []
+        points = []
+        for i, (scatter, line) in enumerate(self._artists):
+            if i >= len(series):
+                for artist in (scatter, line):
+                    artist.set_visible(False)
+                    artist.set_label("_nolegend_")
+                continue
+            item = series[i]
+            kind, x, y = _display_points(item, policy)
+            offsets = np.column_stack([x, y])
+            points.append(offsets)
+            if kind == "hexbin":
+                self._densities.append(
+                    _draw_density(self.ax, item, x, y, policy.gridsize)
+                )
+                # The emptied scatter only provides the legend entry
+                scatter.set_offsets(np.empty((0, 2)))
+            else:
+                scatter.set_offsets(offsets)
+            scatter.set_color(item.color)
+            scatter.set_label(item.label)
+            scatter.set_visible(True)
+            if item.has_fit:
+                line.set_data(item.fit_x, item.fit_y)
+                line.set_color(item.fit_color)
+                line.set_label(item.fit_label)
+                line.set_visible(True)
+            else:
+                line.set_visible(False)
+                line.set_label("_nolegend_")
+
+        # relim() only accounts for lines, so add the scatter points explicitly
+        self.ax.relim(visible_only=True)
+        for offsets in points:
+            if len(offsets):
+                self.ax.update_datalim(offsets)
+        self.ax.autoscale_view()
+
+        legend = self.ax.get_legend()
+        if legend is not None:
+            legend.remove()
+        if any(item.has_fit for item in series):
+            self.ax.legend()
+
+    def render(
+        self,
+        series: Sequence[PlotSeries],
+        filepath: Union[str, Path, BinaryIO],
+        profile: ProfileLike = None,
+        format: Optional[str] = None,
+    ) -> None:
+        """
+        Update the template with new series and save it.
+
+        Parameters:
+        - series (Sequence[PlotSeries]): The series to show.
+        - filepath (str | Path | BinaryIO): Where to save the figure.
+        - profile (str | RenderProfile | None): Render profile.
+        - format (Optional[str]): Output format, as in save_figure.
+        """
+        start = time.perf_counter()
+        self.update(series, get_render_profile(profile).large_data)
+        _write_figure(self.fig, filepath, profile, format)
+        _report_written(filepath, format, seconds=time.perf_counter() - start)
+
+
+_FIGURE_CACHE_VERSION = "1"
+
+
+def _array_part(values: Any) -> bytes:
+    if values is None:
+        return b"none"
+    array = np.ascontiguousarray(np.asarray(values, dtype=float))
+    return repr(array.shape).encode() + array.tobytes()
+
+
+class FigureCache:
+    """
+    Opt-in on-disk cache of rendered figures.
+
+    Entries are keyed by a hash of everything that determines the output
+    file: the plot spec, the data and labels of every series, the render
+    profile, the figure style, the output format, the rcParams set by
+    setup_plot_style and the Matplotlib and NumPy versions. Re-running a
+    script over unchanged data then copies the stored file instead of
+    drawing and rasterizing the figure again. The directory is kept below
+    max_bytes by least-recently-used eviction.
+
+    With link=True outputs are hard links to the cache entries where the
+    filesystem allows it, which saves the copy but means an output must not
+    be edited in place.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_bytes: int = 1024**3,
+        link: bool = False,
+    ) -> None:
+        self.store = LRUDirectory(directory, max_bytes, suffix=".fig")
+        self.link = link
+
+    def key(
+        self,
+        spec: PlotSpec,
+        series: Sequence[PlotSeries],
+        profile: ProfileLike,
+        format: str,
+        style: Optional[PlotStyle] = None,
+    ) -> str:
+        """
+        Compute the cache key of a plot.
+
+        Parameters:
+        - spec (PlotSpec): The plot.
+        - series (Sequence[PlotSeries]): Its data.
+        - profile (str | RenderProfile | None): Render profile.
+        - format (str): Output format.
+        - style (Optional[PlotStyle]): Figure style; defaults to DEFAULT_STYLE.
+
+        Returns:
+        - str: The hex digest.
+        """
+        import matplotlib
+
+        rc = sorted(
+            (name, repr(value))
+            for name, value in matplotlib.rcParams.items()
+            if name != "backend"
+        )
+        parts: List[Union[str, bytes]] = [
+            _FIGURE_CACHE_VERSION,
+            matplotlib.__version__,
+            np.__version__,
+            repr(rc),
+            repr(spec),
+            repr(get_render_profile(profile)),
+            repr(style or DEFAULT_STYLE),
+            format,
+        ]
+        for item in series:
+            parts += [
+                item.label,
+                repr(item.color),
+                repr(item.fit_label),
+                repr(item.fit_color),
+                _array_part(item.x),
+                _array_part(item.y),
+                _array_part(item.fit_x),
+                _array_part(item.fit_y),
+            ]
+        return combine_digest(parts)
+
+    def _deliver(self, source: Path, target: Union[Path, BinaryIO]) -> None:
+        if hasattr(target, "write"):
+            with open(source, "rb") as f:
+                shutil.copyfileobj(f, target)
+            return
+        if self.link:
+            try:
+                if os.path.lexists(target):
+                    os.unlink(target)
+                os.link(source, target)
+                return
+            except OSError:
+                pass  # e.g. another filesystem; fall back to copying
+        shutil.copyfile(source, target)
+
+    def render(
+        self,
+        key: str,
+        target: Union[Path, BinaryIO],
+        draw: Callable[[Path], None],
+    ) -> bool:
+        """
+        Deliver the figure for key to target, drawing it only on a miss.
+
+        Parameters:
+        - key (str): The cache key, from FigureCache.key.
+        - target (Path | BinaryIO): Output file or writable binary buffer.
+        - draw (Callable[[Path], None]): Renders the figure to the given path.
+
+        Returns:
+        - bool: True if the figure came from the cache.
+        """
+        entry = self.store.lookup(key)
+        if entry is not None:
+            self._deliver(entry, target)
+            return True
+
+        # A fresh temporary file per call, so concurrent renders of the same
+        # key never write to or delete each other's file
+        temp_path = self.store.temp_path_for(key)
+        try:
+            draw(temp_path)
+            # Deliver before publishing, so eviction cannot race the copy
+            self._deliver(temp_path, target)
+            self.store.commit(key, temp_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+        return False
+
+
+def _output_name(spec: PlotSpec, format: Optional[str]) -> Tuple[str, str]:
+    # File stem and format of a plot, e.g. ("N_vs_T", "png")
+    stem, suffix = os.path.splitext(spec.filename)
+    return stem, format or suffix.lstrip(".")
+
+
+@instrument("plot")
+def render_plot(
+    spec: PlotSpec,
+    series: Sequence[PlotSeries],
+    output_dir: OutputLike,
+    profile: ProfileLike = None,
+    template: Optional[FigureTemplate] = None,
+    format: Optional[str] = None,
+    cache: Optional[FigureCache] = None,
+) -> Union[Path, bytes, BinaryIO]:
+    """
+    Draw a plot from its spec and series and save it.
+
+    Parameters:
+    - spec (PlotSpec): Title, axis labels and file name of the plot.
+    - series (Sequence[PlotSeries]): The data to draw.
+    - output_dir (str | Path | BinaryIO | None): Directory to save the figure
+      to, a writable binary buffer to write it into, or None to return it
+      as bytes without touching the filesystem.
+    - profile (str | RenderProfile | None): Render profile.
+    - template (Optional[FigureTemplate]): Reuse this pre-styled figure
+      instead of building a new one; it must have been made for spec.
+    - format (Optional[str]): "png", "svg", "pdf", ...; defaults to the
+      extension of the spec's file name. In a directory the file name gets
+      the matching extension.
+    - cache (Optional[FigureCache]): Reuse a previously rendered figure when
+      the data, labels, profile and style are unchanged.
+
+    Returns:
+    - Path | bytes | BinaryIO: The path of the saved figure, the encoded
+      figure when output_dir is None, or the buffer it was written into.
+    """
+    if template is not None and template.spec != spec:
+        raise ValueError(
+            f"Template for {template.spec.filename} cannot render {spec.filename}"
+        )
+
+    stem, fmt = _output_name(spec, format)
+    if output_dir is None:
+        target = io.BytesIO()
+    elif hasattr(output_dir, "write"):
+        target = output_dir
+    else:
+        output_dir = Path(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
+        target = output_dir / f"{stem}.{fmt}"
+
+    large_data = get_render_profile(profile).large_data
+    start = time.perf_counter()
+
+    def draw(destination: Union[Path, BinaryIO]) -> None:
+        if template is not None:
+            template.update(series, large_data)
+            _write_figure(template.fig, destination, profile, fmt)
+        else:
+            fig, ax = create_figure(spec.title, spec.xlabel, spec.ylabel)
+            draw_series(ax, series, large_data=large_data)
+            _write_figure(fig, destination, profile, fmt)
+
+    if cache is None:
+        draw(target)
+        cached = False
+    else:
+        style = template.style if template is not None else None
+        key = cache.key(spec, series, profile, fmt, style)
+        cached = cache.render(key, target, draw)
+    _report_written(target, fmt, cached, time.perf_counter() - start)
+
+    if output_dir is None:
+        return target.getvalue()
+    return target
+
+
+@instrument("plot")
+def render_montage(
+    spec: PlotSpec,
+    panels: Mapping[str, Sequence[PlotSeries]],
+    output_dir: Union[str, Path, None],
+    ncols: int = 4,
+    per_page: int = 16,
+    panel_size: Tuple[float, float] = (4, 3),
+    profile: ProfileLike = None,
+    style: Optional[PlotStyle] = None,
+    format: Optional[str] = None,
+) -> List[Union[Path, bytes]]:
+    """
+    Draw many datasets of one plot type as panels of a grid, paged across files.
+
+    All panels share the plot's title and axis labels, which are drawn once
+    per page; each panel is titled with its key (e.g. a submission id).
+    Pages are saved as "<name>_montage_001.<ext>", "<name>_montage_002.<ext>"
+    and so on, next to where the single-figure plot would go.
+
+    Parameters:
+    - spec (PlotSpec): The plot type.
+    - panels (Mapping[str, Sequence[PlotSeries]]): Series per panel key, in
+      display order.
+    - output_dir (str | Path | None): Directory to save the pages to, or
+      None to return them as bytes.
+    - ncols (int): Number of panel columns.
+    - per_page (int): Maximum number of panels per page.
+    - panel_size (Tuple[float, float]): Size of one panel in inches.
+    - profile (str | RenderProfile | None): Render profile.
+    - style (Optional[PlotStyle]): Fonts; defaults to DEFAULT_STYLE.
+    - format (Optional[str]): Output format, as in render_plot.
+
+    Returns:
+    - List[Path | bytes]: The saved pages, or their content when output_dir
+      is None.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    style = style or DEFAULT_STYLE
+    family = list(style.font_family)
+    if output_dir is not None:
+        output_dir = Path(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
+    stem, fmt = _output_name(spec, format)
+
+    large_data = get_render_profile(profile).large_data
+    items = list(panels.items())
+    pages = []
+    for page, start in enumerate(range(0, len(items), per_page), start=1):
+        page_items = items[start : start + per_page]
+        ncols_page = min(ncols, len(page_items))
+        nrows = -(-len(page_items) // ncols_page)
+
+        fig = Figure(
+            figsize=(panel_size[0] * ncols_page, panel_size[1] * nrows),
+            layout="constrained",
+        )
+        FigureCanvasAgg(fig)
+        axes = fig.subplots(nrows, ncols_page, squeeze=False).ravel()
+        fig.suptitle(spec.title, fontsize=style.title_size, fontfamily=family)
+        fig.supxlabel(spec.xlabel, fontsize=style.label_size, fontfamily=family)
+        fig.supylabel(spec.ylabel, fontsize=style.label_size, fontfamily=family)
+
+        for ax, (key, series) in zip(axes, page_items):
+            ax.set_title(str(key), fontsize="small", fontfamily=family)
+            ax.tick_params(labelsize="x-small", labelfontfamily=family)
+            ax.grid(True, which="both", linestyle="--", linewidth=0.5, alpha=0.5)
+            draw_series(ax, series, legend_fontsize="xx-small", large_data=large_data)
+        for ax in axes[len(page_items) :]:
+            ax.set_visible(False)
+
+        if output_dir is None:
+            pages.append(figure_to_bytes(fig, fmt, profile))
+            continue
+        filepath = output_dir / f"{stem}_montage_{page:03d}.{fmt}"
+        save_figure(fig, filepath, profile, fmt)
+        pages.append(filepath)
+    return pages
+
+
+def montage_from_frames(
+    spec: PlotSpec,
+    series_fn: Callable[[Any], Sequence[PlotSeries]],
+    processed_dfs: Mapping[str, Any],
+    output_dir: Union[str, Path, None],
+    **montage_kwargs: Any,
+) -> List[Union[Path, bytes]]:
+    """
+    Build the series of every processed DataFrame and render them as a montage.
+
+    Parameters:
+    - spec (PlotSpec): The plot type.
+    - series_fn (Callable): The plot's series function, e.g. N_vs_T_series.
+    - processed_dfs (Mapping[str, pd.DataFrame]): Processed data per
+      submission, e.g. dict(tuple(stacked_df.groupby("source"))).
+    - output_dir (str | Path | None): Directory to save the pages to, or
+      None to return them as bytes.
+    - **montage_kwargs: Passed on to render_montage.
+
+    Returns:
+    - List[Path | bytes]: The saved pages or their content.
     """
-    fig.savefig(filepath, bbox_inches="tight")
-    plt.close(fig)  # Close the figure to free up memory
-    print(f"📈 Figure saved to {filepath}")
+    panels = {key: series_fn(df) for key, df in processed_dfs.items()}
+    return render_montage(spec, panels, output_dir, **montage_kwargs)
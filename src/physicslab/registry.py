@@ -0,0 +1,386 @@
+# src/physicslab/registry.py
+
+import importlib
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DataInput:
+    """
+    A raw data file read by an experiment.
+
+    Attributes:
+    - path (str): Path relative to the project root.
+    - loader (str): Name of the loader in physicslab.data_utils, e.g.
+      "load_csv" or "load_transposed_csv".
+    """
+
+    path: str
+    loader: str = "load_csv"
+
+
+@dataclass(frozen=True)
+class Step:
+    """
+    An analysis step: output = function(*inputs).
+
+    Attributes:
+    - function (str): Name of the function in the experiment's module.
+    - inputs (Tuple[str, ...]): Names of the data the function is called with.
+    - output (str): Name under which the result is stored.
+    - save (Optional[str]): Path, relative to the project root, to save the
+      resulting DataFrame to as CSV.
+    - show (bool): Print the resulting table.
+    """
+
+    function: str
+    inputs: Tuple[str, ...]
+    output: str
+    save: Optional[str] = None
+    show: bool = False
+
+
+@dataclass(frozen=True)
+class Plot:
+    """
+    A figure: function(data, output_dir).
+
+    Attributes:
+    - function (str): Name of the plot function in the experiment's module.
+    - data (str): Name of the data to plot.
+    """
+
+    function: str
+    data: str
+
+
+@dataclass(frozen=True)
+class Experiment:
+    """
+    Declaration of one experiment's workflow.
+
+    Only names are stored, so declaring an experiment imports nothing; its
+    module and the heavy libraries it uses are imported when it is run.
+
+    Attributes:
+    - name (str): Name used on the command line.
+    - title (str): Human-readable name.
+    - module (str): Dotted path of the module with the steps and plots.
+    - inputs (Dict[str, DataInput]): Raw data, by name.
+    - steps (Tuple[Step, ...]): Analysis steps, run in order.
+    - plots (Tuple[Plot, ...]): Figures to draw.
+    - output_dir (str): Figure directory relative to the project root.
+    """
+
+    name: str
+    title: str
+    module: str
+    inputs: Dict[str, DataInput]
+    steps: Tuple[Step, ...] = ()
+    plots: Tuple[Plot, ...] = ()
+    output_dir: str = "output"
+
+    def load_module(self) -> Any:
+        """Import and return the experiment's module."""
+        return importlib.import_module(self.module)
+
+
+EXPERIMENTS: Dict[str, Experiment] = {}
+
+
+def register(experiment: Experiment) -> Experiment:
+    """
+    Add an experiment to the registry.
+
+    Parameters:
+    - experiment (Experiment): The declaration; its name must be unused.
+
+    Returns:
+    - Experiment: The registered experiment.
+    """
+    if experiment.name in EXPERIMENTS:
+        raise ValueError(f"Experiment {experiment.name!r} is already registered")
+    EXPERIMENTS[experiment.name] = experiment
+    return experiment
+
+
+def get_experiment(name: str) -> Experiment:
+    """
+    Look up a registered experiment by name.
+
+    Parameters:
+    - name (str): The experiment name.
+
+    Returns:
+    - Experiment: The declaration.
+    """
+    try:
+        return EXPERIMENTS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown experiment {name!r}; choose one of {', '.join(EXPERIMENTS)}"
+        ) from None
+
+
+register(
+    Experiment(
+        name="thermal_resistor",
+        title="Thermal Resistor",
+        module="physicslab.thermal_resistor.processing",
+        inputs={
+            "raw": DataInput(
+                "data/raw/thermal_resistor/source_data.csv",
+                loader="load_transposed_csv",
+            )
+        },
+        steps=(
+            Step(
+                "analyze_thermal_data",
+                ("raw",),
+                "processed",
+                save="data/processed/thermal_resistor/processed_data.csv",
+            ),
+        ),
+        plots=(
+            Plot("plot_ln_R_T_vs_1_T", "processed"),
+            Plot("plot_N_vs_T", "processed"),
+        ),
+        output_dir="output/thermal_resistor",
+    )
+)
+
+register(
+    Experiment(
+        name="e_beam_deflection_analysis",
+        title="E-Beam Deflection Analysis",
+        module="physicslab.e_beam_deflection_analysis.processing",
+        inputs={
+            "electric": DataInput(
+                "data/raw/e_beam_deflection_analysis/elec_deflection_y_data.csv"
+            ),
+            "magnetic": DataInput(
+                "data/raw/e_beam_deflection_analysis/mag_deflection_data.csv"
+            ),
+            "em_ratio": DataInput(
+                "data/raw/e_beam_deflection_analysis/em_ratio_mag_focus.csv"
+            ),
+        },
+        steps=(Step("count_mass_to_charge_ratio", ("em_ratio",), "ratios", show=True),),
+        plots=(
+            Plot("plot_D_Y_vs_V_d", "electric"),
+            Plot("plot_D_B_vs_I", "magnetic"),
+        ),
+        output_dir="output/e_beam_deflection_analysis",
+    )
+)
+
+register(
+    Experiment(
+        name="e_field_mapping",
+        title="E-Field Mapping",
+        module="physicslab.e_field_mapping.processing",
+        inputs={
+            "raw": DataInput("data/raw/e_field_mapping/equipotential_mapping_data.csv")
+        },
+        steps=(
+            Step(
+                "analyze_e_field_data",
+                ("raw",),
+                "processed",
+                save="data/processed/e_field_mapping/processed_data.csv",
+            ),
+        ),
+        plots=(Plot("plot_V_r_over_V_B_vs_ln_r_over_ln_7", "processed"),),
+        output_dir="output/e_field_mapping",
+    )
+)
+
+register(
+    Experiment(
+        name="sucrose_polarimetry",
+        title="Sucrose Polarimetry",
+        module="physicslab.sucrose_polarimetry.processing",
+        inputs={"raw": DataInput("data/raw/sucrose_polarimetry/rotation_angles.csv")},
+        steps=(
+            Step(
+                "analyze_average_angle_deg",
+                ("raw",),
+                "processed",
+                save="data/processed/sucrose_polarimetry/processed_data.csv",
+            ),
+        ),
+        plots=(Plot("plot_average_angle_vs_concentration", "processed"),),
+        output_dir="output/sucrose_polarimetry",
+    )
+)
+
+register(
+    Experiment(
+        name="viscosity_measurement",
+        title="Viscosity Measurement",
+        module="physicslab.viscosity_measurement.processing",
+        inputs={
+            "tube": DataInput("data/raw/viscosity_measurement/test_tube_diameters.csv"),
+            "ball": DataInput(
+                "data/raw/viscosity_measurement/steel_ball_diameters.csv"
+            ),
+            "fall_time": DataInput(
+                "data/raw/viscosity_measurement/steel_ball_fall_time.csv"
+            ),
+            "distance": DataInput("data/raw/viscosity_measurement/timer_distance.csv"),
+        },
+        steps=(
+            Step(
+                "analyze_viscosity_data",
+                ("tube", "ball", "fall_time", "distance"),
+                "processed",
+                save="data/processed/viscosity_measurement/processed_data.csv",
+            ),
+            Step(
+                "solve_viscosity",
+                ("processed",),
+                "viscosity",
+                save="data/processed/viscosity_measurement/viscosity.csv",
+                show=True,
+            ),
+        ),
+        plots=(Plot("plot_t_vs_inv_D", "processed"),),
+        output_dir="output/viscosity_measurement",
+    )
+)
+
+
+def load_input(
+    source: DataInput, root: Union[str, Path] = ".", cache: Any = None
+) -> Any:
+    """
+    Load one declared input.
+
+    Parameters:
+    - source (DataInput): The input.
+    - root (str | Path): Project root.
+    - cache (Optional[ParseCache]): Parse cache to read from and populate.
+
+    Returns:
+    - pd.DataFrame: The loaded data.
+
+    Raises:
+    - ValueError: If the loader returned no data.
+    """
+    from physicslab import data_utils
+
+    df = getattr(data_utils, source.loader)(Path(root) / source.path, cache=cache)
+    if df.empty:
+        raise ValueError(f"No valid data found in '{Path(source.path).name}'.")
+    return df
+
+
+def run_step(
+    module: Any, step: Step, data: Dict[str, Any], root: Union[str, Path] = "."
+) -> Any:
+    """
+    Run one analysis step on already available data, saving or showing it.
+
+    Parameters:
+    - module (Any): The experiment's module.
+    - step (Step): The step.
+    - data (Dict[str, Any]): Data by name; must hold the step's inputs.
+    - root (str | Path): Project root.
+
+    Returns:
+    - Any: The step's result.
+    """
+    from physicslab import data_utils
+
+    result = getattr(module, step.function)(*(data[name] for name in step.inputs))
+    if step.save is not None:
+        data_utils.save_processed_data(result, Path(root) / step.save)
+    if step.show and logger.isEnabledFor(logging.INFO):
+        logger.info("%s", result.to_string(index=False))
+    return result
+
+
+def run_plot(
+    module: Any, plot: Plot, data: Dict[str, Any], output_dir: Union[str, Path]
+) -> Any:
+    """
+    Draw one declared figure into output_dir.
+
+    Parameters:
+    - module (Any): The experiment's module.
+    - plot (Plot): The figure.
+    - data (Dict[str, Any]): Data by name; must hold the plot's data.
+    - output_dir (str | Path): Figure directory.
+
+    Returns:
+    - Any: What the plot function returned, normally the figure path.
+    """
+    return getattr(module, plot.function)(data[plot.data], output_dir)
+
+
+def run_experiment(
+    experiment: Union[str, Experiment], root: Union[str, Path] = "."
+) -> Optional[Dict[str, Any]]:
+    """
+    Run an experiment's workflow: load its inputs, run its steps and plots.
+
+    Parameters:
+    - experiment (str | Experiment): The experiment or its registered name.
+    - root (str | Path): Project root that the declared paths are relative to.
+
+    Returns:
+    - Optional[Dict[str, Any]]: The loaded and computed data by name, or None
+      if an input could not be loaded.
+    """
+    if isinstance(experiment, str):
+        experiment = get_experiment(experiment)
+    root = Path(root)
+    module = experiment.load_module()
+    logger.info("Starting the %s data processing workflow...", experiment.title)
+
+    logger.info("\n--> Step 1: Loading raw data...")
+    data: Dict[str, Any] = {}
+    for name, source in experiment.inputs.items():
+        try:
+            data[name] = load_input(source, root)
+        except ValueError as e:
+            logger.error("Error: %s", e)
+            return None
+
+    if experiment.steps:
+        logger.info("\n--> Step 2: Analyzing data...")
+    for step in experiment.steps:
+        data[step.output] = run_step(module, step, data, root)
+
+    output_dir = root / experiment.output_dir
+    if experiment.plots:
+        logger.info("\n--> Step 3: Plotting and saving figures to '%s'...", output_dir)
+    for plot in experiment.plots:
+        run_plot(module, plot, data, output_dir)
+
+    logger.info(
+        "\n%s data processing workflow completed successfully!", experiment.title
+    )
+    return data
+
+
+def run_experiments(
+    names: Iterable[str], root: Union[str, Path] = "."
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Run several experiments in one interpreter, in order.
+
+    Parameters:
+    - names (Iterable[str]): Registered experiment names.
+    - root (str | Path): Project root.
+
+    Returns:
+    - List[Optional[Dict[str, Any]]]: The result of each run_experiment call.
+    """
+    experiments = [get_experiment(name) for name in names]
+    return [run_experiment(experiment, root) for experiment in experiments]
@@ -0,0 +1,142 @@
+# src/physicslab/render_pool.py
+
+from __future__ import annotations
+
+import logging
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Union
+
+from physicslab.logs import file_event
+from physicslab.plot_utils import ProfileLike, get_render_profile
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RenderJob:
+    """
+    One figure to render: a plot function, its data and where to write it.
+
+    Attributes:
+    - plot (Callable): A module-level plot function taking
+      ``(processed_df, output_dir, **kwargs)``, e.g. ``plot_ln_R_T_vs_1_T``.
+    - data (pd.DataFrame): The processed DataFrame to plot.
+    - output_dir (str | Path): Directory the figure is saved to.
+    - kwargs (Dict[str, Any]): Extra keyword arguments for ``plot``.
+    - name (Optional[str]): Label used in results; defaults to
+      ``"<plot name> -> <output_dir>"``.
+    """
+
+    plot: Callable[..., Any]
+    data: pd.DataFrame
+    output_dir: Union[str, Path]
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    name: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.name is None:
+            self.name = f"{self.plot.__name__} -> {self.output_dir}"
+
+
+@dataclass
+class RenderResult:
+    """
+    Outcome of a RenderJob.
+
+    Attributes:
+    - name (str): The job name.
+    - ok (bool): Whether the figure was rendered and saved.
+    - seconds (float): Wall time spent in the plot function.
+    - error (Optional[str]): The formatted traceback if the job failed.
+    """
+
+    name: str
+    ok: bool
+    seconds: float
+    error: Optional[str] = None
+
+
+def _init_worker(profile: ProfileLike) -> None:
+    # Runs once per worker: configure the style, go headless and load the
+    # font cache now so that every job afterwards starts warm.
+    import matplotlib.font_manager as fm
+    import matplotlib.pyplot as plt
+
+    from physicslab.plot_utils import setup_plot_style
+
+    setup_plot_style(profile)
+    plt.switch_backend("agg")
+    fm.findfont(fm.FontProperties(family=plt.rcParams["font.family"]))
+
+
+def _run_job(job: RenderJob) -> RenderResult:
+    start = time.perf_counter()
+    try:
+        job.plot(job.data, job.output_dir, **job.kwargs)
+    except Exception:
+        return RenderResult(
+            job.name, False, time.perf_counter() - start, traceback.format_exc()
+        )
+    return RenderResult(job.name, True, time.perf_counter() - start)
+
+
+def render_jobs(
+    jobs: Iterable[RenderJob],
+    workers: Optional[int] = None,
+    profile: ProfileLike = None,
+) -> List[RenderResult]:
+    """
+    Render figures in parallel across a pool of worker processes.
+
+    Each worker calls setup_plot_style once at start-up and then renders
+    jobs with the Agg backend. A failing job does not stop the others; its
+    traceback is reported in the corresponding result.
+
+    Parameters:
+    - jobs (Iterable[RenderJob]): The figures to render.
+    - workers (Optional[int]): Number of worker processes; defaults to the
+      number of CPUs.
+    - profile (str | RenderProfile | None): Render profile for the workers;
+      defaults to the profile active in this process.
+
+    Returns:
+    - List[RenderResult]: One result per job, in job order.
+    """
+    jobs = list(jobs)
+    render_profile = get_render_profile(profile)
+    results: List[RenderResult] = []
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(render_profile,)
+    ) as executor:
+        futures = [executor.submit(_run_job, job) for job in jobs]
+        for job, future in zip(jobs, futures):
+            try:
+                results.append(future.result())
+            except Exception:
+                # The job never ran, e.g. it could not be pickled
+                results.append(
+                    RenderResult(job.name, False, 0.0, traceback.format_exc())
+                )
+
+    failed = [result for result in results if not result.ok]
+    logger.info(
+        "📈 Rendered %d of %d figures", len(results) - len(failed), len(results)
+    )
+    for result in failed:
+        file_event(
+            logger,
+            "figure",
+            result.name,
+            "❌ ERROR: %s failed:\n%s",
+            result.name,
+            result.error,
+            level=logging.ERROR,
+        )
+    return results
@@ -0,0 +1,286 @@
+# src/physicslab/runner.py
+
+import time
+import traceback
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from physicslab.plot_utils import ProfileLike, get_render_profile
+from physicslab.registry import (
+    Experiment,
+    get_experiment,
+    load_input,
+    run_plot,
+    run_step,
+)
+from physicslab.tracing import TRACER, Span
+
+
+@dataclass
+class StageResult:
+    """
+    Outcome of one stage of a concurrent run.
+
+    Attributes:
+    - experiment (str): The experiment name.
+    - stage (str): The stage, e.g. "load electric" or "plot_N_vs_T".
+    - kind (str): "load", "step" or "plot".
+    - status (str): "ok", "failed", or "skipped" when an input failed.
+    - started (float): Start time in seconds since the run began, measured
+      with the wall clock so stages from several processes line up.
+    - seconds (float): Wall time of the stage.
+    - error (Optional[str]): The formatted traceback if the stage failed.
+    """
+
+    experiment: str
+    stage: str
+    kind: str
+    status: str
+    started: float = 0.0
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class _Task:
+    experiment: Experiment
+    stage: str
+    kind: str
+    needs: Tuple[str, ...]
+    provides: Optional[str]
+    call: Callable[[Dict[str, Any]], Any]
+
+
+def _tasks(experiment: Experiment, root: Path) -> List[_Task]:
+    # One task per input, step and plot; dependencies are the data names
+    tasks = []
+    for name, source in experiment.inputs.items():
+        tasks.append(
+            _Task(
+                experiment,
+                f"load {name}",
+                "load",
+                (),
+                name,
+                lambda data, source=source: load_input(source, root),
+            )
+        )
+    for step in experiment.steps:
+        tasks.append(
+            _Task(
+                experiment,
+                step.function,
+                "step",
+                step.inputs,
+                step.output,
+                lambda data, step=step: run_step(
+                    experiment.load_module(), step, data, root
+                ),
+            )
+        )
+    output_dir = root / experiment.output_dir
+    for plot in experiment.plots:
+        tasks.append(
+            _Task(
+                experiment,
+                plot.function,
+                "plot",
+                (plot.data,),
+                None,
+                lambda data, plot=plot: run_plot(
+                    experiment.load_module(), plot, data, output_dir
+                ),
+            )
+        )
+    return tasks
+
+
+def _run_stages(
+    experiments: List[Experiment],
+    root: Path,
+    threads: Optional[int],
+    origin: float,
+) -> List[StageResult]:
+    # Schedules the stages of the experiments on a thread pool, each as soon
+    # as its inputs are available
+    pending = [task for experiment in experiments for task in _tasks(experiment, root)]
+    data: Dict[str, Dict[str, Any]] = {e.name: {} for e in experiments}
+    failed: Dict[str, Set[str]] = {e.name: set() for e in experiments}
+    results: List[StageResult] = []
+
+    def execute(task: _Task) -> StageResult:
+        result = StageResult(
+            task.experiment.name, task.stage, task.kind, "ok", time.time() - origin
+        )
+        start = time.perf_counter()
+        try:
+            value = task.call(data[task.experiment.name])
+        except Exception:
+            result.status = "failed"
+            result.error = traceback.format_exc()
+        else:
+            if task.provides is not None:
+                data[task.experiment.name][task.provides] = value
+        result.seconds = time.perf_counter() - start
+        return result
+
+    running: Dict[Future, _Task] = {}
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        while pending or running:
+            waiting = []
+            for task in pending:
+                name = task.experiment.name
+                if any(need in failed[name] for need in task.needs):
+                    results.append(StageResult(name, task.stage, task.kind, "skipped"))
+                    if task.provides is not None:
+                        failed[name].add(task.provides)
+                elif all(need in data[name] for need in task.needs):
+                    running[executor.submit(execute, task)] = task
+                else:
+                    waiting.append(task)
+            pending = waiting
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                task = running.pop(future)
+                result = future.result()
+                results.append(result)
+                if result.status != "ok" and task.provides is not None:
+                    failed[task.experiment.name].add(task.provides)
+    return results
+
+
+def _run_in_worker(
+    name: str,
+    root: Path,
+    threads: Optional[int],
+    origin: float,
+    trace: bool = False,
+    memory: bool = False,
+) -> Tuple[List[StageResult], List[Span]]:
+    # Workers are reused across experiments, so each run starts a fresh trace
+    TRACER.clear()
+    if trace:
+        TRACER.start(memory)
+    try:
+        results = _run_stages([get_experiment(name)], root, threads, origin)
+    finally:
+        TRACER.stop()
+    return results, TRACER.spans
+
+
+def run_concurrently(
+    names: Iterable[str],
+    root: Union[str, Path] = ".",
+    workers: Optional[int] = None,
+    processes: bool = True,
+    threads: Optional[int] = None,
+    profile: ProfileLike = None,
+) -> List[StageResult]:
+    """
+    Run experiments side by side, overlapping their independent stages.
+
+    Every input load, analysis step and plot becomes a task that starts as
+    soon as the data it needs is available, so e.g. the three e-beam CSVs
+    load together and the two thermal plots render together. By default each
+    experiment runs in its own worker process, since drawing figures is
+    CPU-bound and would otherwise contend for the GIL; its stages overlap on
+    threads within that process. A failing stage does not stop the others;
+    stages depending on its output are skipped. While the tracer in
+    physicslab.tracing is enabled, the spans recorded by the workers are
+    added to it.
+
+    Parameters:
+    - names (Iterable[str]): Registered experiment names.
+    - root (str | Path): Project root that the declared paths are relative to.
+    - workers (Optional[int]): Number of worker processes (threads when
+      processes is False); defaults to the number of CPUs.
+    - processes (bool): Run experiments in worker processes.
+    - threads (Optional[int]): Threads per experiment process.
+    - profile (str | RenderProfile | None): Render profile for the worker
+      processes; defaults to the profile active in this process.
+
+    Returns:
+    - List[StageResult]: One result per stage.
+    """
+    from physicslab.render_pool import _init_worker
+
+    root = Path(root)
+    experiments = [get_experiment(name) for name in names]
+    origin = time.time()
+
+    if not processes:
+        results = _run_stages(experiments, root, workers, origin)
+    else:
+        results = []
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(get_render_profile(profile),),
+        ) as executor:
+            futures = {
+                experiment.name: executor.submit(
+                    _run_in_worker,
+                    experiment.name,
+                    root,
+                    threads,
+                    origin,
+                    TRACER.enabled,
+                    TRACER.memory,
+                )
+                for experiment in experiments
+            }
+            for name, future in futures.items():
+                try:
+                    stages, spans = future.result()
+                    results.extend(stages)
+                    TRACER.extend(spans)
+                except Exception:
+                    # The worker itself died, e.g. the module failed to import
+                    results.append(
+                        StageResult(
+                            name,
+                            "run",
+                            "experiment",
+                            "failed",
+                            error=traceback.format_exc(),
+                        )
+                    )
+
+    print_summary(results, time.time() - origin)
+    return results
+
+
+def print_summary(results: List[StageResult], wall_seconds: float) -> None:
+    """
+    Print per-stage wall times and how much the stages overlapped.
+
+    Parameters:
+    - results (List[StageResult]): The stage results.
+    - wall_seconds (float): Wall time of the whole run.
+    """
+    print("\n--- ⏱️ Stage timings ---")
+    for result in sorted(results, key=lambda r: (r.experiment, r.started)):
+        status = {"ok": "✅", "failed": "❌", "skipped": "⏭️"}[result.status]
+        print(
+            f"{status} {result.experiment:<28} {result.stage:<40} "
+            f"{result.seconds:8.3f} s"
+        )
+    busy = sum(result.seconds for result in results)
+    print(f"Total: {wall_seconds:.3f} s wall for {busy:.3f} s of stage time")
+    for result in results:
+        if result.status == "failed":
+            print(
+                f"❌ ERROR: {result.experiment} / {result.stage} failed:\n"
+                f"{result.error}"
+            )
@@ -1,24 +1,41 @@
 # src/physicslab/sucrose_polarimetry/processing.py
 
-import os
-import pandas as pd
-import numpy as np
-from scipy.optimize import curve_fit
-from pathlib import Path
-from physicslab.plot_utils import create_figure, save_figure
-
+from __future__ import annotations
 
-def analyze_average_angle_deg(raw_df: pd.DataFrame) -> pd.DataFrame:
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Mapping, Optional
+from physicslab.fitting import linear_fit
+from physicslab.plot_utils import (
+    FigureCache,
+    FigureTemplate,
+    OutputLike,
+    PlotSeries,
+    PlotSpec,
+    ProfileLike,
+    fit_line,
+    montage_from_frames,
+    render_plot,
+)
+from physicslab.tracing import instrument
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@instrument("analyze")
+def analyze_average_angle_deg(raw_df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
     """
     Analyze sucrose polarimetry data to compute average angles.
 
     Parameters:
     raw_df (pd.DataFrame): DataFrame containing raw data with columns 'trial1_deg', 'trial2_deg', 'trial3_deg'.
+    copy (bool): Work on a copy of raw_df. Pass False to add the columns in place,
+                 e.g. for chunks that nothing else holds on to.
 
     Returns:
     pd.DataFrame: DataFrame with computed average angles.
     """
-    df = raw_df.copy()
+    df = raw_df.copy() if copy else raw_df
     # Alias for consistency
     if "sucrose_concentration_kg_m3" in df.columns:
         df["sucrose_concentration"] = df["sucrose_concentration_kg_m3"]
@@ -44,14 +61,21 @@ def calculate_c_x(phi_x: float, phi_0: float, B: float) -> float:
     return (phi_x - phi_0) * B
 
 
-def plot_average_angle_vs_concentration(
-    processed_df: pd.DataFrame, output_dir: str | Path
-):
+AVERAGE_ANGLE_VS_CONCENTRATION = PlotSpec(
+    title="平均旋光角与蔗糖浓度关系",
+    xlabel="$c/(kg/m³)$",
+    ylabel=r"$\phi$",
+    filename="average_angle_vs_concentration.png",
+)
+
+
+def average_angle_vs_concentration_series(
+    processed_df: pd.DataFrame,
+) -> List[PlotSeries]:
     """
-    Plot average angle vs sucrose concentration and save the figure.
+    Compute the data points and fitted line of the average angle vs concentration plot.
     """
-    output_dir = Path(output_dir)
-    os.makedirs(output_dir, exist_ok=True)
+    import pandas as pd
 
     df = processed_df.copy()
     if "sucrose_concentration_kg_m3" in df.columns:
@@ -63,26 +87,57 @@ def plot_average_angle_vs_concentration(
     )
     df["average_angle_deg"] = pd.to_numeric(df["average_angle_deg"], errors="coerce")
     df1 = df.dropna(subset=["average_angle_deg", "sucrose_concentration"])
-    x1 = df1["sucrose_concentration"]
-    y1 = df1["average_angle_deg"]
+    x1 = df1["sucrose_concentration"].to_numpy()
+    y1 = df1["average_angle_deg"].to_numpy()
 
-    fig, ax1 = create_figure(
-        title="平均旋光角与蔗糖浓度关系",
-        xlabel="$c/(kg/m³)$",
-        ylabel="$\phi$",
-    )
-    ax1.scatter(x1, y1, color="blue", label="数据点")
+    series = PlotSeries(x1, y1, color="blue", label="数据点")
 
     # Fit a linear model
-    def linear_model(x, m, b):
-        return m * x + b
-
     if len(x1) >= 2:  # Ensure there are enough points to fit
-        popt, pcov = curve_fit(linear_model, x1, y1)
-        m, b = popt
-        x_fit = np.linspace(min(x1), max(x1), 100)
-        y_fit = linear_model(x_fit, m, b)
-        ax1.plot(x_fit, y_fit, color="red", label=f"拟合: y={m:.2f}x+{b:.2f}")
-        ax1.legend()
-
-    save_figure(fig, output_dir / "average_angle_vs_concentration.png")
+        fit = linear_fit(x1, y1)
+        m, b = fit.slope, fit.intercept
+        series.fit_x, series.fit_y = fit_line(x1, fit)
+        series.fit_color = "red"
+        series.fit_label = f"拟合: y={m:.2f}x+{b:.2f}"
+
+    return [series]
+
+
+def plot_average_angle_vs_concentration(
+    processed_df: pd.DataFrame,
+    output_dir: OutputLike,
+    profile: ProfileLike = None,
+    template: Optional[FigureTemplate] = None,
+    format: Optional[str] = None,
+    cache: Optional[FigureCache] = None,
+):
+    """
+    Plot average angle vs sucrose concentration and save the figure.
+    """
+    series = average_angle_vs_concentration_series(processed_df)
+    return render_plot(
+        AVERAGE_ANGLE_VS_CONCENTRATION,
+        series,
+        output_dir,
+        profile,
+        template,
+        format,
+        cache,
+    )
+
+
+def plot_average_angle_vs_concentration_montage(
+    processed_dfs: Mapping[str, pd.DataFrame],
+    output_dir: str | Path | None,
+    **montage_kwargs,
+) -> List[Path | bytes]:
+    """
+    Plot average angle vs concentration for many submissions as paged montages.
+    """
+    return montage_from_frames(
+        AVERAGE_ANGLE_VS_CONCENTRATION,
+        average_angle_vs_concentration_series,
+        processed_dfs,
+        output_dir,
+        **montage_kwargs,
+    )
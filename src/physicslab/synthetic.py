@@ -0,0 +1,398 @@
+# src/physicslab/synthetic.py
+
+# Synthetic raw data in the exact layout of the files under data/raw/.
+#
+# Every generator draws from a simple physical model of its experiment, with
+# noise of the size seen in the real measurements, and scales by the number
+# of data rows (readings, tubes, voltage levels, ...). Datasets are written
+# into a project root (root/data/raw/<experiment>/...), so a generated root
+# can be processed by `physicslab run`/`build` like a real submission.
+#
+# Run `python -m physicslab.synthetic --help` to generate datasets.
+
+import argparse
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple, Union
+
+import numpy as np
+
+# A column-oriented table: header cell -> formatted cells of that column
+Columns = Dict[str, List[str]]
+# A label-per-row table: (first cell, remaining cells) per row
+Rows = List[Tuple[str, Sequence[str]]]
+Table = Union[Columns, Rows]
+Generator = Callable[[int, np.random.Generator], Dict[str, Table]]
+
+
+def _fmt(values: np.ndarray, decimals: int) -> List[str]:
+    """Fixed-point cells, e.g. "6.41" for readings."""
+    # A plain comprehension formats several times faster than np.char.mod
+    return [f"{value:.{decimals}f}" for value in np.asarray(values).tolist()]
+
+
+def _fmt_short(values: np.ndarray, decimals: int) -> List[str]:
+    """Shortest cells after rounding, e.g. "0.2" or "600" for set points."""
+    values = np.round(np.asarray(values, dtype=float), decimals)
+    return [f"{value:g}" for value in values.tolist()]
+
+
+def _blank(count: int) -> List[str]:
+    return [""] * count
+
+
+def _noisy(values: np.ndarray, rng: np.random.Generator, relative: float) -> np.ndarray:
+    return values * (1 + rng.normal(0.0, relative, np.shape(values)))
+
+
+def thermal_resistor(rows: int, rng: np.random.Generator) -> Dict[str, Table]:
+    """
+    Row-oriented readings of an NTC thermistor, one column per temperature.
+
+    Parameters:
+    - rows (int): Number of temperature readings (at least 2).
+    - rng (np.random.Generator): Random source.
+
+    Returns:
+    - Dict[str, Table]: source_data.csv.
+    """
+    t = np.linspace(35.0, 80.0, max(rows, 2))
+    # R = A exp(B / T) with B ~ 3600 K reproduces the sample readings
+    r = _noisy(1831.0 * np.exp(3612.0 * (1 / (t + 273.15) - 1 / 308.15)), rng, 0.01)
+    n = np.clip(_noisy((t - 35.0) / 45.0 * 100.0, rng, 0.03), 0.0, 100.0)
+    # The computed rows are left empty and, as in the lab sheets, one cell short
+    empty = _blank(len(t) - 1)
+    table: Rows = [
+        ("t/℃", _fmt_short(t, 2)),
+        ("T/K", empty),
+        ("1/T (10^-2 K^-1)", empty),
+        ("R_T/Ω", _fmt(r, 1)),
+        ("ln R_T", empty),
+        ("-w/(%·K^-1)", _fmt(-r / 100, 3)),
+        ("N", _fmt(n, 1)),
+    ]
+    return {"source_data.csv": table}
+
+
+def e_beam_deflection_analysis(rows: int, rng: np.random.Generator) -> Dict[str, Table]:
+    """
+    Electric and magnetic deflection of an electron beam at two anode voltages.
+
+    Parameters:
+    - rows (int): Number of deflection readings per file.
+    - rng (np.random.Generator): Random source.
+
+    Returns:
+    - Dict[str, Table]: The deflection, focus and e/m files.
+    """
+    per_voltage = max(rows // 2, 2)
+    v2 = np.repeat([600, 800], per_voltage)
+
+    d_y = np.tile(np.linspace(-25.0, 25.0, per_voltage), 2)
+    # The deflecting voltage grows with the anode voltage for the same D_Y
+    v_d = _noisy(d_y * v2 * 0.00140, rng, 0.02)
+    electric: Columns = {
+        "V2_V": _fmt_short(v2, 0),
+        "Dy_mm": _fmt_short(d_y, 3),
+        "Vd_V": _fmt(v_d, 1),
+    }
+
+    current = np.tile(np.linspace(10.0, 100.0, per_voltage), 2)
+    d_b = _noisy(3.55 * current / np.sqrt(v2), rng, 0.03)
+    magnetic: Columns = {
+        "V2_V": _fmt_short(v2, 0),
+        "I_mA": _fmt_short(current, 3),
+        "Db_mm": _fmt(d_b, 1),
+    }
+
+    focus_v2 = np.round(np.linspace(600, 1000, max(rows // 4, 5)))
+    focus_v1 = np.round(_noisy(focus_v2 / 5.18, rng, 0.01))
+    focus: Columns = {
+        "V2_V": _fmt_short(focus_v2, 0),
+        "V1_V": _fmt_short(focus_v1, 0),
+        "V2_div_V1": _fmt(focus_v2 / focus_v1, 2),
+    }
+
+    v = np.round(np.linspace(800, 1100, max(rows // 10, 2)))
+    i_forward = np.round(_noisy(0.0198 * np.sqrt(v), rng, 0.03), 2)
+    i_reverse = np.round(_noisy(0.0198 * np.sqrt(v), rng, 0.03), 2)
+    em_ratio: Columns = {
+        "V_V": _fmt_short(v, 0),
+        "I_forward_A": _fmt(i_forward, 2),
+        "I_reverse_A": _fmt(i_reverse, 2),
+        "I_avg_A": _fmt((i_forward + i_reverse) / 2, 2),
+    }
+    return {
+        "elec_deflection_y_data.csv": electric,
+        "mag_deflection_data.csv": magnetic,
+        "elec_focus_data.csv": focus,
+        "em_ratio_mag_focus.csv": em_ratio,
+    }
+
+
+def e_field_mapping(rows: int, rng: np.random.Generator) -> Dict[str, Table]:
+    """
+    Equipotential diameters of a coaxial field, seven per potential ratio.
+
+    Parameters:
+    - rows (int): Number of potential ratios.
+    - rng (np.random.Generator): Random source.
+
+    Returns:
+    - Dict[str, Table]: equipotential_mapping_data.csv.
+    """
+    ratio = np.linspace(0.2, 0.8, max(rows, 2))
+    # ln d grows linearly with V_r / V_B between the electrodes
+    diameter = np.exp(0.627 + 2.07 * ratio)
+    table: Columns = {"V_R_over_V_B": _fmt_short(ratio, 6)}
+    for i in range(1, 8):
+        table[f"d{i}_cm"] = _fmt(_noisy(diameter, rng, 0.01), 2)
+    for name in ("d_bar_cm", "r_bar_cm", "ln_r", "ln_r_over_ln_7"):
+        table[name] = _blank(len(ratio))
+    return {"equipotential_mapping_data.csv": table}
+
+
+def sucrose_polarimetry(rows: int, rng: np.random.Generator) -> Dict[str, Table]:
+    """
+    Rotation angles of sucrose solutions, five left/right trials each, plus
+    one sample of unknown concentration.
+
+    Parameters:
+    - rows (int): Number of solutions including the unknown one.
+    - rng (np.random.Generator): Random source.
+
+    Returns:
+    - Dict[str, Table]: rotation_angles.csv.
+    """
+    concentration = np.linspace(0.0, 100.0, max(rows - 1, 2))
+    # The last row is the sample of unknown concentration
+    angle = 0.129 * np.append(concentration, rng.uniform(20.0, 80.0))
+    readings = angle[:, np.newaxis] + rng.normal(0.0, 0.2, (len(angle), 10))
+    readings = np.round(np.maximum(readings, 0.0), 2)
+
+    table: Columns = {
+        "sucrose_concentration_kg_m3": _fmt_short(concentration, 4) + ["unknown"]
+    }
+    for i in range(10):
+        table[f"trial{i // 2 + 1}_{('left', 'right')[i % 2]}"] = _fmt(readings[:, i], 2)
+    table["average_angle_deg"] = _fmt(readings.mean(axis=1), 2)
+    table["angle_deg"] = ["-"] + _blank(len(angle) - 1)
+    return {"rotation_angles.csv": table}
+
+
+def _subscript(numbers: Iterable[int]) -> List[str]:
+    digits = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
+    return [str(number).translate(digits) for number in numbers]
+
+
+def viscosity_measurement(rows: int, rng: np.random.Generator) -> Dict[str, Table]:
+    """
+    Falling-ball viscometer readings: one steel ball dropped five times through
+    each of several tubes of decreasing diameter.
+
+    Parameters:
+    - rows (int): Number of tubes.
+    - rng (np.random.Generator): Random source.
+
+    Returns:
+    - Dict[str, Table]: The ball diameter, fall time, tube diameter and timer
+      distance files.
+    """
+    tubes = max(rows, 2)
+    trials = ["1", "2", "3", "4", "5"]
+    ball = 2.467
+    tube = np.linspace(45.5, 20.9, tubes)
+    # Fall time with the Ladenburg wall correction, t = t_0 (1 + 2.4 d / D)
+    fall = 5.66 * (1 + 2.4 * ball / tube)
+
+    diameters: Rows = [
+        ("测量次序", trials + ["平均值"]),
+        ("d = (dᵢ - d₀) / mm", _fmt(ball + rng.normal(0.0, 0.006, 5), 3) + ["d̅ ="]),
+        ("Δd = |(dᵢ - d₀) - d̅| / mm", _blank(5) + ["Δd̅ ="]),
+    ]
+
+    def per_tube(symbol: str, values: np.ndarray, header: str) -> Rows:
+        # A reading row and an empty uncertainty row per tube
+        cells = _fmt(values, 2)
+        table: Rows = [(header, trials + ["平均值"])]
+        empty = _blank(6)
+        for k, index in enumerate(_subscript(range(1, tubes + 1))):
+            table.append((f"{symbol}{index}", cells[5 * k : 5 * k + 5] + [""]))
+            table.append((f"Δ{symbol}{index}", empty))
+        return table
+
+    times = fall[:, np.newaxis] + rng.normal(0.0, 0.04, (tubes, 5))
+    tube_diameters = tube[:, np.newaxis] + rng.normal(0.0, 0.09, (tubes, 5))
+    distance: Rows = [
+        ("测量次序", ["1", "2", "3", "4", "平均值"]),
+        ("距离 s/mm", _fmt(196.0 + rng.normal(0.0, 1.0, 4), 1) + [""]),
+        ("Δs/mm", _blank(5)),
+    ]
+    return {
+        "steel_ball_diameters.csv": diameters,
+        "steel_ball_fall_time.csv": per_tube("t", times.ravel(), "时间/s"),
+        "test_tube_diameters.csv": per_tube("D", tube_diameters.ravel(), "直径/mm"),
+        "timer_distance.csv": distance,
+    }
+
+
+def meter_modification(rows: int, rng: np.random.Generator) -> Dict[str, Table]:
+    """
+    Calibration of a modified ammeter and voltmeter against standard meters,
+    and the deflection of a modified ohmmeter.
+
+    Parameters:
+    - rows (int): Number of calibration points per meter.
+    - rng (np.random.Generator): Random source.
+
+    Returns:
+    - Dict[str, Table]: i_meter.csv, v_meter.csv and ohm_meter.csv.
+    """
+    divisions = np.linspace(100.0 / max(rows, 2), 100.0, max(rows, 2))
+
+    def calibration(full_scale: float, quantity: str, unit: str, meter: str) -> Columns:
+        reading = divisions / 100 * full_scale
+        table: Columns = {
+            "Number of Scale Divisions to be Modified": _fmt(divisions, 1),
+            f"Modified {meter} Reading {quantity}_X/{unit}": _fmt_short(reading, 4),
+        }
+        for direction in ("Decreasing", "Increasing"):
+            name = (
+                f"Standard {meter} Reading ({direction} Divisions) {quantity}_0/{unit}"
+            )
+            table[name] = _fmt(_noisy(reading * 0.985, rng, 0.01), 4)
+        table["Average Value"] = _blank(len(divisions))
+        error = f"Error Δ{quantity}/{unit} (Δ{quantity} = {quantity}_0 - {quantity}_X)"
+        table[error] = _blank(len(divisions))
+        return table
+
+    # Resistances as multiples of the mid-scale resistance
+    labels = ["1/5 R_mid", "1/4 R_mid", "1/3 R_mid", "1/2 R_mid", "R_mid"]
+    labels += ["2R_mid", "3R_mid", "4R_mid", "5R_mid"]
+    factors = np.array([1 / 5, 1 / 4, 1 / 3, 1 / 2, 1, 2, 3, 4, 5])
+    deflection = _noisy(100 / (1 + factors), rng, 0.005)
+    ohm: Rows = [("R_X/Ω", labels), ("Deflection Divisions", _fmt(deflection, 1))]
+    return {
+        "i_meter.csv": calibration(1.0, "I", "mA", "Ammeter"),
+        "v_meter.csv": calibration(1.5, "U", "V", "Voltmeter"),
+        "ohm_meter.csv": ohm,
+    }
+
+
+GENERATORS: Dict[str, Generator] = {
+    "thermal_resistor": thermal_resistor,
+    "e_beam_deflection_analysis": e_beam_deflection_analysis,
+    "e_field_mapping": e_field_mapping,
+    "sucrose_polarimetry": sucrose_polarimetry,
+    "viscosity_measurement": viscosity_measurement,
+    "meter_modification": meter_modification,
+}
+
+
+def _write_table(table: Table, filepath: Path) -> None:
+    with open(filepath, "w", encoding="utf-8", newline="") as f:
+        if isinstance(table, dict):
+            f.write(",".join(table) + "\n")
+            f.writelines(",".join(row) + "\n" for row in zip(*table.values()))
+        else:
+            f.writelines(",".join([label, *cells]) + "\n" for label, cells in table)
+
+
+def write_dataset(
+    experiment: str, root: Union[str, Path], rows: int, seed: int = 0
+) -> List[Path]:
+    """
+    Write one synthetic dataset into root/data/raw/<experiment>/.
+
+    Parameters:
+    - experiment (str): A name from GENERATORS.
+    - root (str | Path): Project root to write into.
+    - rows (int): Size of the dataset; what a row is depends on the
+      experiment, e.g. a temperature reading or a tube.
+    - seed (int): Random seed; the same seed gives the same files.
+
+    Returns:
+    - List[Path]: The written files.
+    """
+    try:
+        generate = GENERATORS[experiment]
+    except KeyError:
+        raise ValueError(
+            f"No generator for {experiment!r}; choose one of {', '.join(GENERATORS)}"
+        ) from None
+    directory = Path(root) / "data" / "raw" / experiment
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for filename, table in generate(rows, np.random.default_rng(seed)).items():
+        _write_table(table, directory / filename)
+        paths.append(directory / filename)
+    return paths
+
+
+def write_submissions(
+    experiments: Iterable[str],
+    directory: Union[str, Path],
+    rows: int,
+    submissions: int,
+    seed: int = 0,
+) -> List[Path]:
+    """
+    Write a cohort of submissions, each a project root with its own data.
+
+    Parameters:
+    - experiments (Iterable[str]): Names from GENERATORS.
+    - directory (str | Path): Directory to create the roots in, named
+      ``submission_00001`` and so on.
+    - rows (int): Size of every dataset.
+    - submissions (int): Number of submissions.
+    - seed (int): Base random seed; submission i uses ``seed + i``.
+
+    Returns:
+    - List[Path]: The submission roots.
+    """
+    experiments = list(experiments)
+    roots = []
+    for i in range(submissions):
+        root = Path(directory) / f"submission_{i + 1:05d}"
+        for experiment in experiments:
+            write_dataset(experiment, root, rows, seed + i)
+        roots.append(root)
+    return roots
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Write synthetic raw data in the layout of data/raw/."
+    )
+    parser.add_argument("out", type=Path, help="directory to write into")
+    parser.add_argument(
+        "-e",
+        "--experiment",
+        action="append",
+        choices=list(GENERATORS),
+        help="experiment to generate; repeatable (default: all)",
+    )
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument(
+        "--submissions",
+        type=int,
+        default=1,
+        help="write this many submission roots under OUT instead of one root",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    experiments = args.experiment or list(GENERATORS)
+    if args.submissions > 1:
+        roots = write_submissions(
+            experiments, args.out, args.rows, args.submissions, args.seed
+        )
+        print(f"✅ Wrote {len(roots)} submissions to {args.out}")
+    else:
+        for experiment in experiments:
+            for path in write_dataset(experiment, args.out, args.rows, args.seed):
+                print(f"✅ Wrote {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,145 @@
+# src/physicslab/thermal_resistor/live.py
+
+import argparse
+import math
+import socket
+import time
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, Tuple, Union
+
+from physicslab.fitting import OnlineLinearFit
+
+
+def follow_file(
+    filepath: Union[str, Path],
+    poll_interval: float = 0.5,
+    idle_timeout: Optional[float] = None,
+) -> Iterator[str]:
+    """
+    Yields the lines of a growing file, like ``tail -f``.
+
+    The file is read from the start, then polled for appended lines.
+
+    Args:
+        filepath (str | Path): The log file written by the data logger.
+        poll_interval (float): Seconds to wait when no new line is available.
+        idle_timeout (float, optional): Stop after this many seconds without a
+            new line. By default the file is followed forever.
+
+    Yields:
+        str: Each complete line, without the trailing newline.
+    """
+    with open(filepath, encoding="utf-8") as f:
+        pending = ""
+        last_data = time.monotonic()
+        while True:
+            chunk = f.readline()
+            if not chunk:
+                if idle_timeout is not None and (
+                    time.monotonic() - last_data > idle_timeout
+                ):
+                    return
+                time.sleep(poll_interval)
+                continue
+            last_data = time.monotonic()
+            pending += chunk
+            if pending.endswith("\n"):
+                yield pending.rstrip("\r\n")
+                pending = ""
+
+
+def socket_lines(host: str = "127.0.0.1", port: int = 5555) -> Iterator[str]:
+    """
+    Yields newline-terminated readings sent over TCP by an instrument stand-in.
+
+    Args:
+        host (str): Host of the instrument server.
+        port (int): Port of the instrument server.
+
+    Yields:
+        str: Each received line, until the server closes the connection.
+    """
+    with socket.create_connection((host, port)) as conn:
+        with conn.makefile("r", encoding="utf-8") as stream:
+            for line in stream:
+                yield line.rstrip("\r\n")
+
+
+def parse_reading(line: str) -> Optional[Tuple[float, float]]:
+    """
+    Parses a 't/℃,R_T/Ω' reading into (1/T in K^-1, ln R_T).
+
+    Returns None for headers, blank lines and unphysical values.
+    """
+    try:
+        t_celsius, r_ohm = (float(value) for value in line.split(",")[:2])
+    except ValueError:
+        return None
+    T = t_celsius + 273.15
+    if T <= 0 or r_ohm <= 0:
+        return None
+    return 1 / T, math.log(r_ohm)
+
+
+def live_ln_R_T_fit(
+    lines: Iterable[str],
+    on_update: Optional[Callable[[OnlineLinearFit], None]] = None,
+) -> OnlineLinearFit:
+    """
+    Fits ln(R_T) against 1/T incrementally as readings arrive.
+
+    Each reading updates the running fit in O(1), so the slope, intercept and
+    their standard errors are available after every sample regardless of how
+    long the session has been running.
+
+    Args:
+        lines (Iterable[str]): Raw 't/℃,R_T/Ω' readings, e.g. from ``follow_file``
+                               or ``socket_lines``.
+        on_update (Callable, optional): Called with the fit after each reading.
+
+    Returns:
+        OnlineLinearFit: The fit over all readings once ``lines`` is exhausted.
+    """
+    fit = OnlineLinearFit()
+    for line in lines:
+        reading = parse_reading(line)
+        if reading is None:
+            continue
+        fit.update(*reading)
+        if on_update is not None:
+            on_update(fit)
+    return fit
+
+
+def _print_fit(fit: OnlineLinearFit) -> None:
+    if fit.n < 3:
+        print(f"n={fit.n}: waiting for more readings...")
+        return
+    print(
+        f"n={fit.n}: ln R_T = ({fit.slope:.2f}±{fit.slope_err:.2f}) / T "
+        f"{fit.intercept:+.2f}±{fit.intercept_err:.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Live ln R_T - 1/T fit for thermal resistor sweeps."
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--file", type=Path, help="log file to follow")
+    source.add_argument("--port", type=int, help="local instrument port")
+    parser.add_argument("--host", default="127.0.0.1")
+    args = parser.parse_args()
+
+    if args.file is not None:
+        lines = follow_file(args.file)
+    else:
+        lines = socket_lines(args.host, args.port)
+    try:
+        live_ln_R_T_fit(lines, on_update=_print_fit)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,43 @@
 # src/physicslab/thermal_resistor/processing.py
 
-import pandas as pd
+from __future__ import annotations
+
 import numpy as np
-from scipy.optimize import curve_fit
 from pathlib import Path
-import os
-
-from physicslab.plot_utils import create_figure, save_figure
-
-
-def analyze_thermal_data(raw_df: pd.DataFrame) -> pd.DataFrame:
+from typing import TYPE_CHECKING, List, Mapping, Optional
+
+from physicslab.fitting import linear_fit
+from physicslab.plot_utils import (
+    FigureCache,
+    FigureTemplate,
+    OutputLike,
+    PlotSeries,
+    PlotSpec,
+    ProfileLike,
+    fit_line,
+    montage_from_frames,
+    render_plot,
+)
+from physicslab.tracing import instrument
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@instrument("analyze")
+def analyze_thermal_data(raw_df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
     """
     Analyze thermal resistor data to compute resistance and temperature coefficients.
 
     Parameters:
     raw_df (pd.DataFrame): DataFrame containing raw data with columns 'Time', 'Voltage', 'Current', 'Temperature'.
+    copy (bool): Work on a copy of raw_df. Pass False to add the columns in place,
+                 e.g. for chunks that nothing else holds on to.
 
     Returns:
     pd.DataFrame: DataFrame with computed resistance and temperature coefficients.
     """
-    df = raw_df.copy()
+    df = raw_df.copy() if copy else raw_df
 
     if "t/℃" in df.columns:
         df["T/K"] = df["t/℃"] + 273.15
@@ -36,75 +54,126 @@ def analyze_thermal_data(raw_df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def plot_ln_R_T_vs_1_T(processed_df: pd.DataFrame, output_dir: str | Path):
+LN_R_T_VS_1_T = PlotSpec(
+    title="$\\ln R_T$ - $1/T$ 直线图",
+    xlabel=r"$1/T\ (\mathrm{K}^{-1})$",
+    ylabel=r"$\ln R_T$",
+    filename="ln_R_T_vs_1_T.png",
+)
+
+N_VS_T = PlotSpec(
+    title="$N$ - $T$ 直线图",
+    xlabel=r"$T\ (\mathrm{K})$",
+    ylabel=r"$N$",
+    filename="N_vs_T.png",
+)
+
+
+def ln_R_T_vs_1_T_series(processed_df: pd.DataFrame) -> List[PlotSeries]:
     """
-    Plot ln(R_T) vs 1/T and save the figure.
+    Compute the data points and fitted line of the ln(R_T) vs 1/T plot.
     """
-    output_dir = Path(output_dir)
-    os.makedirs(output_dir, exist_ok=True)
-
     df1 = processed_df.dropna(subset=["1/T (10^-2 K^-1)", "ln R_T"])
-    x1 = df1["1/T (10^-2 K^-1)"] * 1e-2  # Convert to K^-1
-    y1 = df1["ln R_T"]
-
-    fig, ax1 = create_figure(
-        title="$\\ln R_T$ - $1/T$ 直线图",
-        xlabel=r"$1/T\\ (\\mathrm{K}^{-1})$",
-        ylabel=r"$\\ln R_T$",
+    x1 = df1["1/T (10^-2 K^-1)"].to_numpy() * 1e-2  # Convert to K^-1
+    y1 = df1["ln R_T"].to_numpy()
+
+    fit = linear_fit(x1, y1)
+    k, b = fit.slope, fit.intercept
+    k_err, b_err = fit.slope_err, fit.intercept_err
+
+    x_fit, y_fit = fit_line(x1, fit)
+    return [
+        PlotSeries(
+            x1,
+            y1,
+            color="b",
+            label="实验数据",
+            fit_x=x_fit,
+            fit_y=y_fit,
+            fit_label=rf"$\ln R_T = ({k:.2f}\pm{k_err:.2f})x {b:+.2f}\pm{b_err:.2f}$",
+        )
+    ]
+
+
+def plot_ln_R_T_vs_1_T(
+    processed_df: pd.DataFrame,
+    output_dir: OutputLike,
+    profile: ProfileLike = None,
+    template: Optional[FigureTemplate] = None,
+    format: Optional[str] = None,
+    cache: Optional[FigureCache] = None,
+):
+    """
+    Plot ln(R_T) vs 1/T and save the figure.
+    """
+    series = ln_R_T_vs_1_T_series(processed_df)
+    return render_plot(
+        LN_R_T_VS_1_T, series, output_dir, profile, template, format, cache
     )
-    ax1.scatter(x1, y1, color="b", label="实验数据")
-
-    def linear_func(x, k, b):
-        return k * x + b
 
-    popt, pcov = curve_fit(linear_func, x1, y1)
-    k, b = popt
-    k_err, b_err = np.sqrt(np.diag(pcov))
 
-    x_fit = np.linspace(x1.min(), x1.max(), 100)
-    ax1.plot(
-        x_fit,
-        linear_func(x_fit, k, b),
-        "r-",
-        label=rf"$\\ln R_T = ({k:.2f}\\pm{k_err:.2f})x {b:+.2f}\\pm{b_err:.2f}$",
+def plot_ln_R_T_vs_1_T_montage(
+    processed_dfs: Mapping[str, pd.DataFrame],
+    output_dir: str | Path | None,
+    **montage_kwargs,
+) -> List[Path | bytes]:
+    """
+    Plot ln(R_T) vs 1/T for many submissions as paged montages.
+    """
+    return montage_from_frames(
+        LN_R_T_VS_1_T, ln_R_T_vs_1_T_series, processed_dfs, output_dir, **montage_kwargs
     )
-    ax1.legend()
 
-    save_figure(fig, output_dir / "ln_R_T_vs_1_T.png")
 
-
-def plot_N_vs_T(processed_df: pd.DataFrame, output_dir: str | Path):
+def N_vs_T_series(processed_df: pd.DataFrame) -> List[PlotSeries]:
     """
-    Plot N vs T and save the figure.
+    Compute the data points and fitted line of the N vs T plot.
     """
-    output_dir = Path(output_dir)
-    os.makedirs(output_dir, exist_ok=True)
-
     df2 = processed_df.dropna(subset=["N", "T/K"])
-    x2 = df2["T/K"]
-    y2 = df2["N"]
-
-    fig, ax2 = create_figure(
-        title="$N$ - $T$ 直线图",
-        xlabel=r"$T\\ (\\mathrm{K})$",
-        ylabel=r"$N$",
-    )
-    ax2.scatter(x2, y2, color="g", label="实验数据")
-
-    def linear_func(x, k, b):
-        return k * x + b
+    x2 = df2["T/K"].to_numpy()
+    y2 = df2["N"].to_numpy()
+
+    fit = linear_fit(x2, y2)
+    k, b = fit.slope, fit.intercept
+    k_err, b_err = fit.slope_err, fit.intercept_err
+
+    x_fit, y_fit = fit_line(x2, fit)
+    return [
+        PlotSeries(
+            x2,
+            y2,
+            color="g",
+            label="实验数据",
+            fit_x=x_fit,
+            fit_y=y_fit,
+            fit_label=rf"$N = ({k:.2f}\pm{k_err:.2f})x {b:+.2f}\pm{b_err:.2f}$",
+        )
+    ]
+
+
+def plot_N_vs_T(
+    processed_df: pd.DataFrame,
+    output_dir: OutputLike,
+    profile: ProfileLike = None,
+    template: Optional[FigureTemplate] = None,
+    format: Optional[str] = None,
+    cache: Optional[FigureCache] = None,
+):
+    """
+    Plot N vs T and save the figure.
+    """
+    series = N_vs_T_series(processed_df)
+    return render_plot(N_VS_T, series, output_dir, profile, template, format, cache)
 
-    popt, pcov = curve_fit(linear_func, x2, y2)
-    k, b = popt
-    k_err, b_err = np.sqrt(np.diag(pcov))
 
-    x_fit = np.linspace(x2.min(), x2.max(), 100)
-    ax2.plot(
-        x_fit,
-        linear_func(x_fit, k, b),
-        "r-",
-        label=rf"$N = ({k:.2f}\\pm{k_err:.2f})x {b:+.2f}\\pm{b_err:.2f}$",
+def plot_N_vs_T_montage(
+    processed_dfs: Mapping[str, pd.DataFrame],
+    output_dir: str | Path | None,
+    **montage_kwargs,
+) -> List[Path | bytes]:
+    """
+    Plot N vs T for many submissions as paged montages.
+    """
+    return montage_from_frames(
+        N_VS_T, N_vs_T_series, processed_dfs, output_dir, **montage_kwargs
     )
-    ax2.legend()
-
-    save_figure(fig, output_dir / "N_vs_T.png")
@@ -0,0 +1,367 @@
+# src/physicslab/tracing.py
+
+import functools
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, Union
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Stage categories used by the library
+CATEGORIES = ("load", "analyze", "fit", "plot", "save")
+
+
+@dataclass
+class Span:
+    """
+    One timed call.
+
+    Attributes:
+    - name (str): The function or stage, e.g. "load_csv" or "_write_figure".
+    - category (str): "load", "analyze", "fit", "plot" or "save".
+    - start_us (float): Start time in microseconds since the epoch, so spans
+      recorded in several processes line up.
+    - wall_ms (float): Wall time.
+    - self_ms (float): Wall time not spent in nested spans of the same thread.
+    - cpu_ms (float): CPU time of the calling thread.
+    - rss_peak_kb (Optional[float]): Growth of the process's peak resident set
+      size during the call; None where the platform does not report it.
+    - py_peak_kb (Optional[float]): Peak Python heap allocated during the call
+      above its starting size, from tracemalloc; None unless memory tracing is on.
+    - rows (Optional[int]): Rows of the data returned, or else passed in.
+    - pid (int): Process id.
+    - tid (int): Thread id.
+    - error (Optional[str]): Name of the exception the call raised.
+    """
+
+    name: str
+    category: str
+    start_us: float = 0.0
+    wall_ms: float = 0.0
+    self_ms: float = 0.0
+    cpu_ms: float = 0.0
+    rss_peak_kb: Optional[float] = None
+    py_peak_kb: Optional[float] = None
+    rows: Optional[int] = None
+    pid: int = 0
+    tid: int = 0
+    error: Optional[str] = None
+
+
+@dataclass
+class _Frame:
+    span: Span
+    child_ms: float = 0.0
+    child_py_peak: int = 0
+
+
+def _peak_rss_kb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / 1024 if sys.platform == "darwin" else float(peak)
+
+
+def _row_count(value: Any) -> Optional[int]:
+    shape = getattr(value, "shape", None)
+    if shape:
+        return int(shape[0])
+    return None
+
+
+@dataclass
+class Tracer:
+    """
+    Collects spans from instrumented calls while enabled.
+
+    Disabled by default: an instrumented call then costs one attribute check.
+    Spans are collected from all threads of the process. tracemalloc peaks
+    are process-wide, so with memory tracing on, calls running concurrently
+    on other threads are charged to each other.
+    """
+
+    enabled: bool = False
+    memory: bool = False
+    spans: List[Span] = field(default_factory=list)
+    _local: threading.local = field(default_factory=threading.local, repr=False)
+    _started_tracemalloc: bool = field(default=False, repr=False)
+
+    def start(self, memory: bool = False) -> None:
+        """
+        Start collecting spans.
+
+        Parameters:
+        - memory (bool): Also trace Python allocations with tracemalloc, which
+          slows allocation-heavy code down several times.
+        """
+        self.memory = memory
+        # Leave a tracemalloc session started by the caller (e.g. with
+        # -X tracemalloc) running when this tracer stops
+        self._started_tracemalloc = memory and not tracemalloc.is_tracing()
+        if self._started_tracemalloc:
+            tracemalloc.start()
+        self.enabled = True
+
+    def stop(self) -> None:
+        """Stop collecting spans; the collected ones are kept."""
+        self.enabled = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self.memory = False
+
+    def clear(self) -> None:
+        """Forget the collected spans."""
+        self.spans = []
+
+    def extend(self, spans: List[Span]) -> None:
+        """Add spans recorded elsewhere, e.g. in a worker process."""
+        self.spans.extend(spans)
+
+    @contextmanager
+    def span(self, name: str, category: str) -> Iterator[Span]:
+        """
+        Time the body of a with-block; the yielded span's rows may be set.
+
+        Parameters:
+        - name (str): Span name.
+        - category (str): Span category.
+        """
+        record = Span(name, category, pid=os.getpid(), tid=threading.get_ident())
+        if not self.enabled:
+            yield record
+            return
+
+        stack = self._local.__dict__.setdefault("stack", [])
+        frame = _Frame(record)
+        stack.append(frame)
+        rss_before = _peak_rss_kb()
+        if self.memory:
+            py_before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        record.start_us = time.time() * 1e6
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield record
+        except BaseException as e:
+            record.error = type(e).__name__
+            raise
+        finally:
+            record.cpu_ms = (time.thread_time() - cpu_start) * 1000
+            record.wall_ms = (time.perf_counter() - wall_start) * 1000
+            record.self_ms = record.wall_ms - frame.child_ms
+            rss_after = _peak_rss_kb()
+            if rss_before is not None and rss_after is not None:
+                record.rss_peak_kb = rss_after - rss_before
+            py_peak = 0
+            if self.memory and tracemalloc.is_tracing():
+                # Nested spans reset the peak, so fold theirs back in
+                py_peak = max(tracemalloc.get_traced_memory()[1], frame.child_py_peak)
+                record.py_peak_kb = max(py_peak - py_before, 0) / 1024
+            stack.pop()
+            if stack:
+                stack[-1].child_ms += record.wall_ms
+                stack[-1].child_py_peak = max(stack[-1].child_py_peak, py_peak)
+            self.spans.append(record)
+
+    def write_chrome_trace(self, filepath: Union[str, Path]) -> Path:
+        """
+        Write the spans as Chrome trace-event JSON.
+
+        Open the file in chrome://tracing or https://ui.perfetto.dev; every
+        span is a complete ("X") event with its measurements as arguments.
+
+        Parameters:
+        - filepath (str | Path): The JSON file to write.
+
+        Returns:
+        - Path: The written file.
+        """
+        import json
+
+        events: List[Dict[str, Any]] = []
+        for span in self.spans:
+            args = {
+                "cpu_ms": round(span.cpu_ms, 3),
+                "self_ms": round(span.self_ms, 3),
+                "rows": span.rows,
+                "rss_peak_kb": span.rss_peak_kb,
+                "py_peak_kb": span.py_peak_kb,
+            }
+            if span.error:
+                args["error"] = span.error
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": span.start_us,
+                    "dur": span.wall_ms * 1000,
+                    "pid": span.pid,
+                    "tid": span.tid,
+                    "args": args,
+                }
+            )
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        filepath.write_text(
+            json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}),
+            encoding="utf-8",
+        )
+        return filepath
+
+    def write_csv(self, filepath: Union[str, Path]) -> Path:
+        """
+        Write one row per span to a CSV file, in start order.
+
+        Parameters:
+        - filepath (str | Path): The CSV file to write.
+
+        Returns:
+        - Path: The written file.
+        """
+        import csv
+
+        columns = [
+            "name",
+            "category",
+            "pid",
+            "tid",
+            "start_ms",
+            "wall_ms",
+            "self_ms",
+            "cpu_ms",
+            "rss_peak_kb",
+            "py_peak_kb",
+            "rows",
+            "error",
+        ]
+        spans = sorted(self.spans, key=lambda span: span.start_us)
+        origin = spans[0].start_us if spans else 0.0
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            for span in spans:
+                writer.writerow(
+                    [
+                        span.name,
+                        span.category,
+                        span.pid,
+                        span.tid,
+                        f"{(span.start_us - origin) / 1000:.3f}",
+                        f"{span.wall_ms:.3f}",
+                        f"{span.self_ms:.3f}",
+                        f"{span.cpu_ms:.3f}",
+                        "" if span.rss_peak_kb is None else f"{span.rss_peak_kb:.0f}",
+                        "" if span.py_peak_kb is None else f"{span.py_peak_kb:.1f}",
+                        "" if span.rows is None else span.rows,
+                        span.error or "",
+                    ]
+                )
+        return filepath
+
+    def print_summary(self) -> None:
+        """Print the time spent per category, counting nested spans once."""
+        calls: Dict[str, int] = {}
+        totals: Dict[str, float] = {}
+        for span in self.spans:
+            calls[span.category] = calls.get(span.category, 0) + 1
+            totals[span.category] = totals.get(span.category, 0.0) + span.self_ms
+        print("\n--- ⏱️ Time by stage (excluding nested stages) ---")
+        for category in sorted(totals, key=lambda c: -totals[c]):
+            print(
+                f"{category:<10} {calls[category]:6d} calls {totals[category]:10.1f} ms"
+            )
+
+
+TRACER = Tracer()
+
+
+def span(name: str, category: str) -> Any:
+    """
+    Time a block of code with the global tracer.
+
+    Parameters:
+    - name (str): Span name.
+    - category (str): "load", "analyze", "fit", "plot" or "save".
+
+    Returns:
+    - ContextManager[Span]: Yields the span, whose rows may be set.
+    """
+    return TRACER.span(name, category)
+
+
+def instrument(category: str, name: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Decorate a function so that its calls are recorded as spans.
+
+    The row count is taken from the returned DataFrame or array, or else from
+    the first argument that has a shape.
+
+    Parameters:
+    - category (str): "load", "analyze", "fit", "plot" or "save".
+    - name (Optional[str]): Span name; defaults to the function name.
+
+    Returns:
+    - Callable: The decorator.
+    """
+
+    def decorator(function: F) -> F:
+        span_name = name or function.__name__
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not TRACER.enabled:
+                return function(*args, **kwargs)
+            with TRACER.span(span_name, category) as record:
+                result = function(*args, **kwargs)
+                record.rows = _row_count(result)
+                for arg in args:
+                    if record.rows is not None:
+                        break
+                    record.rows = _row_count(arg)
+                return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+@contextmanager
+def tracing(
+    filepath: Union[str, Path, None] = None, memory: bool = False
+) -> Iterator[Tracer]:
+    """
+    Collect spans for the duration of a with-block, then report them.
+
+    Parameters:
+    - filepath (str | Path | None): Chrome trace JSON to write at the end; a
+      CSV summary is written next to it with a ``.csv`` suffix.
+    - memory (bool): Also trace Python allocations with tracemalloc.
+
+    Returns:
+    - Iterator[Tracer]: Yields the global tracer.
+    """
+    TRACER.clear()
+    TRACER.start(memory)
+    try:
+        yield TRACER
+    finally:
+        TRACER.stop()
+        TRACER.print_summary()
+        if filepath is not None:
+            trace = TRACER.write_chrome_trace(filepath)
+            summary = TRACER.write_csv(Path(filepath).with_suffix(".csv"))
+            print(f"⏱️ Trace written to {trace} and {summary}")
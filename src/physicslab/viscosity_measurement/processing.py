@@ -0,0 +1,465 @@
+# src/physicslab/viscosity_measurement/processing.py
+
+from __future__ import annotations
+
+import numpy as np
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Mapping, Optional
+from physicslab.fitting import grouped_linear_fit, linear_fit
+from physicslab.plot_utils import (
+    FigureCache,
+    FigureTemplate,
+    OutputLike,
+    PlotSeries,
+    PlotSpec,
+    ProfileLike,
+    montage_from_frames,
+    render_plot,
+)
+from physicslab.tracing import instrument
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Steel ball and castor oil densities (kg/m³), gravity in Guangzhou (m/s²)
+BALL_DENSITY = 7.80e3
+LIQUID_DENSITY = 0.95e3
+GRAVITY = 9.788
+
+# Ladenburg's wall correction: in a tube of diameter D the ball falls as if
+# the viscosity were (1 + WALL_CORRECTION * d / D) times larger
+WALL_CORRECTION = 2.4
+
+# Ladenburg's end correction for a liquid column of height h above the
+# bottom: the viscosity appears (1 + END_CORRECTION * r / h) times larger
+END_CORRECTION = 3.3
+
+_SUBSCRIPT_DIGITS = str.maketrans("₀₁₂₃₄₅₆₇₈₉", "0123456789")
+_TRAILING_NUMBER = re.compile(r"\d+$")
+
+
+@dataclass
+class _Blocks:
+    # The reading rows of a sheet and the statistics of their readings
+    label_col: str
+    trials: List[str]
+    positions: np.ndarray
+    labels: np.ndarray
+    sources: Optional[np.ndarray]
+    index: np.ndarray
+    n: np.ndarray
+    mean: np.ndarray
+    std: np.ndarray
+    u_a: np.ndarray
+    mean_abs_dev: np.ndarray
+    deviations: np.ndarray
+
+
+def _blocks(raw_df: pd.DataFrame, source_col: Optional[str]) -> _Blocks:
+    # Rows labelled "Δ..." are left for the deviations and rows without any
+    # reading are skipped; missing readings are excluded from their own row
+    label_col = next(col for col in raw_df.columns if col != source_col)
+    trials = [col for col in raw_df.columns if str(col).strip().isdigit()]
+    all_labels = raw_df[label_col].to_numpy(dtype=str)
+    all_values = raw_df[trials].to_numpy(dtype=float)
+    is_reading = ~np.char.startswith(np.char.strip(all_labels), "Δ")
+    is_reading &= np.isfinite(all_values).any(axis=1)
+    positions = np.flatnonzero(is_reading)
+    labels = np.char.strip(all_labels[positions])
+    values = all_values[positions]
+
+    n = np.isfinite(values).sum(axis=1)
+    mean = np.nansum(values, axis=1) / n
+    deviations = values - mean[:, np.newaxis]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        std = np.sqrt(np.nansum(deviations**2, axis=1) / (n - 1))
+    std = np.where(n > 1, std, np.nan)
+
+    # The tube of a reading is the subscript of its label, e.g. 2 for "D₂"
+    index = np.ones(len(labels), dtype=int)
+    for i, label in enumerate(labels.tolist()):
+        match = _TRAILING_NUMBER.search(label.translate(_SUBSCRIPT_DIGITS))
+        if match:
+            index[i] = int(match.group())
+
+    sources = None
+    if source_col in raw_df.columns:
+        sources = raw_df[source_col].to_numpy()[positions]
+    return _Blocks(
+        label_col,
+        trials,
+        positions,
+        labels,
+        sources,
+        index,
+        n,
+        mean,
+        std,
+        std / np.sqrt(n),
+        np.nansum(np.abs(deviations), axis=1) / n,
+        deviations,
+    )
+
+
+@instrument("analyze")
+def summarize_measurements(
+    raw_df: pd.DataFrame, source_col: str = "source"
+) -> pd.DataFrame:
+    """
+    Compute the mean and deviations of every repeated measurement in a sheet.
+
+    A sheet has one label per row and the repeated readings in the columns
+    "1", "2", ..., e.g. ``t₁,6.41,6.34,6.44,6.36,6.42,`` in
+    steel_ball_fall_time.csv; the "Δ" rows and the "平均值" column are where the
+    lab report expects the results. All rows, of one sheet or of many stacked
+    by load_many, are computed in one vectorized pass.
+
+    Parameters:
+    raw_df (pd.DataFrame): A sheet as read by load_csv, or many sheets stacked
+                           by load_many.
+    source_col (str): Column naming the submission of each row, if present.
+
+    Returns:
+    pd.DataFrame: One row per measured quantity with the source (if present),
+                  'label', 'index' (the subscript of the label, e.g. 2 for
+                  "D₂", else 1), 'n', 'mean', 'std', 'u_a' (standard
+                  uncertainty of the mean, std / √n), 'mean_abs_dev' and the
+                  deviations from the mean 'dev_1', 'dev_2', ...
+    """
+    import pandas as pd
+
+    blocks = _blocks(raw_df, source_col)
+    columns = {}
+    if blocks.sources is not None:
+        columns[source_col] = blocks.sources
+    columns["label"] = blocks.labels
+    for name in ("index", "n", "mean", "std", "u_a", "mean_abs_dev"):
+        columns[name] = getattr(blocks, name)
+    for j, trial in enumerate(blocks.trials):
+        columns[f"dev_{str(trial).strip()}"] = blocks.deviations[:, j]
+    return pd.DataFrame(columns)
+
+
+def fill_measurement_table(
+    raw_df: pd.DataFrame, decimals: int = 5, source_col: str = "source"
+) -> pd.DataFrame:
+    """
+    Fill in the "平均值" column and the "Δ" rows of a sheet, as in the lab report.
+
+    Every reading row gets its mean; the "Δ" row below it gets the deviation of
+    each reading from that mean (its absolute value if the label is written
+    with |...|) and, as its average, the mean absolute deviation.
+
+    Parameters:
+    raw_df (pd.DataFrame): A sheet as read by load_csv.
+    decimals (int): Decimal places of the filled-in values.
+    source_col (str): Column naming the submission of each row, if present.
+
+    Returns:
+    pd.DataFrame: A copy of the sheet with the results filled in.
+    """
+    blocks = _blocks(raw_df, source_col)
+    table = raw_df.copy()
+    named = (blocks.label_col, source_col)
+    extra = [c for c in table.columns if c not in blocks.trials and c not in named]
+    mean_col = extra[0] if extra else "平均值"
+    table[mean_col] = table.get(mean_col, np.nan)
+    table[mean_col] = table[mean_col].astype(object)
+    mean_index = table.columns.get_loc(mean_col)
+    trial_index = [table.columns.get_loc(trial) for trial in blocks.trials]
+
+    table.iloc[blocks.positions, mean_index] = np.round(blocks.mean, decimals)
+
+    # A reading row's deviations go into the "Δ" row right below it
+    labels = np.char.strip(table[blocks.label_col].to_numpy(dtype=str))
+    below = blocks.positions + 1
+    has_delta = below < len(table)
+    has_delta[has_delta] = np.char.startswith(labels[below[has_delta]], "Δ")
+    delta_rows = below[has_delta]
+    # A label written as |...|, e.g. "Δd = |(dᵢ - d₀) - d̅| / mm", asks for
+    # the absolute deviations
+    deviations = blocks.deviations[has_delta]
+    absolute = np.char.find(labels[delta_rows], "|") >= 0
+    deviations = np.where(absolute[:, None], np.abs(deviations), deviations)
+    table.iloc[delta_rows, trial_index] = np.round(deviations, decimals)
+    table.iloc[delta_rows, mean_index] = np.round(
+        blocks.mean_abs_dev[has_delta], decimals
+    )
+    return table
+
+
+def _lookup(keys: List[np.ndarray], table_keys: List[np.ndarray]) -> np.ndarray:
+    # Position of each key in the table (its first occurrence), -1 if absent
+    import pandas as pd
+
+    if len(keys) == 1:
+        table, target = pd.Index(table_keys[0]), pd.Index(keys[0])
+    else:
+        table = pd.MultiIndex.from_arrays(table_keys)
+        target = pd.MultiIndex.from_arrays(keys)
+    first = ~table.duplicated()
+    found = table[first].get_indexer(target)
+    return np.where(found >= 0, np.flatnonzero(first)[found], -1)
+
+
+@instrument("analyze")
+def analyze_viscosity_data(
+    tube_df: pd.DataFrame,
+    ball_df: pd.DataFrame,
+    fall_time_df: pd.DataFrame,
+    distance_df: pd.DataFrame,
+    ball_density: float = BALL_DENSITY,
+    liquid_density: float = LIQUID_DENSITY,
+    gravity: float = GRAVITY,
+    source_col: str = "source",
+) -> pd.DataFrame:
+    """
+    Compute the viscosity of the liquid from the falling-ball readings in every tube.
+
+    The ball diameter d, fall time t, tube diameter D and timer distance s are
+    the means of their repeated readings (see summarize_measurements). In a
+    tube of diameter D, Stokes' law with Ladenburg's wall correction gives
+
+        η = (ρ - ρ₀) g d² t / (18 s (1 + 2.4 d / D)).
+
+    The sheets may each hold many submissions stacked by load_many; all
+    submissions and tubes are computed at once. Rows are matched across the
+    sheets by their source_col value, so the four files of one submission
+    must share it: load them with a source_id naming the submission
+    directory, e.g. ``lambda p: p.parents[3].name`` for
+    <submission>/data/raw/viscosity_measurement/*.csv, not the default file
+    path. Tubes missing a fall time, ball or timer distance are dropped.
+
+    Parameters:
+    tube_df (pd.DataFrame): test_tube_diameters.csv, rows D₁, ΔD₁, D₂, ...
+    ball_df (pd.DataFrame): steel_ball_diameters.csv.
+    fall_time_df (pd.DataFrame): steel_ball_fall_time.csv, rows t₁, Δt₁, t₂, ...
+    distance_df (pd.DataFrame): timer_distance.csv.
+    ball_density (float): Density of the ball ρ in kg/m³.
+    liquid_density (float): Density of the liquid ρ₀ in kg/m³.
+    gravity (float): Gravitational acceleration g in m/s².
+    source_col (str): Column naming the submission of each row, if present.
+
+    Returns:
+    pd.DataFrame: One row per submission and tube with 'tube', 'D/mm', 'u(D)/mm',
+                  't/s', 'u(t)/s', 'd/mm', 'u(d)/mm', 's/mm', 'u(s)/mm',
+                  '1/D (mm^-1)', 'd/D' and 'η/(Pa·s)', where u() is the
+                  standard uncertainty of the mean.
+
+    Raises:
+    ValueError: If the sheets are stacked but share no submission.
+    """
+    import pandas as pd
+
+    sheets = (tube_df, ball_df, fall_time_df, distance_df)
+    stacked = all(source_col in df.columns for df in sheets)
+    tube, ball, fall, distance = (
+        _blocks(df, source_col if stacked else None) for df in sheets
+    )
+
+    if stacked and len(tube.mean):
+        shared = set(tube.sources).intersection(
+            ball.sources, fall.sources, distance.sources
+        )
+        if not shared:
+            raise ValueError(
+                f"The sheets share no '{source_col}' values, so no tube can be "
+                "matched with its ball, fall times and timer distance; load them "
+                "with a source_id naming the submission, e.g. "
+                "load_many(..., source_id=lambda p: p.parents[3].name)"
+            )
+
+    def submission(blocks: _Blocks) -> np.ndarray:
+        # Unless the sheets are stacked, all rows belong to one submission
+        return blocks.sources if stacked else np.zeros(len(blocks.mean), dtype=int)
+
+    # Match the fall time of every tube, and the ball and timer distance of
+    # its submission; tubes missing any of them are dropped
+    fall_at = _lookup([submission(tube), tube.index], [submission(fall), fall.index])
+    ball_at = _lookup([submission(tube)], [submission(ball)])
+    distance_at = _lookup([submission(tube)], [submission(distance)])
+    found = (fall_at >= 0) & (ball_at >= 0) & (distance_at >= 0)
+    rows, fall_at = np.flatnonzero(found), fall_at[found]
+    ball_at, distance_at = ball_at[found], distance_at[found]
+
+    D, d = tube.mean[rows], ball.mean[ball_at]
+    t, s = fall.mean[fall_at], distance.mean[distance_at]
+    columns = {}
+    if stacked:
+        columns[source_col] = tube.sources[rows]
+    columns.update(
+        {
+            "tube": tube.index[rows],
+            "D/mm": D,
+            "u(D)/mm": tube.u_a[rows],
+            "t/s": t,
+            "u(t)/s": fall.u_a[fall_at],
+            "d/mm": d,
+            "u(d)/mm": ball.u_a[ball_at],
+            "s/mm": s,
+            "u(s)/mm": distance.u_a[distance_at],
+            "1/D (mm^-1)": 1 / D,
+            "d/D": d / D,
+        }
+    )
+    stokes = (
+        (ball_density - liquid_density)
+        * gravity
+        * (d * 1e-3) ** 2
+        * t
+        / (18 * s * 1e-3)
+    )
+    columns["η/(Pa·s)"] = stokes / (1 + WALL_CORRECTION * d / D)
+    return pd.DataFrame(columns)
+
+
+@instrument("analyze")
+def solve_viscosity(
+    processed_df: pd.DataFrame,
+    ball_density: float = BALL_DENSITY,
+    liquid_density: float = LIQUID_DENSITY,
+    gravity: float = GRAVITY,
+    liquid_height: Optional[float] = None,
+    u_liquid_height: float = 0.0,
+    source_col: str = "source",
+) -> pd.DataFrame:
+    """
+    Extrapolate the fall time to an infinitely wide tube and compute the viscosity.
+
+    With the wall correction the fall time is linear in 1/D,
+    t = t₀ + t₀ K d / D, so the intercept of the t - 1/D line is the fall time
+    t₀ free of wall effects and the slope gives the wall coefficient K
+    (2.4 in Ladenburg's formula). Then
+
+        η = (ρ - ρ₀) g d² t₀ / (18 s (1 + 3.3 d / (2 h)))
+
+    where the last factor is the end correction for a liquid column of
+    height h, applied only if it is given. The uncertainty of η is
+    propagated from those of t₀ (from the fit), d, s and h.
+
+    The lines of all submissions in the output of analyze_viscosity_data
+    are fitted at once by grouped_linear_fit.
+
+    Parameters:
+    processed_df (pd.DataFrame): Output of analyze_viscosity_data, for one
+                                 submission or many stacked in source_col.
+    ball_density (float): Density of the ball ρ in kg/m³.
+    liquid_density (float): Density of the liquid ρ₀ in kg/m³.
+    gravity (float): Gravitational acceleration g in m/s².
+    liquid_height (Optional[float]): Height h of the liquid column in mm.
+    u_liquid_height (float): Standard uncertainty of h in mm.
+    source_col (str): Column naming the submission of each row, if present.
+
+    Returns:
+    pd.DataFrame: One row per submission with the source (if present), 'n'
+                  (number of tubes), 't0/s', 'u(t0)/s', 'K', 'r_squared',
+                  'd/mm', 'u(d)/mm', 's/mm', 'u(s)/mm', 'η/(Pa·s)' and
+                  'u(η)/(Pa·s)'. Submissions with fewer than two tubes get NaN.
+    """
+    stacked = source_col in processed_df.columns
+    df = processed_df if stacked else processed_df.assign(**{source_col: 0})
+
+    fits = grouped_linear_fit(df, x="1/D (mm^-1)", y="t/s", by=source_col)
+    # Ball and timer distance are the same for all tubes of a submission
+    per_submission = (
+        df.groupby(source_col, sort=True)[["d/mm", "u(d)/mm", "s/mm", "u(s)/mm"]]
+        .first()
+        .reindex(fits[source_col])
+    )
+    t0 = fits["intercept"].to_numpy()
+    u_t0 = fits["intercept_err"].to_numpy()
+    d, u_d = (per_submission[c].to_numpy() for c in ("d/mm", "u(d)/mm"))
+    s, u_s = (per_submission[c].to_numpy() for c in ("s/mm", "u(s)/mm"))
+
+    stokes = (ball_density - liquid_density) * gravity * (d * 1e-3) ** 2 / 18
+    eta = stokes * t0 / (s * 1e-3)
+    # Relative sensitivities of η to d and h; without an end correction
+    # η ∝ d², so d enters twice
+    dlog_d = 2 / d
+    dlog_h = np.zeros_like(d)
+    if liquid_height is not None:
+        end = END_CORRECTION * d / (2 * liquid_height)
+        eta = eta / (1 + end)
+        dlog_d = dlog_d - end / d / (1 + end)
+        dlog_h = dlog_h + end / liquid_height / (1 + end)
+    u_eta = eta * np.sqrt(
+        (u_t0 / t0) ** 2
+        + (dlog_d * u_d) ** 2
+        + (u_s / s) ** 2
+        + (dlog_h * u_liquid_height) ** 2
+    )
+
+    result = fits[[source_col, "n"]].copy() if stacked else fits[["n"]].copy()
+    result["t0/s"] = t0
+    result["u(t0)/s"] = u_t0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result["K"] = fits["slope"].to_numpy() / (t0 * d)
+    result["r_squared"] = fits["r_squared"].to_numpy()
+    result["d/mm"] = d
+    result["u(d)/mm"] = u_d
+    result["s/mm"] = s
+    result["u(s)/mm"] = u_s
+    result["η/(Pa·s)"] = eta
+    result["u(η)/(Pa·s)"] = u_eta
+    return result
+
+
+T_VS_INV_D = PlotSpec(
+    title="$t$ - $1/D$ 直线图",
+    xlabel=r"$1/D\ (\mathrm{mm}^{-1})$",
+    ylabel=r"$t\ (\mathrm{s})$",
+    filename="t_vs_inv_D.png",
+)
+
+
+def t_vs_inv_D_series(processed_df: pd.DataFrame) -> List[PlotSeries]:
+    """
+    Compute the data points and fitted line of the t vs 1/D plot.
+
+    The line is drawn from 1/D = 0, where its intercept is the fall time t₀ in
+    an infinitely wide tube.
+    """
+    df1 = processed_df.dropna(subset=["1/D (mm^-1)", "t/s"])
+    x1 = df1["1/D (mm^-1)"].to_numpy()
+    y1 = df1["t/s"].to_numpy()
+
+    series = PlotSeries(x1, y1, color="blue", label="实验数据")
+    if len(x1) >= 2:
+        fit = linear_fit(x1, y1)
+        k, b = fit.slope, fit.intercept
+        series.fit_x = np.linspace(0, np.max(x1) * 1.1, 100)
+        series.fit_y = fit(series.fit_x)
+        series.fit_color = "red"
+        series.fit_label = rf"拟合: $t={k:.4f}\,(1/D)+{b:.4f}$, $t_0={b:.4f}$ s"
+    return [series]
+
+
+def plot_t_vs_inv_D(
+    processed_df: pd.DataFrame,
+    output_dir: OutputLike,
+    profile: ProfileLike = None,
+    template: Optional[FigureTemplate] = None,
+    format: Optional[str] = None,
+    cache: Optional[FigureCache] = None,
+):
+    """
+    Plot fall time vs inverse tube diameter and save the figure.
+    """
+    series = t_vs_inv_D_series(processed_df)
+    return render_plot(T_VS_INV_D, series, output_dir, profile, template, format, cache)
+
+
+def plot_t_vs_inv_D_montage(
+    processed_dfs: Mapping[str, pd.DataFrame],
+    output_dir: str | Path | None,
+    **montage_kwargs,
+) -> List[Path | bytes]:
+    """
+    Plot fall time vs inverse tube diameter for many submissions as paged montages.
+    """
+    return montage_from_frames(
+        T_VS_INV_D, t_vs_inv_D_series, processed_dfs, output_dir, **montage_kwargs
+    )